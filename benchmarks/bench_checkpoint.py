@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from typing import Callable
+
+from interactive_haptics.checkpoint import resume_simulation, simulate_resumable
+from interactive_haptics.control import simulate_admittance, simulate_pid
+
+# A short extension of a checkpointed run must not cost more than simulating
+# the whole longer run again; resuming sizes its solver block to the new
+# samples, so it should be well under.
+FUNCTIONS: dict[str, Callable[..., object]] = {
+    "simulate_pid": simulate_pid,
+    "simulate_admittance": simulate_admittance,
+}
+
+
+def _best_s(function: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def measure(
+    duration: float = 5.0,
+    extension: float = 0.1,
+    dt: float = 1e-3,
+    number: int = 5,
+    repeat: int = 5,
+) -> dict[str, dict[str, float]]:
+    rows = {}
+    for name, function in FUNCTIONS.items():
+        short, checkpoint = simulate_resumable(name, duration=duration, dt=dt)
+        longer = duration + extension
+        rows[name] = {
+            "resume_s": _best_s(
+                lambda: resume_simulation(short, checkpoint, longer), number, repeat
+            ),
+            "rerun_s": _best_s(lambda: function(duration=longer, dt=dt), number, repeat),
+        }
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Cost of extending a checkpointed run against a full rerun."
+    )
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--extension", type=float, default=0.1)
+    parser.add_argument("--dt", type=float, default=1e-3)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failed = False
+    rows = measure(args.duration, args.extension, args.dt, args.number, args.repeat)
+    for name, row in rows.items():
+        ok = row["resume_s"] < row["rerun_s"]
+        failed |= not ok
+        print(
+            f"{name:<20} resume {row['resume_s'] * 1e3:>8.2f} ms  "
+            f"rerun {row['rerun_s'] * 1e3:>8.2f} ms  {'ok' if ok else 'SLOWER THAN RERUN'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from interactive_haptics.control import (
+    simulate_admittance,
+    simulate_pid,
+    simulate_pid_batch,
+    simulate_virtual_wall,
+    virtual_wall_force,
+)
+
+FULL_MATRIX = {
+    "duration": (1.0, 10.0),
+    "dt": (1e-3, 1e-4),
+    "batch": (1, 100, 10_000),
+}
+QUICK_MATRIX = {
+    "duration": (1.0,),
+    "dt": (1e-3,),
+    "batch": (1, 100),
+}
+
+
+@dataclass
+class BenchCase:
+    name: str
+    backend: str
+    duration: float
+    dt: float
+    batch: int
+
+    @property
+    def steps(self) -> int:
+        return int(self.duration / self.dt) + 1
+
+    @property
+    def key(self) -> str:
+        return (
+            f"{self.name}[backend={self.backend},duration={self.duration:g},"
+            f"dt={self.dt:g},batch={self.batch}]"
+        )
+
+    def build(self) -> Callable[[], object]:
+        common = {"duration": self.duration, "dt": self.dt}
+        if self.name == "simulate_pid":
+            return lambda: simulate_pid(backend=self.backend, **common)
+        if self.name == "simulate_pid_batch":
+            kp = np.linspace(5.0, 50.0, self.batch)
+            return lambda: simulate_pid_batch(kp=kp, backend=self.backend, **common)
+        if self.name == "simulate_admittance":
+            return lambda: simulate_admittance(backend=self.backend, **common)
+        if self.name == "simulate_virtual_wall":
+            return lambda: simulate_virtual_wall(backend=self.backend, **common)
+        if self.name == "virtual_wall_force":
+            position = np.linspace(0.0, 1.0, self.steps)
+            velocity = np.cos(np.linspace(0.0, 20.0, self.steps))
+            stiffness = np.linspace(50.0, 2000.0, self.batch)[:, None]
+            return lambda: virtual_wall_force(position, velocity, stiffness=stiffness)
+        raise ValueError(f"unknown benchmark {self.name!r}")
+
+
+def build_cases(
+    matrix: dict[str, tuple], backends: list[str], max_samples: int
+) -> list[BenchCase]:
+    cases = []
+    for duration, dt, batch in itertools.product(
+        matrix["duration"], matrix["dt"], matrix["batch"]
+    ):
+        names = ["simulate_pid_batch"]
+        if batch == 1:
+            names = ["simulate_pid", "simulate_admittance", "simulate_virtual_wall"] + names
+        candidates = [
+            BenchCase(name, backend, duration, dt, batch)
+            for name, backend in itertools.product(names, backends)
+        ]
+        # virtual_wall_force is backend independent, so it is timed once.
+        candidates.append(BenchCase("virtual_wall_force", "n/a", duration, dt, batch))
+        # Keep the output arrays of a single case within a few hundred MB.
+        cases.extend(case for case in candidates if case.steps * case.batch <= max_samples)
+    return cases
+
+
+def run_case(case: BenchCase, repeat: int) -> dict[str, float]:
+    function = case.build()
+    function()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    wall_time = min(timings)
+    return {
+        "wall_time_s": wall_time,
+        "per_step_ns": wall_time / (case.steps * case.batch) * 1e9,
+        "peak_memory_bytes": float(peak),
+        "steps": float(case.steps),
+        "batch": float(case.batch),
+    }
+
+
+def run_suite(cases: list[BenchCase], repeat: int = 3, verbose: bool = True) -> dict:
+    results = {}
+    for case in cases:
+        results[case.key] = {"case": asdict(case), **run_case(case, repeat)}
+        if verbose:
+            row = results[case.key]
+            print(
+                f"{case.key:<78} {row['wall_time_s'] * 1e3:>10.2f} ms "
+                f"{row['per_step_ns']:>9.1f} ns/step "
+                f"{row['peak_memory_bytes'] / 2**20:>8.1f} MiB"
+            )
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 1.25) -> list[str]:
+    regressions = []
+    for key, row in current["results"].items():
+        reference = baseline.get("results", {}).get(key)
+        if reference is None:
+            continue
+        for metric in ("wall_time_s", "peak_memory_bytes"):
+            if reference[metric] > 0 and row[metric] > reference[metric] * threshold:
+                regressions.append(
+                    f"{key}: {metric} {row[metric]:.4g} vs baseline {reference[metric]:.4g} "
+                    f"(x{row[metric] / reference[metric]:.2f})"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the control simulations.")
+    parser.add_argument("--quick", action="store_true", help="small matrix for smoke runs")
+    parser.add_argument("--backend", nargs="+", default=["auto"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-samples", type=int, default=20_000_000)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare against a saved JSON run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="ratio to the baseline above which a case counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    matrix = QUICK_MATRIX if args.quick else FULL_MATRIX
+    report = run_suite(build_cases(matrix, args.backend, args.max_samples), args.repeat)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"wrote {args.output}")
+
+    if args.baseline is None:
+        return 0
+    regressions = compare(report, json.loads(args.baseline.read_text()), args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"no regressions against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from typing import Callable
+
+from interactive_haptics.control import AdmittanceController, PIDController, virtual_wall_force
+from interactive_haptics.servo import FastAdmittanceController, FastPIDController, VirtualWall
+
+# Per-call budgets for the servo-rate hot paths. At 10 kHz the whole tick has
+# 100 us, and each of these runs several times per tick.
+BUDGETS_NS = {
+    "fast_pid_update": 1000.0,
+    "fast_admittance_step": 1000.0,
+    "virtual_wall_force": 1000.0,
+}
+
+
+def _per_call_ns(function: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e9
+
+
+def measure(number: int = 100_000, repeat: int = 5) -> dict[str, dict[str, float]]:
+    pid = PIDController(kp=12.0, ki=1.2, kd=0.4, integral_limit=10.0, output_limit=120.0)
+    fast_pid = FastPIDController(kp=12.0, ki=1.2, kd=0.4, integral_limit=10.0, output_limit=120.0)
+    admittance = AdmittanceController(stiffness=45.0, damping=14.0)
+    fast_admittance = FastAdmittanceController(stiffness=45.0, damping=14.0)
+    wall = VirtualWall(wall_position=0.7, stiffness=250.0, damping=3.0, friction=0.2)
+
+    pairs = {
+        "fast_pid_update": (
+            lambda: pid.update(0.15, 0.1, 1e-3),
+            lambda: fast_pid.update(0.15, 0.1, 1e-3),
+        ),
+        "fast_admittance_step": (
+            lambda: admittance.step(1.0, 1e-3),
+            lambda: fast_admittance.step(1.0, 1e-3),
+        ),
+        "virtual_wall_force": (
+            lambda: virtual_wall_force(0.8, 0.1, 0.7, 250.0, 3.0, 0.2, 35.0),
+            lambda: wall.force(0.8, 0.1),
+        ),
+    }
+    return {
+        name: {
+            "reference_ns": _per_call_ns(reference, number, repeat),
+            "fast_ns": _per_call_ns(fast, number, repeat),
+            "budget_ns": BUDGETS_NS[name],
+        }
+        for name, (reference, fast) in pairs.items()
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-call cost of the servo hot paths.")
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, e.g. 2.0 on slow CI machines",
+    )
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, row in measure(args.number, args.repeat).items():
+        budget = row["budget_ns"] * args.budget_scale
+        ok = row["fast_ns"] <= budget
+        failed |= not ok
+        print(
+            f"{name:<22} reference {row['reference_ns']:>9.0f} ns  "
+            f"fast {row['fast_ns']:>7.0f} ns  budget {budget:>7.0f} ns  "
+            f"{'ok' if ok else 'OVER BUDGET'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
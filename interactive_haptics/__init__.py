@@ -1,19 +1,102 @@
 """Interactive haptics research toolkit."""
 
+__version__ = "0.2.0"
+
+from .backends import available_backends, get_backend, register_backend
+from .cache import ResultCache, cache_key
+from .checkpoint import Checkpoint, resume_simulation, simulate_resumable
 from .control import (
     AdmittanceController,
+    MassSpringDamperPlant,
     PIDController,
     simulate_admittance,
+    simulate_admittance_batch,
     simulate_pid,
+    simulate_pid_batch,
     simulate_virtual_wall,
+    simulate_virtual_wall_batch,
     virtual_wall_force,
 )
+from .coupling import CoupledWall, WallState
+from .downsample import TrajectoryIndex, lttb
+from .export import export_result, load_result
+from .history import RunRecord, RunStore
+from .integrators import recommend_dt
+from .lti import simulate_admittance_lti, simulate_pid_lti
+from .metrics import step_metrics
+from .ndof import (
+    AdmittanceControllerND,
+    MassSpringDamperPlantND,
+    PIDControllerND,
+    simulate_admittance_nd,
+    simulate_pid_nd,
+)
+from .passivity import PassivityController, PassivityObserver, passivity_control
+from .realtime import HapticLoop, LoopStats
+from .servo import FastAdmittanceController, FastPIDController, VirtualWall
+from .storage import Trajectory, open_trajectory
+from .streaming import (
+    concat_chunks,
+    iter_simulate_admittance,
+    iter_simulate_pid,
+    iter_simulate_virtual_wall,
+)
+from .sweep import SweepExecutor, SweepResult, parameter_grid
+from .tuning import TuneResult, autotune
 
 __all__ = [
     "AdmittanceController",
+    "AdmittanceControllerND",
+    "Checkpoint",
+    "CoupledWall",
+    "FastAdmittanceController",
+    "FastPIDController",
+    "HapticLoop",
+    "LoopStats",
+    "MassSpringDamperPlant",
+    "MassSpringDamperPlantND",
     "PIDController",
+    "PIDControllerND",
+    "PassivityController",
+    "PassivityObserver",
+    "ResultCache",
+    "RunRecord",
+    "RunStore",
+    "SweepExecutor",
+    "SweepResult",
+    "Trajectory",
+    "TrajectoryIndex",
+    "TuneResult",
+    "VirtualWall",
+    "WallState",
+    "autotune",
+    "available_backends",
+    "cache_key",
+    "concat_chunks",
+    "export_result",
+    "get_backend",
+    "iter_simulate_admittance",
+    "iter_simulate_pid",
+    "iter_simulate_virtual_wall",
+    "load_result",
+    "lttb",
+    "open_trajectory",
+    "parameter_grid",
+    "passivity_control",
+    "recommend_dt",
+    "register_backend",
+    "resume_simulation",
     "simulate_admittance",
+    "simulate_admittance_batch",
+    "simulate_admittance_lti",
+    "simulate_admittance_nd",
     "simulate_pid",
+    "simulate_pid_batch",
+    "simulate_pid_lti",
+    "simulate_pid_nd",
+    "simulate_resumable",
     "simulate_virtual_wall",
+    "simulate_virtual_wall_batch",
+    "step_metrics",
     "virtual_wall_force",
 ]
@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .control import (
+    AdmittanceController,
+    PIDController,
+    _wall_force_unchecked,
+    virtual_wall_force,
+)
+from .lti import admittance_trajectory, pid_trajectory
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+
+# Every backend implements the same three batch kernels. Parameters arrive as
+# 1-D float arrays of length N (limits use np.inf for "no limit"), trajectories
+# are returned as (N, T) arrays, and the wall kernel follows NumPy broadcasting.
+class SimulationBackend:
+    name = ""
+
+    def pid(
+        self,
+        kp: np.ndarray,
+        ki: np.ndarray,
+        kd: np.ndarray,
+        target: np.ndarray,
+        plant_mass: np.ndarray,
+        plant_damping: np.ndarray,
+        plant_stiffness: np.ndarray,
+        integral_limit: np.ndarray,
+        output_limit: np.ndarray,
+        n_steps: int,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+    def admittance(
+        self,
+        stiffness: np.ndarray,
+        damping: np.ndarray,
+        mass: np.ndarray,
+        force: np.ndarray,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+    def virtual_wall(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        wall_position: float | np.ndarray,
+        stiffness: float | np.ndarray,
+        damping: float | np.ndarray,
+        friction: float | np.ndarray,
+        max_force: float | np.ndarray,
+    ) -> np.ndarray:
+        raise NotImplementedError
+
+
+class PythonBackend(SimulationBackend):
+    # Reference implementation: one scalar controller step per sample.
+    name = "python"
+
+    def pid(
+        self,
+        kp: np.ndarray,
+        ki: np.ndarray,
+        kd: np.ndarray,
+        target: np.ndarray,
+        plant_mass: np.ndarray,
+        plant_damping: np.ndarray,
+        plant_stiffness: np.ndarray,
+        integral_limit: np.ndarray,
+        output_limit: np.ndarray,
+        n_steps: int,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        position = np.zeros((len(kp), n_steps))
+        velocity = np.zeros((len(kp), n_steps))
+        control_signal = np.zeros((len(kp), n_steps))
+
+        for row in range(len(kp)):
+            pid = PIDController(
+                kp=float(kp[row]),
+                ki=float(ki[row]),
+                kd=float(kd[row]),
+                integral_limit=_optional_limit(integral_limit[row]),
+                output_limit=_optional_limit(output_limit[row]),
+            )
+            setpoint = float(target[row])
+            mass = float(plant_mass[row])
+            damping = float(plant_damping[row])
+            stiffness = float(plant_stiffness[row])
+
+            x = 0.0
+            v = 0.0
+            for idx in range(n_steps):
+                u = pid.update(setpoint, x, dt)
+                a = (u - damping * v - stiffness * x) / mass
+                v += a * dt
+                x += v * dt
+
+                position[row, idx] = x
+                velocity[row, idx] = v
+                control_signal[row, idx] = u
+
+        return position, velocity, control_signal
+
+    def admittance(
+        self,
+        stiffness: np.ndarray,
+        damping: np.ndarray,
+        mass: np.ndarray,
+        force: np.ndarray,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        position = np.zeros(force.shape)
+        velocity = np.zeros(force.shape)
+
+        for row in range(len(stiffness)):
+            controller = AdmittanceController(
+                stiffness=float(stiffness[row]),
+                damping=float(damping[row]),
+                mass=float(mass[row]),
+            )
+            for idx in range(force.shape[1]):
+                pos, vel = controller.step(float(force[row, idx]), dt)
+                position[row, idx] = pos
+                velocity[row, idx] = vel
+
+        return position, velocity
+
+    def virtual_wall(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        wall_position: float | np.ndarray,
+        stiffness: float | np.ndarray,
+        damping: float | np.ndarray,
+        friction: float | np.ndarray,
+        max_force: float | np.ndarray,
+    ) -> np.ndarray:
+        arrays = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    position,
+                    velocity,
+                    wall_position,
+                    stiffness,
+                    damping,
+                    friction,
+                    max_force,
+                )
+            )
+        )
+        force = np.zeros(arrays[0].shape)
+        for idx in np.ndindex(force.shape):
+            values = [float(array[idx]) for array in arrays]
+            force[idx] = virtual_wall_force(
+                position=values[0],
+                velocity=values[1],
+                wall_position=values[2],
+                stiffness=values[3],
+                damping=values[4],
+                friction=values[5],
+                max_force=_optional_limit(values[6]),
+            )
+        return force
+
+
+class NumpyBackend(SimulationBackend):
+    # Single runs use the exact LTI solver; batches step in lockstep along
+    # the batch axis with the same operation order as the reference loop.
+    name = "numpy"
+
+    def pid(
+        self,
+        kp: np.ndarray,
+        ki: np.ndarray,
+        kd: np.ndarray,
+        target: np.ndarray,
+        plant_mass: np.ndarray,
+        plant_damping: np.ndarray,
+        plant_stiffness: np.ndarray,
+        integral_limit: np.ndarray,
+        output_limit: np.ndarray,
+        n_steps: int,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if len(kp) == 1:
+            trajectories = pid_trajectory(
+                kp=float(kp[0]),
+                ki=float(ki[0]),
+                kd=float(kd[0]),
+                target=float(target[0]),
+                plant_mass=float(plant_mass[0]),
+                plant_damping=float(plant_damping[0]),
+                plant_stiffness=float(plant_stiffness[0]),
+                integral_limit=float(integral_limit[0]),
+                output_limit=float(output_limit[0]),
+                n_steps=n_steps,
+                dt=dt,
+            )
+            return tuple(values[None, :] for values in trajectories)
+
+        n_systems = len(kp)
+        position = np.empty((n_systems, n_steps))
+        velocity = np.empty((n_systems, n_steps))
+        control_signal = np.empty((n_systems, n_steps))
+
+        x = np.zeros(n_systems)
+        v = np.zeros(n_systems)
+        integral = np.zeros(n_systems)
+        prev_error = np.zeros(n_systems)
+        error = np.empty(n_systems)
+        u = np.empty(n_systems)
+        scratch = np.empty(n_systems)
+
+        for idx in range(n_steps):
+            np.subtract(target, x, out=error)
+            np.multiply(error, dt, out=scratch)
+            integral += scratch
+            np.clip(integral, -integral_limit, integral_limit, out=integral)
+
+            np.subtract(error, prev_error, out=scratch)
+            scratch /= dt
+            np.multiply(kp, error, out=u)
+            u += ki * integral
+            scratch *= kd
+            u += scratch
+            np.clip(u, -output_limit, output_limit, out=u)
+            prev_error, error = error, prev_error
+
+            np.multiply(plant_damping, v, out=scratch)
+            np.subtract(u, scratch, out=scratch)
+            scratch -= plant_stiffness * x
+            scratch /= plant_mass
+            scratch *= dt
+            v += scratch
+            np.multiply(v, dt, out=scratch)
+            x += scratch
+
+            position[:, idx] = x
+            velocity[:, idx] = v
+            control_signal[:, idx] = u
+
+        return position, velocity, control_signal
+
+    def admittance(
+        self,
+        stiffness: np.ndarray,
+        damping: np.ndarray,
+        mass: np.ndarray,
+        force: np.ndarray,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if len(stiffness) == 1:
+            trajectories = admittance_trajectory(
+                float(stiffness[0]), float(damping[0]), float(mass[0]), force[0], dt
+            )
+            return tuple(values[None, :] for values in trajectories)
+
+        position = np.empty(force.shape)
+        velocity = np.empty(force.shape)
+        x = np.zeros(len(stiffness))
+        v = np.zeros(len(stiffness))
+        scratch = np.empty(len(stiffness))
+
+        for idx in range(force.shape[1]):
+            np.multiply(damping, v, out=scratch)
+            np.subtract(force[:, idx], scratch, out=scratch)
+            scratch -= stiffness * x
+            scratch /= mass
+            scratch *= dt
+            v += scratch
+            np.multiply(v, dt, out=scratch)
+            x += scratch
+
+            position[:, idx] = x
+            velocity[:, idx] = v
+
+        return position, velocity
+
+    def virtual_wall(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        wall_position: float | np.ndarray,
+        stiffness: float | np.ndarray,
+        damping: float | np.ndarray,
+        friction: float | np.ndarray,
+        max_force: float | np.ndarray,
+    ) -> np.ndarray:
+        return _wall_force_unchecked(
+            position, velocity, wall_position, stiffness, damping, friction, max_force
+        )
+
+
+# Loop kernels for the JIT backend. They are plain Python so they stay
+# readable (and testable) when numba is not installed.
+def _pid_loop(
+    kp, ki, kd, target, mass, damping, stiffness, i_limit, u_limit, dt, position, velocity, control
+):
+    for row in range(position.shape[0]):
+        x = 0.0
+        v = 0.0
+        integral = 0.0
+        prev_error = 0.0
+        for idx in range(position.shape[1]):
+            error = target[row] - x
+            integral += error * dt
+            integral = min(max(integral, -i_limit[row]), i_limit[row])
+            derivative = (error - prev_error) / dt
+            u = kp[row] * error + ki[row] * integral + kd[row] * derivative
+            u = min(max(u, -u_limit[row]), u_limit[row])
+            prev_error = error
+
+            a = (u - damping[row] * v - stiffness[row] * x) / mass[row]
+            v += a * dt
+            x += v * dt
+            position[row, idx] = x
+            velocity[row, idx] = v
+            control[row, idx] = u
+
+
+def _admittance_loop(stiffness, damping, mass, force, dt, position, velocity):
+    for row in range(force.shape[0]):
+        x = 0.0
+        v = 0.0
+        for idx in range(force.shape[1]):
+            a = (force[row, idx] - damping[row] * v - stiffness[row] * x) / mass[row]
+            v += a * dt
+            x += v * dt
+            position[row, idx] = x
+            velocity[row, idx] = v
+
+
+def _wall_loop(position, velocity, wall_position, stiffness, damping, friction, max_force, out):
+    for idx in range(out.shape[0]):
+        penetration = position[idx] - wall_position[idx]
+        if penetration <= 0:
+            out[idx] = 0.0
+            continue
+        friction_term = 0.0
+        if abs(velocity[idx]) >= 1e-9:
+            friction_term = friction[idx] if velocity[idx] > 0 else -friction[idx]
+        force = -(
+            stiffness[idx] * penetration
+            + damping[idx] * max(0.0, velocity[idx])
+            + friction_term
+        )
+        out[idx] = min(max(force, -max_force[idx]), max_force[idx])
+
+
+class NumbaBackend(SimulationBackend):
+    name = "numba"
+
+    def __init__(self) -> None:
+        jit = numba.njit(cache=True, nogil=True)
+        self._pid_loop = jit(_pid_loop)
+        self._admittance_loop = jit(_admittance_loop)
+        self._wall_loop = jit(_wall_loop)
+
+    def pid(
+        self,
+        kp: np.ndarray,
+        ki: np.ndarray,
+        kd: np.ndarray,
+        target: np.ndarray,
+        plant_mass: np.ndarray,
+        plant_damping: np.ndarray,
+        plant_stiffness: np.ndarray,
+        integral_limit: np.ndarray,
+        output_limit: np.ndarray,
+        n_steps: int,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        position = np.empty((len(kp), n_steps))
+        velocity = np.empty((len(kp), n_steps))
+        control_signal = np.empty((len(kp), n_steps))
+        self._pid_loop(
+            kp,
+            ki,
+            kd,
+            target,
+            plant_mass,
+            plant_damping,
+            plant_stiffness,
+            integral_limit,
+            output_limit,
+            float(dt),
+            position,
+            velocity,
+            control_signal,
+        )
+        return position, velocity, control_signal
+
+    def admittance(
+        self,
+        stiffness: np.ndarray,
+        damping: np.ndarray,
+        mass: np.ndarray,
+        force: np.ndarray,
+        dt: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        force = np.ascontiguousarray(force, dtype=float)
+        position = np.empty(force.shape)
+        velocity = np.empty(force.shape)
+        self._admittance_loop(stiffness, damping, mass, force, float(dt), position, velocity)
+        return position, velocity
+
+    def virtual_wall(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        wall_position: float | np.ndarray,
+        stiffness: float | np.ndarray,
+        damping: float | np.ndarray,
+        friction: float | np.ndarray,
+        max_force: float | np.ndarray,
+    ) -> np.ndarray:
+        arrays = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    position,
+                    velocity,
+                    wall_position,
+                    stiffness,
+                    damping,
+                    friction,
+                    max_force,
+                )
+            )
+        )
+        flat = [np.ascontiguousarray(array).reshape(-1) for array in arrays]
+        out = np.empty(flat[0].shape)
+        self._wall_loop(*flat, out)
+        return out.reshape(arrays[0].shape)
+
+
+def _optional_limit(value: float) -> float | None:
+    return None if np.isinf(value) else float(value)
+
+
+_BACKENDS: dict[str, SimulationBackend] = {}
+
+
+def register_backend(backend: SimulationBackend) -> None:
+    if not backend.name:
+        raise ValueError("backend must define a name")
+    _BACKENDS[backend.name] = backend
+
+
+def available_backends() -> list[str]:
+    return list(_BACKENDS)
+
+
+def get_backend(name: str = "auto") -> SimulationBackend:
+    if name == "auto":
+        name = "numba" if "numba" in _BACKENDS else "numpy"
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown backend {name!r}; available: {', '.join(available_backends())}"
+        ) from None
+
+
+register_backend(PythonBackend())
+register_backend(NumpyBackend())
+if numba is not None:
+    register_backend(NumbaBackend())
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from .control import _check_wall_parameters
+from .lti import AdmittanceSolver, PIDSolver
+from .streaming import (
+    _admittance_chunks,
+    _pid_chunks,
+    _TimeBase,
+    _virtual_wall_chunks,
+    concat_chunks,
+)
+
+# Resumable runs. A Checkpoint records which simulation produced a result, its
+# parameters (everything but the duration), how many samples exist and the
+# controller/plant state after the last one. resume_simulation() continues
+# from that state, so extending a 5 s run to 60 s only computes the new 55 s.
+# Checkpoints are plain JSON so they can be stored next to saved runs.
+
+_CHUNK_SIZE = 65536
+_PID_STATE = ("position", "velocity", "integral", "prev_error")
+_ADMITTANCE_STATE = ("position", "velocity")
+
+
+@dataclass
+class Checkpoint:
+    function: str
+    params: dict[str, float]
+    samples: int
+    state: dict[str, float] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, text: str) -> Checkpoint:
+        return cls(**json.loads(text))
+
+
+def _pid_solver(
+    params: dict[str, float], state: dict[str, float] | None, block_size: int
+) -> PIDSolver:
+    if params["plant_mass"] <= 0:
+        raise ValueError("plant_mass must be > 0")
+    return PIDSolver(
+        params["kp"],
+        params["ki"],
+        params["kd"],
+        params["target"],
+        params["plant_mass"],
+        params["plant_damping"],
+        params["plant_stiffness"],
+        integral_limit=10.0,
+        output_limit=120.0,
+        dt=params["dt"],
+        block_size=block_size,
+        state=None if state is None else [state[name] for name in _PID_STATE],
+    )
+
+
+def _admittance_solver(
+    params: dict[str, float], state: dict[str, float] | None, block_size: int
+) -> AdmittanceSolver:
+    state = state or {"position": 0.0, "velocity": 0.0}
+    return AdmittanceSolver(
+        params["stiffness"],
+        params["damping"],
+        params["mass"],
+        params["dt"],
+        block_size=block_size,
+        position=state["position"],
+        velocity=state["velocity"],
+    )
+
+
+def _check_virtual_wall(params: dict[str, float]) -> None:
+    if not 0.0 <= params["wall_position"] <= 1.0:
+        raise ValueError("wall_position must be in [0, 1]")
+    if params["motion_amplitude"] < 0:
+        raise ValueError("motion_amplitude must be >= 0")
+    _check_wall_parameters(
+        params["stiffness"], params["damping"], params["friction"], params["max_force"]
+    )
+
+
+def _run(
+    function: str,
+    params: dict[str, float],
+    state: dict[str, float] | None,
+    base: _TimeBase,
+    first: int,
+) -> tuple[Iterator[dict[str, np.ndarray]], dict[str, Any]]:
+    # Returns the chunk generator for samples [first, base.total) and the
+    # object whose state is read back once the generator is exhausted. The
+    # solver precomputes its block, so it is sized to the samples to run and
+    # a short extension costs O(new samples).
+    block_size = max(1, min(_CHUNK_SIZE, base.total - first))
+    if function == "simulate_pid":
+        solver = _pid_solver(params, state, block_size)
+        return _pid_chunks(base, solver, params["target"], first), solver
+    if function == "simulate_admittance":
+        solver = _admittance_solver(params, state, block_size)
+        chunks = _admittance_chunks(
+            base, solver, params["force_amplitude"], params["force_frequency_hz"], first
+        )
+        return chunks, solver
+    if function == "simulate_virtual_wall":
+        _check_virtual_wall(params)
+        chunks = _virtual_wall_chunks(
+            base,
+            params["wall_position"],
+            params["stiffness"],
+            params["damping"],
+            params["friction"],
+            params["max_force"],
+            params["motion_center"],
+            params["motion_amplitude"],
+            params["motion_frequency_hz"],
+            first,
+        )
+        return chunks, None
+    raise ValueError(f"cannot resume {function!r}")
+
+
+def _observed(
+    chunks: Iterator[dict[str, np.ndarray]],
+    on_chunk: Callable[[dict[str, np.ndarray]], None] | None,
+) -> Iterator[dict[str, np.ndarray]]:
+    for chunk in chunks:
+        if on_chunk is not None:
+            on_chunk(chunk)
+        yield chunk
+
+
+def _state_of(function: str, solver: Any) -> dict[str, float]:
+    if function == "simulate_pid":
+        return dict(zip(_PID_STATE, (float(value) for value in solver.state)))
+    if function == "simulate_admittance":
+        return dict(zip(_ADMITTANCE_STATE, (float(value) for value in solver.state)))
+    return {}
+
+
+_DEFAULTS = {
+    "simulate_pid": {
+        "kp": 12.0,
+        "ki": 1.2,
+        "kd": 0.4,
+        "target": 0.15,
+        "plant_mass": 1.0,
+        "plant_damping": 5.0,
+        "plant_stiffness": 20.0,
+    },
+    "simulate_admittance": {
+        "stiffness": 45.0,
+        "damping": 14.0,
+        "mass": 1.0,
+        "force_amplitude": 12.0,
+        "force_frequency_hz": 0.6,
+    },
+    "simulate_virtual_wall": {
+        "wall_position": 0.7,
+        "stiffness": 250.0,
+        "damping": 3.0,
+        "friction": 0.2,
+        "max_force": 35.0,
+        "motion_center": 0.55,
+        "motion_amplitude": 0.25,
+        "motion_frequency_hz": 0.7,
+    },
+}
+
+
+def simulate_resumable(
+    function: str,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    on_chunk: Callable[[dict[str, np.ndarray]], None] | None = None,
+    **params: float,
+) -> tuple[dict[str, np.ndarray], Checkpoint]:
+    # Same result as simulate_pid / simulate_admittance / simulate_virtual_wall
+    # (named by ``function``), plus the checkpoint to continue it later.
+    # ``on_chunk`` sees each chunk as it is computed; raising from it aborts.
+    if function not in _DEFAULTS:
+        raise ValueError(f"unknown simulation {function!r}; expected one of {sorted(_DEFAULTS)}")
+    unknown = set(params) - set(_DEFAULTS[function])
+    if unknown:
+        raise TypeError(f"{function} got unexpected parameters {sorted(unknown)}")
+    resolved = {**_DEFAULTS[function], **params, "dt": dt}
+    base = _TimeBase(duration, dt, _CHUNK_SIZE)
+    chunks, solver = _run(function, resolved, None, base, 0)
+    result = concat_chunks(_observed(chunks, on_chunk))
+    return result, Checkpoint(function, resolved, base.total, _state_of(function, solver))
+
+
+def resume_simulation(
+    result: dict[str, np.ndarray],
+    checkpoint: Checkpoint,
+    duration: float,
+    on_chunk: Callable[[dict[str, np.ndarray]], None] | None = None,
+) -> tuple[dict[str, np.ndarray], Checkpoint]:
+    # Extends ``result`` (the run ``checkpoint`` describes) to ``duration``.
+    # Only the new samples are simulated; the returned result holds old and
+    # new samples together on the time grid of the longer run.
+    if len(result["time"]) != checkpoint.samples:
+        raise ValueError("result does not match the checkpoint")
+    base = _TimeBase(duration, checkpoint.params["dt"], _CHUNK_SIZE)
+    if base.total < checkpoint.samples:
+        raise ValueError("duration is shorter than the checkpointed run")
+    if base.total == checkpoint.samples:
+        return result, checkpoint
+
+    first = checkpoint.samples
+    if checkpoint.function == "simulate_virtual_wall":
+        # The last stored velocity used a one-sided difference; with samples
+        # after it, the full-length run uses a central one, so redo it.
+        first -= 1
+    chunks, solver = _run(
+        checkpoint.function, checkpoint.params, checkpoint.state, base, first
+    )
+    new = concat_chunks(_observed(chunks, on_chunk))
+    extended = {}
+    for name, values in result.items():
+        kept = np.asarray(values)[:first]
+        extended[name] = np.concatenate([kept, new[name]])
+    extended["time"] = np.concatenate([base.times(0, first), new["time"]])
+    state = _state_of(checkpoint.function, solver)
+    return extended, Checkpoint(checkpoint.function, dict(checkpoint.params), base.total, state)
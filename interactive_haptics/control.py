@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import math
+import os
 from dataclasses import dataclass
+from typing import Iterator
 
 import numpy as np
 
+_SCALAR = (int, float)
+_OUT_CHUNK_SIZE = 65536
+
 
 def _build_time_vector(duration: float, dt: float) -> np.ndarray:
     if duration <= 0:
@@ -76,6 +82,29 @@ class AdmittanceController:
         return self.position, self.velocity
 
 
+@dataclass
+class MassSpringDamperPlant:
+    # The 1-DOF plant driven by the PID loop in simulate_pid.
+    mass: float = 1.0
+    damping: float = 5.0
+    stiffness: float = 20.0
+    position: float = 0.0
+    velocity: float = 0.0
+
+    def step(self, force: float, dt: float) -> tuple[float, float]:
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+        if self.mass <= 0:
+            raise ValueError("plant_mass must be > 0")
+
+        acceleration = (
+            force - self.damping * self.velocity - self.stiffness * self.position
+        ) / self.mass
+        self.velocity += acceleration * dt
+        self.position += self.velocity * dt
+        return self.position, self.velocity
+
+
 def simulate_pid(
     kp: float = 12.0,
     ki: float = 1.2,
@@ -86,36 +115,154 @@ def simulate_pid(
     plant_mass: float = 1.0,
     plant_damping: float = 5.0,
     plant_stiffness: float = 20.0,
+    backend: str = "auto",
+    out: str | os.PathLike[str] | None = None,
+    integrator: str = "symplectic_euler",
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
 ) -> dict[str, np.ndarray]:
-    if plant_mass <= 0:
-        raise ValueError("plant_mass must be > 0")
+    if out is not None and integrator == "symplectic_euler":
+        from .streaming import iter_simulate_pid
+
+        params = {
+            "kp": kp,
+            "ki": ki,
+            "kd": kd,
+            "target": target,
+            "duration": duration,
+            "dt": dt,
+            "plant_mass": plant_mass,
+            "plant_damping": plant_damping,
+            "plant_stiffness": plant_stiffness,
+        }
+        return _write_run(
+            out,
+            "simulate_pid",
+            iter_simulate_pid(chunk_size=_OUT_CHUNK_SIZE, **params),
+            ["time", "position", "velocity", "control", "target"],
+            params,
+        )
 
-    time = _build_time_vector(duration, dt)
-    pid = PIDController(kp=kp, ki=ki, kd=kd, output_limit=120.0, integral_limit=10.0)
+    result = simulate_pid_batch(
+        kp=kp,
+        ki=ki,
+        kd=kd,
+        target=target,
+        duration=duration,
+        dt=dt,
+        plant_mass=plant_mass,
+        plant_damping=plant_damping,
+        plant_stiffness=plant_stiffness,
+        backend=backend,
+        integrator=integrator,
+        rtol=rtol,
+        atol=atol,
+    )
+    result = {key: values if key == "time" else values[0] for key, values in result.items()}
+    if out is not None:
+        params = {
+            "kp": kp,
+            "ki": ki,
+            "kd": kd,
+            "target": target,
+            "duration": duration,
+            "dt": dt,
+            "plant_mass": plant_mass,
+            "plant_damping": plant_damping,
+            "plant_stiffness": plant_stiffness,
+            "integrator": integrator,
+        }
+        signals = ["time", "position", "velocity", "control", "target"]
+        return _write_run(out, "simulate_pid", [result], signals, params)
+    return result
+
+
+def _write_run(
+    out: str | os.PathLike[str],
+    function: str,
+    chunks: Iterator[dict[str, np.ndarray]],
+    signals: list[str],
+    params: dict[str, float],
+) -> dict[str, np.ndarray]:
+    # Streams the run chunk by chunk into an on-disk trajectory and returns
+    # its lazily memory-mapped columns.
+    from .storage import write_trajectory
+
+    return write_trajectory(
+        out,
+        chunks,
+        rows=int(params["duration"] / params["dt"]) + 1,
+        signals=signals,
+        function=function,
+        params=params,
+    )
 
-    position = np.zeros_like(time)
-    velocity = np.zeros_like(time)
-    control_signal = np.zeros_like(time)
 
-    x = 0.0
-    v = 0.0
-    for idx, _ in enumerate(time):
-        u = pid.update(target, x, dt)
-        a = (u - plant_damping * v - plant_stiffness * x) / plant_mass
-        v += a * dt
-        x += v * dt
+def _as_batch(**params: float | np.ndarray) -> dict[str, np.ndarray]:
+    arrays = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in params.values()))
+    if arrays[0].ndim > 1:
+        raise ValueError("batch parameters must be scalars or 1-D arrays")
+    size = max(1, arrays[0].size)
+    return {
+        name: np.broadcast_to(array, (size,)).copy() for name, array in zip(params, arrays)
+    }
 
-        position[idx] = x
-        velocity[idx] = v
-        control_signal[idx] = u
 
-    target_vector = np.full_like(time, target)
+def _limit(value: float | np.ndarray | None) -> float | np.ndarray:
+    return np.inf if value is None else np.abs(value)
+
+
+def simulate_pid_batch(
+    kp: float | np.ndarray = 12.0,
+    ki: float | np.ndarray = 1.2,
+    kd: float | np.ndarray = 0.4,
+    target: float | np.ndarray = 0.15,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    plant_mass: float | np.ndarray = 1.0,
+    plant_damping: float | np.ndarray = 5.0,
+    plant_stiffness: float | np.ndarray = 20.0,
+    integral_limit: float | np.ndarray | None = 10.0,
+    output_limit: float | np.ndarray | None = 120.0,
+    backend: str = "auto",
+    integrator: str = "symplectic_euler",
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> dict[str, np.ndarray]:
+    from .backends import get_backend
+    from .integrators import check_integrator, integrate_pid
+
+    check_integrator(integrator, backend)
+    params = _as_batch(
+        kp=kp,
+        ki=ki,
+        kd=kd,
+        target=target,
+        plant_mass=plant_mass,
+        plant_damping=plant_damping,
+        plant_stiffness=plant_stiffness,
+        integral_limit=_limit(integral_limit),
+        output_limit=_limit(output_limit),
+    )
+    if np.any(params["plant_mass"] <= 0):
+        raise ValueError("plant_mass must be > 0")
+
+    time = _build_time_vector(duration, dt)
+    kernels = get_backend(backend)
+    if integrator == "symplectic_euler":
+        position, velocity, control_signal = kernels.pid(
+            n_steps=len(time), dt=dt, **params
+        )
+    else:
+        position, velocity, control_signal = integrate_pid(
+            n_steps=len(time), dt=dt, integrator=integrator, rtol=rtol, atol=atol, **params
+        )
     return {
         "time": time,
         "position": position,
         "velocity": velocity,
         "control": control_signal,
-        "target": target_vector,
+        "target": np.repeat(params["target"][:, None], len(time), axis=1),
     }
 
 
@@ -127,61 +274,184 @@ def simulate_admittance(
     force_frequency_hz: float = 0.6,
     duration: float = 5.0,
     dt: float = 0.01,
+    backend: str = "auto",
+    out: str | os.PathLike[str] | None = None,
+    integrator: str = "symplectic_euler",
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
 ) -> dict[str, np.ndarray]:
-    time = _build_time_vector(duration, dt)
-    controller = AdmittanceController(stiffness=stiffness, damping=damping, mass=mass)
+    from .backends import get_backend
 
-    position = np.zeros_like(time)
-    velocity = np.zeros_like(time)
-    force = np.zeros_like(time)
+    if integrator != "symplectic_euler":
+        result = simulate_admittance_batch(
+            stiffness=stiffness,
+            damping=damping,
+            mass=mass,
+            force_amplitude=force_amplitude,
+            force_frequency_hz=force_frequency_hz,
+            duration=duration,
+            dt=dt,
+            backend=backend,
+            integrator=integrator,
+            rtol=rtol,
+            atol=atol,
+        )
+        result = {key: values if key == "time" else values[0] for key, values in result.items()}
+        if out is None:
+            return result
+        params = {
+            "stiffness": stiffness,
+            "damping": damping,
+            "mass": mass,
+            "force_amplitude": force_amplitude,
+            "force_frequency_hz": force_frequency_hz,
+            "duration": duration,
+            "dt": dt,
+            "integrator": integrator,
+        }
+        signals = ["time", "position", "velocity", "force"]
+        return _write_run(out, "simulate_admittance", [result], signals, params)
+
+    if out is not None:
+        from .streaming import iter_simulate_admittance
+
+        params = {
+            "stiffness": stiffness,
+            "damping": damping,
+            "mass": mass,
+            "force_amplitude": force_amplitude,
+            "force_frequency_hz": force_frequency_hz,
+            "duration": duration,
+            "dt": dt,
+        }
+        return _write_run(
+            out,
+            "simulate_admittance",
+            iter_simulate_admittance(chunk_size=_OUT_CHUNK_SIZE, **params),
+            ["time", "position", "velocity", "force"],
+            params,
+        )
 
-    for idx, t in enumerate(time):
-        f_ext = force_amplitude * np.sin(2.0 * np.pi * force_frequency_hz * t)
-        pos, vel = controller.step(f_ext, dt)
-        position[idx] = pos
-        velocity[idx] = vel
-        force[idx] = f_ext
+    if mass <= 0:
+        raise ValueError("mass must be > 0")
 
+    time = _build_time_vector(duration, dt)
+    force = force_amplitude * np.sin(2.0 * np.pi * force_frequency_hz * time)
+    position, velocity = get_backend(backend).admittance(
+        stiffness=np.array([stiffness], dtype=float),
+        damping=np.array([damping], dtype=float),
+        mass=np.array([mass], dtype=float),
+        force=force[None, :],
+        dt=dt,
+    )
     return {
         "time": time,
-        "position": position,
-        "velocity": velocity,
+        "position": position[0],
+        "velocity": velocity[0],
         "force": force,
     }
 
 
 def virtual_wall_force(
-    position: float,
-    velocity: float,
-    wall_position: float = 0.7,
-    stiffness: float = 250.0,
-    damping: float = 3.0,
-    friction: float = 0.2,
-    max_force: float | None = 35.0,
-) -> float:
-    if stiffness < 0:
+    position: float | np.ndarray,
+    velocity: float | np.ndarray,
+    wall_position: float | np.ndarray = 0.7,
+    stiffness: float | np.ndarray = 250.0,
+    damping: float | np.ndarray = 3.0,
+    friction: float | np.ndarray = 0.2,
+    max_force: float | np.ndarray | None = 35.0,
+) -> float | np.ndarray:
+    _check_wall_parameters(stiffness, damping, friction, max_force)
+    if (
+        isinstance(position, _SCALAR)
+        and isinstance(velocity, _SCALAR)
+        and isinstance(wall_position, _SCALAR)
+        and isinstance(stiffness, _SCALAR)
+        and isinstance(damping, _SCALAR)
+        and isinstance(friction, _SCALAR)
+        and (max_force is None or isinstance(max_force, _SCALAR))
+    ):
+        return _wall_force_scalar(
+            position, velocity, wall_position, stiffness, damping, friction, max_force
+        )
+
+    force = _wall_force_unchecked(
+        position, velocity, wall_position, stiffness, damping, friction, max_force
+    )
+    if force.ndim == 0:
+        return float(force)
+    return force
+
+
+def _is_below(value: float | np.ndarray, bound: float, inclusive: bool = False) -> bool:
+    if isinstance(value, _SCALAR):
+        return value <= bound if inclusive else value < bound
+    value = np.asarray(value)
+    return bool(np.any(value <= bound if inclusive else value < bound))
+
+
+def _check_wall_parameters(
+    stiffness: float | np.ndarray,
+    damping: float | np.ndarray,
+    friction: float | np.ndarray,
+    max_force: float | np.ndarray | None,
+) -> None:
+    if _is_below(stiffness, 0.0):
         raise ValueError("stiffness must be >= 0")
-    if damping < 0:
+    if _is_below(damping, 0.0):
         raise ValueError("damping must be >= 0")
-    if friction < 0:
+    if _is_below(friction, 0.0):
         raise ValueError("friction must be >= 0")
-    if max_force is not None and max_force <= 0:
+    if max_force is not None and _is_below(max_force, 0.0, inclusive=True):
         raise ValueError("max_force must be > 0 when provided")
 
+
+def _wall_force_scalar(
+    position: float,
+    velocity: float,
+    wall_position: float,
+    stiffness: float,
+    damping: float,
+    friction: float,
+    max_force: float | None,
+) -> float:
     penetration = position - wall_position
     if penetration <= 0:
         return 0.0
 
     spring_term = stiffness * penetration
     damping_term = damping * max(0.0, velocity)
-    friction_term = 0.0 if abs(velocity) < 1e-9 else friction * np.sign(velocity)
-    force = -(spring_term + damping_term + friction_term)
+    friction_term = 0.0 if abs(velocity) < 1e-9 else math.copysign(friction, velocity)
+    force = float(-(spring_term + damping_term + friction_term))
 
     if max_force is not None:
-        force = float(np.clip(force, -max_force, max_force))
+        force = min(max(force, -max_force), max_force)
     return force
 
 
+def _wall_force_unchecked(
+    position: float | np.ndarray,
+    velocity: float | np.ndarray,
+    wall_position: float | np.ndarray,
+    stiffness: float | np.ndarray,
+    damping: float | np.ndarray,
+    friction: float | np.ndarray,
+    max_force: float | np.ndarray | None,
+) -> np.ndarray:
+    position = np.asarray(position, dtype=float)
+    velocity = np.asarray(velocity, dtype=float)
+    penetration = position - wall_position
+
+    spring_term = stiffness * penetration
+    damping_term = damping * np.maximum(0.0, velocity)
+    friction_term = np.where(np.abs(velocity) < 1e-9, 0.0, friction * np.sign(velocity))
+    force = -(spring_term + damping_term + friction_term)
+
+    if max_force is not None:
+        force = np.clip(force, -max_force, max_force)
+    return np.where(penetration <= 0, 0.0, force)
+
+
 def simulate_virtual_wall(
     wall_position: float = 0.7,
     stiffness: float = 250.0,
@@ -193,11 +463,65 @@ def simulate_virtual_wall(
     motion_frequency_hz: float = 0.7,
     duration: float = 5.0,
     dt: float = 0.01,
+    backend: str = "auto",
+    out: str | os.PathLike[str] | None = None,
+    passivity: bool = False,
+    max_damping: float | None = None,
 ) -> dict[str, np.ndarray]:
+    from .backends import get_backend
+
+    if out is not None and passivity:
+        params = {
+            "wall_position": wall_position,
+            "stiffness": stiffness,
+            "damping": damping,
+            "friction": friction,
+            "max_force": max_force,
+            "motion_center": motion_center,
+            "motion_amplitude": motion_amplitude,
+            "motion_frequency_hz": motion_frequency_hz,
+            "duration": duration,
+            "dt": dt,
+        }
+        result = simulate_virtual_wall(
+            backend=backend, passivity=True, max_damping=max_damping, **params
+        )
+        return _write_run(
+            out,
+            "simulate_virtual_wall",
+            [result],
+            list(result),
+            {**params, "passivity": True, "max_damping": max_damping},
+        )
+
+    if out is not None:
+        from .streaming import iter_simulate_virtual_wall
+
+        params = {
+            "wall_position": wall_position,
+            "stiffness": stiffness,
+            "damping": damping,
+            "friction": friction,
+            "max_force": max_force,
+            "motion_center": motion_center,
+            "motion_amplitude": motion_amplitude,
+            "motion_frequency_hz": motion_frequency_hz,
+            "duration": duration,
+            "dt": dt,
+        }
+        return _write_run(
+            out,
+            "simulate_virtual_wall",
+            iter_simulate_virtual_wall(chunk_size=_OUT_CHUNK_SIZE, **params),
+            ["time", "position", "velocity", "force", "penetration", "wall"],
+            params,
+        )
+
     if not 0.0 <= wall_position <= 1.0:
         raise ValueError("wall_position must be in [0, 1]")
     if motion_amplitude < 0:
         raise ValueError("motion_amplitude must be >= 0")
+    _check_wall_parameters(stiffness, damping, friction, max_force)
 
     time = _build_time_vector(duration, dt)
     position = motion_center + motion_amplitude * np.sin(
@@ -206,20 +530,18 @@ def simulate_virtual_wall(
     position = np.clip(position, 0.0, 1.0)
     velocity = np.gradient(position, dt)
 
-    force = np.zeros_like(time)
     penetration = np.maximum(0.0, position - wall_position)
-    for idx in range(len(time)):
-        force[idx] = virtual_wall_force(
-            position=float(position[idx]),
-            velocity=float(velocity[idx]),
-            wall_position=wall_position,
-            stiffness=stiffness,
-            damping=damping,
-            friction=friction,
-            max_force=max_force,
-        )
+    force = get_backend(backend).virtual_wall(
+        position=position,
+        velocity=velocity,
+        wall_position=wall_position,
+        stiffness=stiffness,
+        damping=damping,
+        friction=friction,
+        max_force=_limit(max_force),
+    )
 
-    return {
+    result = {
         "time": time,
         "position": position,
         "velocity": velocity,
@@ -227,3 +549,138 @@ def simulate_virtual_wall(
         "penetration": penetration,
         "wall": np.full_like(time, wall_position),
     }
+    if passivity:
+        _apply_passivity(result, dt, max_damping, max_force)
+    return result
+
+
+def _apply_passivity(
+    result: dict[str, np.ndarray],
+    dt: float,
+    max_damping: float | np.ndarray | None,
+    max_force: float | np.ndarray | None,
+) -> None:
+    # The motion is prescribed, so the corrected force does not feed back into
+    # it; the wall force is replaced (still limited to max_force) and the
+    # observer traces are added.
+    from .passivity import passivity_control
+
+    corrected = passivity_control(
+        result["force"], result["velocity"], dt, max_damping, max_force
+    )
+    result["raw_force"] = result["force"]
+    result["force"] = corrected["force"]
+    result["passivity_energy"] = corrected["energy"]
+    result["passivity_damping"] = corrected["damping"]
+
+
+def simulate_admittance_batch(
+    stiffness: float | np.ndarray = 45.0,
+    damping: float | np.ndarray = 14.0,
+    mass: float | np.ndarray = 1.0,
+    force_amplitude: float | np.ndarray = 12.0,
+    force_frequency_hz: float | np.ndarray = 0.6,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    backend: str = "auto",
+    integrator: str = "symplectic_euler",
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> dict[str, np.ndarray]:
+    from .backends import get_backend
+    from .integrators import check_integrator, integrate_admittance
+
+    check_integrator(integrator, backend)
+    params = _as_batch(
+        stiffness=stiffness,
+        damping=damping,
+        mass=mass,
+        force_amplitude=force_amplitude,
+        force_frequency_hz=force_frequency_hz,
+    )
+    if np.any(params["mass"] <= 0):
+        raise ValueError("mass must be > 0")
+
+    time = _build_time_vector(duration, dt)
+    force = params["force_amplitude"][:, None] * np.sin(
+        2.0 * np.pi * params["force_frequency_hz"][:, None] * time
+    )
+    kernels = get_backend(backend)
+    if integrator == "symplectic_euler":
+        position, velocity = kernels.admittance(
+            stiffness=params["stiffness"],
+            damping=params["damping"],
+            mass=params["mass"],
+            force=force,
+            dt=dt,
+        )
+    else:
+        position, velocity = integrate_admittance(
+            time=time, dt=dt, integrator=integrator, rtol=rtol, atol=atol, **params
+        )
+    return {"time": time, "position": position, "velocity": velocity, "force": force}
+
+
+def simulate_virtual_wall_batch(
+    wall_position: float | np.ndarray = 0.7,
+    stiffness: float | np.ndarray = 250.0,
+    damping: float | np.ndarray = 3.0,
+    friction: float | np.ndarray = 0.2,
+    max_force: float | np.ndarray | None = 35.0,
+    motion_center: float | np.ndarray = 0.55,
+    motion_amplitude: float | np.ndarray = 0.25,
+    motion_frequency_hz: float | np.ndarray = 0.7,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    backend: str = "auto",
+    passivity: bool = False,
+    max_damping: float | np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    from .backends import get_backend
+
+    params = _as_batch(
+        wall_position=wall_position,
+        stiffness=stiffness,
+        damping=damping,
+        friction=friction,
+        max_force=_limit(max_force),
+        motion_center=motion_center,
+        motion_amplitude=motion_amplitude,
+        motion_frequency_hz=motion_frequency_hz,
+    )
+    wall = params["wall_position"]
+    if np.any((wall < 0.0) | (wall > 1.0)):
+        raise ValueError("wall_position must be in [0, 1]")
+    if np.any(params["motion_amplitude"] < 0):
+        raise ValueError("motion_amplitude must be >= 0")
+    _check_wall_parameters(
+        params["stiffness"], params["damping"], params["friction"], params["max_force"]
+    )
+
+    time = _build_time_vector(duration, dt)
+    column = {name: value[:, None] for name, value in params.items()}
+    position = column["motion_center"] + column["motion_amplitude"] * np.sin(
+        2.0 * np.pi * column["motion_frequency_hz"] * time
+    )
+    position = np.clip(position, 0.0, 1.0)
+    velocity = np.gradient(position, dt, axis=1)
+    force = get_backend(backend).virtual_wall(
+        position=position,
+        velocity=velocity,
+        wall_position=column["wall_position"],
+        stiffness=column["stiffness"],
+        damping=column["damping"],
+        friction=column["friction"],
+        max_force=column["max_force"],
+    )
+    result = {
+        "time": time,
+        "position": position,
+        "velocity": velocity,
+        "force": force,
+        "penetration": np.maximum(0.0, position - column["wall_position"]),
+        "wall": np.repeat(column["wall_position"], len(time), axis=1),
+    }
+    if passivity:
+        _apply_passivity(result, dt, max_damping, params["max_force"])
+    return result
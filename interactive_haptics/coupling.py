@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, NamedTuple
+
+from .jobs import BackgroundJob
+from .passivity import PassivityController
+from .realtime import HapticLoop, LoopStats
+from .servo import VirtualWall
+
+# Fixed-rate physics for interactive probing. The pointer does not touch the
+# wall directly. It drags a proxy mass through a virtual coupling, a spring
+# and damper between the pointer and the proxy, and the wall acts on the
+# proxy. CoupledWall.step() advances one servo tick with semi-implicit Euler.
+# run() is a BackgroundJob target that steps it at a fixed rate on a
+# HapticLoop, so the force is sampled evenly no matter how irregular the GUI
+# events are. When the loop has to skip slots it can no longer make, the next
+# tick integrates them first, so states stay stamped with their slot time and
+# the proxy keeps up with the wall clock.
+#
+# Nothing here takes a lock. The UI thread only rebinds attributes
+# (``pointer``, ``wall``, ``passivity``), and the physics thread publishes an
+# immutable WallState via ``snapshot``. Both are single reference assignments,
+# which are atomic in CPython. Every state is also emitted through the job,
+# so the UI can log the full 1 kHz trace.
+
+
+class WallState(NamedTuple):
+    time: float
+    pointer: float
+    position: float
+    velocity: float
+    force: float
+    penetration: float
+
+
+class CoupledWall:
+    __slots__ = (
+        "wall",
+        "pointer",
+        "passivity",
+        "proxy_mass",
+        "coupling_stiffness",
+        "coupling_damping",
+        "rate_hz",
+        "snapshot",
+        "stats",
+        "missed_ticks",
+        "_controller",
+    )
+
+    def __init__(
+        self,
+        wall: VirtualWall,
+        position: float = 0.0,
+        proxy_mass: float = 0.1,
+        coupling_stiffness: float = 400.0,
+        coupling_damping: float | None = None,
+        passivity: bool = False,
+        max_damping: float | None = None,
+        rate_hz: float = 1000.0,
+    ) -> None:
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be > 0")
+        if proxy_mass <= 0:
+            raise ValueError("proxy_mass must be > 0")
+        if coupling_stiffness <= 0:
+            raise ValueError("coupling_stiffness must be > 0")
+        if coupling_damping is None:
+            # Critically damped proxy when it is out of contact.
+            coupling_damping = 2.0 * math.sqrt(coupling_stiffness * proxy_mass)
+        if coupling_damping < 0:
+            raise ValueError("coupling_damping must be >= 0")
+        self.wall = wall
+        self.pointer = float(position)
+        self.passivity = passivity
+        self.proxy_mass = float(proxy_mass)
+        self.coupling_stiffness = float(coupling_stiffness)
+        self.coupling_damping = float(coupling_damping)
+        self.rate_hz = float(rate_hz)
+        self.snapshot = WallState(0.0, self.pointer, self.pointer, 0.0, 0.0, 0.0)
+        self.stats: LoopStats | None = None
+        self.missed_ticks = 0
+        if max_damping is None:
+            # The damper is integrated explicitly, so more than m / dt would
+            # overshoot (and at 2 m / dt diverge) instead of dissipating.
+            max_damping = self.proxy_mass * self.rate_hz
+        self._controller = PassivityController(max_damping)
+
+    def reset_passivity(self) -> None:
+        self._controller.reset()
+
+    def step(self, at: float | None = None) -> WallState:
+        # ``at`` stamps the new state; it defaults to one period after the last.
+        dt = 1.0 / self.rate_hz
+        state = self.snapshot
+        wall = self.wall
+        pointer = self.pointer
+        position = state.position
+        velocity = state.velocity
+
+        force = wall.force(position, velocity)
+        if self.passivity:
+            # The wall may have been rebound or retuned, so track its limit.
+            controller = self._controller
+            controller.max_force = wall.max_force
+            force = controller.update(force, velocity, dt)
+        # The coupling damper acts on the proxy velocity alone, since the
+        # pointer only moves in steps when Tk delivers an event.
+        coupling = (
+            self.coupling_stiffness * (pointer - position) - self.coupling_damping * velocity
+        )
+        velocity += (coupling + force) / self.proxy_mass * dt
+        position += velocity * dt
+        # The track ends are hard stops.
+        if position < 0.0:
+            position, velocity = 0.0, 0.0
+        elif position > 1.0:
+            position, velocity = 1.0, 0.0
+
+        state = WallState(
+            state.time + dt if at is None else at,
+            pointer,
+            position,
+            velocity,
+            force,
+            max(0.0, position - wall.wall_position),
+        )
+        self.snapshot = state
+        return state
+
+    def run(
+        self,
+        job: BackgroundJob,
+        segment_ticks: int = 1000,
+        realtime: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], object] = time.sleep,
+    ) -> None:
+        # Runs until the job is cancelled. HapticLoop needs a tick count, so
+        # the loop runs in segments; ``stats`` holds the latest segment and
+        # ``missed_ticks`` counts the slots skipped since the run started.
+        period = 1.0 / self.rate_hz
+        origin = self.snapshot.time
+        self.missed_ticks = 0
+        first_slot = 0
+        integrated = 0
+
+        def tick(t: float, _dt: float) -> None:
+            nonlocal integrated
+            slot = first_slot + int(round(t * self.rate_hz))
+            while integrated <= slot:
+                integrated += 1
+                job.emit(self.step(origin + integrated * period))
+
+        loop = HapticLoop(
+            tick, rate_hz=self.rate_hz, realtime=realtime, clock=clock, sleep=sleep
+        )
+        while True:
+            job.check()
+            stats = loop.run(ticks=segment_ticks)
+            self.missed_ticks += stats.missed_ticks
+            self.stats = stats
+            # Slots skipped at the end of a segment are caught up in the next.
+            first_slot += max(segment_ticks, int(stats.elapsed * self.rate_hz))
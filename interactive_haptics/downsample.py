@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import numpy as np
+
+# Display-side downsampling for long trajectories. TrajectoryIndex builds, per
+# signal, a pyramid of per-block min/max/mean (and where each min/max sits)
+# with blocks growing by ``factor`` per level. The cost is O(n) once. After
+# that, window() picks the coarsest level that still has at least one block
+# per output point in the requested time range. It reads each block's min and
+# max samples (so spikes survive) and thins them with lttb() to about
+# 2 * pixels points. A zoom window therefore costs O(pixels) no matter how
+# long the run is.
+
+
+def lttb(x: np.ndarray, y: np.ndarray, count: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets, vectorized. Returns the indices of the
+    # kept points, always including the first and last. Each bucket keeps the
+    # point spanning the largest triangle between the previous bucket's mean
+    # and the next bucket's mean; classic LTTB uses the previously kept point
+    # instead, which forces a sequential loop.
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    size = len(x)
+    if count >= size:
+        return np.arange(size)
+    if count < 3:
+        return np.array([0, size - 1])[: max(count, 0)]
+
+    edges = np.round(np.linspace(1, size - 1, count - 1)).astype(np.intp)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[: size - 1], starts) / sizes
+    mean_y = np.add.reduceat(y[: size - 1], starts) / sizes
+    prev_x = np.concatenate([x[:1], mean_x[:-1]])
+    prev_y = np.concatenate([y[:1], mean_y[:-1]])
+    next_x = np.concatenate([mean_x[1:], x[-1:]])
+    next_y = np.concatenate([mean_y[1:], y[-1:]])
+
+    bucket = np.repeat(np.arange(len(sizes)), sizes)
+    inner_x, inner_y = x[1 : size - 1], y[1 : size - 1]
+    area = np.abs(
+        (prev_x[bucket] - next_x[bucket]) * (inner_y - prev_y[bucket])
+        - (prev_x[bucket] - inner_x) * (next_y[bucket] - prev_y[bucket])
+    )
+    area = np.nan_to_num(area, nan=-1.0)
+    best = np.maximum.reduceat(area, starts - 1)
+    hits = np.flatnonzero(area == best[bucket])
+    first = hits[np.unique(bucket[hits], return_index=True)[1]]
+    return np.concatenate([[0], first + 1, [size - 1]])
+
+
+def _reduce_blocks(level: tuple[np.ndarray, ...], factor: int) -> tuple[np.ndarray, ...]:
+    # Merges ``factor`` consecutive blocks of a (min, max, sum, argmin,
+    # argmax) level; the last group may be short. NaNs never win a min/max.
+    low, high, total, at_low, at_high = level
+    blocks = -(-len(low) // factor)
+    pad = blocks * factor - len(low)
+    low_groups = np.pad(np.where(np.isnan(low), np.inf, low), (0, pad), constant_values=np.inf)
+    high_groups = np.pad(
+        np.where(np.isnan(high), -np.inf, high), (0, pad), constant_values=-np.inf
+    )
+    offsets = np.arange(blocks) * factor
+    pick_low = offsets + np.argmin(low_groups.reshape(blocks, factor), axis=1)
+    pick_high = offsets + np.argmax(high_groups.reshape(blocks, factor), axis=1)
+    return (
+        low[pick_low],
+        high[pick_high],
+        np.add.reduceat(total, offsets),
+        at_low[pick_low],
+        at_high[pick_high],
+    )
+
+
+class _Buffer:
+    # A 1-D array with amortized O(1) appends; ``view`` is the filled part and
+    # is only valid until the next put().
+    __slots__ = ("_data", "size")
+
+    def __init__(self, dtype: Any) -> None:
+        self._data = np.empty(0, dtype=dtype)
+        self.size = 0
+
+    @property
+    def view(self) -> np.ndarray:
+        return self._data[: self.size]
+
+    def put(self, start: int, values: np.ndarray) -> None:
+        # Writes ``values`` from ``start`` on and drops anything after them.
+        end = start + len(values)
+        if end > len(self._data):
+            grown = np.empty(max(end, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:start] = self._data[:start]
+            self._data = grown
+        self._data[start:end] = values
+        self.size = end
+
+
+class TrajectoryIndex:
+    def __init__(
+        self,
+        time: np.ndarray,
+        signals: Mapping[str, np.ndarray],
+        factor: int = 4,
+    ) -> None:
+        if factor < 2:
+            raise ValueError("factor must be >= 2")
+        self.factor = factor
+        self._time = _Buffer(float)
+        self._values = {name: _Buffer(float) for name in signals}
+        # _levels[name][k] holds the buffers for blocks of factor ** (k + 1)
+        # samples: min, max, sum, argmin, argmax (indices into the raw data).
+        self._levels: dict[str, list[tuple[_Buffer, ...]]] = {name: [] for name in signals}
+        self.append(time, signals)
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._time.view
+
+    @property
+    def signals(self) -> dict[str, np.ndarray]:
+        return {name: buffer.view for name, buffer in self._values.items()}
+
+    @property
+    def levels(self) -> dict[str, list[tuple[np.ndarray, ...]]]:
+        return {
+            name: [self._level(name, k) for k in range(len(levels))]
+            for name, levels in self._levels.items()
+        }
+
+    @property
+    def depth(self) -> int:
+        depth = 0
+        while self.factor**depth < len(self.time):
+            depth += 1
+        return depth
+
+    def _level(self, name: str, k: int) -> tuple[np.ndarray, ...]:
+        return tuple(buffer.view for buffer in self._levels[name][k])
+
+    def append(self, time: np.ndarray, signals: Mapping[str, np.ndarray]) -> None:
+        # Adds samples at the end. Only the last block of each level and the
+        # blocks after it are recomputed, so this costs O(new samples) plus
+        # O(factor) per level.
+        time = np.asarray(time, dtype=float)
+        if time.ndim != 1:
+            raise ValueError("time must be 1-D")
+        if set(signals) != set(self._values):
+            raise ValueError("signals must match the indexed signals")
+        arrays = {name: np.asarray(values, dtype=float) for name, values in signals.items()}
+        for name, values in arrays.items():
+            if values.shape != time.shape:
+                raise ValueError(f"signal {name!r} does not match the time axis")
+        old = len(self.time)
+        if not len(time):
+            return
+        self._time.put(old, time)
+        for name, values in arrays.items():
+            self._values[name].put(old, values)
+            self._extend(name, old)
+
+    def _extend(self, name: str, old: int) -> None:
+        values = self._values[name].view
+        levels = self._levels[name]
+        k, size = 0, 1
+        while (len(values) if k == 0 else levels[k - 1][0].size) > 1:
+            # Blocks from ``block`` on cover new samples; they are rebuilt
+            # from their first child in the level below.
+            block = old // (size * self.factor)
+            child = block * self.factor
+            if k == 0:
+                positions = np.arange(child, len(values))
+                source = (values[child:], values[child:], values[child:], positions, positions)
+            else:
+                source = tuple(array[child:] for array in self._level(name, k - 1))
+            reduced = _reduce_blocks(source, self.factor)
+            if k == len(levels):
+                levels.append(tuple(_Buffer(array.dtype) for array in reduced))
+            for buffer, array in zip(levels[k], reduced):
+                buffer.put(block, array)
+            k, size = k + 1, size * self.factor
+
+    def _range(self, start_time: float | None, stop_time: float | None) -> tuple[int, int]:
+        # Raw sample range, widened by one sample each way so lines reach the
+        # window edges.
+        first = 0 if start_time is None else np.searchsorted(self.time, start_time, "left")
+        last = (
+            len(self.time)
+            if stop_time is None
+            else np.searchsorted(self.time, stop_time, "right")
+        )
+        return max(int(first) - 1, 0), min(int(last) + 1, len(self.time))
+
+    def _level_for(self, first: int, last: int, blocks_wanted: int) -> int:
+        # Finest level with at most factor * blocks_wanted blocks in range;
+        # 0 means the raw samples.
+        level, size, depth = 0, 1, self.depth
+        while level < depth and (last - first) / size > self.factor * blocks_wanted:
+            level, size = level + 1, size * self.factor
+        return level
+
+    def window(
+        self,
+        name: str,
+        start_time: float | None = None,
+        stop_time: float | None = None,
+        pixels: int = 800,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # About 2 * pixels (time, value) points covering the window.
+        values = self._values[name].view
+        first, last = self._range(start_time, stop_time)
+        count = max(2 * int(pixels), 3)
+        level = self._level_for(first, last, count // 2)
+        if level == 0:
+            picks = np.arange(first, last)
+        else:
+            _low, _high, _total, at_low, at_high = self._level(name, level - 1)
+            size = self.factor**level
+            blocks = slice(first // size, -(-last // size))
+            at_low, at_high = at_low[blocks], at_high[blocks]
+            picks = np.stack(
+                [np.minimum(at_low, at_high), np.maximum(at_low, at_high)], axis=1
+            ).ravel()
+        if len(picks) > count:
+            picks = picks[lttb(self.time[picks], values[picks], count)]
+        return self.time[picks], values[picks]
+
+    def envelope(
+        self,
+        name: str,
+        start_time: float | None = None,
+        stop_time: float | None = None,
+        pixels: int = 800,
+    ) -> dict[str, np.ndarray]:
+        # Per-block min/max/mean at the level matching ``pixels``, e.g. for
+        # shading the spread of a signal behind its line.
+        values = self._values[name].view
+        first, last = self._range(start_time, stop_time)
+        level = self._level_for(first, last, max(int(pixels), 1))
+        if level == 0:
+            picks = slice(first, last)
+            return {
+                "time": self.time[picks],
+                "min": values[picks],
+                "max": values[picks],
+                "mean": values[picks],
+            }
+        low, high, total, _at_low, _at_high = self._level(name, level - 1)
+        size = self.factor**level
+        blocks = np.arange(first // size, -(-last // size))
+        counts = np.minimum((blocks + 1) * size, len(values)) - blocks * size
+        centers = np.minimum(blocks * size + counts // 2, len(values) - 1)
+        return {
+            "time": self.time[centers],
+            "min": low[blocks],
+            "max": high[blocks],
+            "mean": total[blocks] / counts,
+        }
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+import numpy as np
+
+from .storage import open_trajectory, write_csv_blocks, write_trajectory
+
+# Exports of results and session logs, with the format picked from the file
+# extension:
+#   .csv   text in np.savetxt's format, written block by block
+#   .npy   the trajectory format of storage.py (Fortran .npy + JSON header),
+#          loaded back as read-only memmap columns
+#   .npz   one array per signal, as written by np.savez
+#   .colz  chunked columnar archive: a zip with every block of every column in
+#          its own member plus a JSON header. Each column has its own
+#          compression level (0 stores it raw), and compressed blocks are
+#          byte-shuffled first, so the slowly varying high bytes of float64
+#          samples compress well.
+# ``data`` is a result mapping or an iterable of chunk mappings, such as the
+# output of the streaming simulations or SignalLog.iter_blocks(), and is
+# never concatenated in memory. .npy and .npz need the row count (and .npz
+# every column in turn) before writing, so a stream of unknown length is
+# first spooled to a temporary file next to the export. ``on_block`` gets the
+# running row count after each block, which a BackgroundJob can use for
+# progress and cancellation.
+
+COLUMNAR_VERSION = 1
+EXPORT_FORMATS = (".csv", ".npy", ".npz", ".colz")
+
+
+def _format_of(path: str | os.PathLike[str]) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix not in EXPORT_FORMATS:
+        raise ValueError(
+            f"unsupported export format {suffix or path!r}; use one of {', '.join(EXPORT_FORMATS)}"
+        )
+    return suffix
+
+
+def _blocks(
+    data: Mapping[str, np.ndarray] | Iterable[Mapping[str, np.ndarray]],
+    signals: list[str],
+    block_rows: int,
+) -> Iterable[dict[str, np.ndarray]]:
+    chunks = [data] if isinstance(data, Mapping) else data
+    for chunk in chunks:
+        rows = len(chunk[signals[0]])
+        for start in range(0, rows, block_rows):
+            yield {name: np.asarray(chunk[name][start : start + block_rows]) for name in signals}
+
+
+def _shuffle(column: np.ndarray) -> bytes:
+    return np.ascontiguousarray(column, dtype="<f8").view(np.uint8).reshape(-1, 8).T.tobytes()
+
+
+def _unshuffle(raw: bytes) -> np.ndarray:
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(8, -1)
+    return np.ascontiguousarray(planes.T).view("<f8").ravel()
+
+
+def export_result(
+    path: str | os.PathLike[str],
+    data: Mapping[str, np.ndarray] | Iterable[Mapping[str, np.ndarray]],
+    signals: list[str] | None = None,
+    function: str = "",
+    params: Mapping[str, Any] | None = None,
+    block_rows: int = 65536,
+    compression: int | Mapping[str, int] = 1,
+    on_block: Callable[[int], object] | None = None,
+) -> Path:
+    if block_rows < 1:
+        raise ValueError("block_rows must be >= 1")
+    fmt = _format_of(path)
+    path = Path(path)
+    if signals is None:
+        if not isinstance(data, Mapping):
+            data = iter(data)
+            first = next(data)
+            data = chain([first], data)
+            signals = list(first)
+        else:
+            signals = list(data)
+    blocks = _blocks(data, signals, block_rows)
+
+    def progress(blocks: Iterable[dict[str, np.ndarray]]) -> Iterable[dict[str, np.ndarray]]:
+        rows = 0
+        for block in blocks:
+            yield block
+            rows += len(block[signals[0]])
+            if on_block is not None:
+                on_block(rows)
+
+    if fmt == ".csv":
+        with open(path, "w", newline="") as handle:
+            handle.write(",".join(signals) + "\n")
+            for block in progress(blocks):
+                write_csv_blocks(handle, block, signals, block_rows, header=False)
+    elif fmt == ".npy":
+        rows = _known_rows(data, signals)
+        if rows is None:
+            # The trajectory is preallocated, so a stream of unknown length is
+            # spooled to a temporary file first.
+            with _spooled(path.parent, progress(blocks), signals) as (rows, spool):
+                chunks = _blocks(spool, signals, block_rows)
+                write_trajectory(path, chunks, rows, signals, function, params)
+        else:
+            write_trajectory(path, progress(blocks), rows, signals, function, params)
+    elif fmt == ".npz":
+        # np.savez needs whole arrays. The archive is written the same way,
+        # one uncompressed .npy member per signal, but column by column in
+        # blocks; streams are spooled first, since each column is a pass.
+        if isinstance(data, Mapping):
+            _write_npz(path, data, signals, block_rows, on_block)
+        else:
+            with _spooled(path.parent, progress(blocks), signals) as (_rows, spool):
+                _write_npz(path, spool, signals, block_rows)
+    else:
+        _write_columnar(path, progress(blocks), signals, function, params, compression)
+    return path
+
+
+def _known_rows(
+    data: Mapping[str, np.ndarray] | Iterable[Mapping[str, np.ndarray]], signals: list[str]
+) -> int | None:
+    if isinstance(data, Mapping):
+        return len(data[signals[0]])
+    if isinstance(data, (list, tuple)):
+        return sum(len(chunk[signals[0]]) for chunk in data)
+    return None
+
+
+@contextmanager
+def _spooled(
+    directory: Path, blocks: Iterable[dict[str, np.ndarray]], signals: list[str]
+) -> Iterator[tuple[int, dict[str, np.ndarray]]]:
+    # Appends the blocks as float64 rows to a temporary file and yields the
+    # row count and memmapped (strided) columns of it.
+    with tempfile.TemporaryFile(dir=directory) as handle:
+        rows = 0
+        for block in blocks:
+            np.column_stack([block[name] for name in signals]).astype(np.float64).tofile(handle)
+            rows += len(block[signals[0]])
+        handle.flush()
+        if rows == 0:
+            yield 0, {name: np.empty(0) for name in signals}
+            return
+        table = np.memmap(handle, dtype=np.float64, mode="r", shape=(rows, len(signals)))
+        try:
+            yield rows, {name: table[:, idx] for idx, name in enumerate(signals)}
+        finally:
+            del table
+
+
+def _write_npz(
+    path: Path,
+    data: Mapping[str, np.ndarray],
+    signals: list[str],
+    block_rows: int,
+    on_block: Callable[[int], object] | None = None,
+) -> None:
+    rows = len(data[signals[0]])
+    done = 0
+    with zipfile.ZipFile(path, "w", allowZip64=True) as archive:
+        for name in signals:
+            column = data[name]
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                np.lib.format.write_array_header_1_0(
+                    member, {"descr": "<f8", "fortran_order": False, "shape": (rows,)}
+                )
+                for start in range(0, rows, block_rows):
+                    block = np.asarray(column[start : start + block_rows], dtype="<f8")
+                    member.write(block.tobytes())
+                    done += len(block)
+                    if on_block is not None:
+                        on_block(done // len(signals))
+
+
+def _write_columnar(
+    path: Path,
+    blocks: Iterable[dict[str, np.ndarray]],
+    signals: list[str],
+    function: str,
+    params: Mapping[str, Any] | None,
+    compression: int | Mapping[str, int],
+) -> None:
+    levels = {
+        name: int(compression[name] if isinstance(compression, Mapping) else compression)
+        for name in signals
+    }
+    for name, level in levels.items():
+        if not 0 <= level <= 9:
+            raise ValueError(f"compression level for {name!r} must be between 0 and 9")
+    chunk_rows = []
+    with zipfile.ZipFile(path, "w") as archive:
+        for index, block in enumerate(blocks):
+            for column, name in enumerate(signals):
+                member = f"{column}/{index:06d}"
+                if levels[name]:
+                    archive.writestr(
+                        member,
+                        _shuffle(block[name]),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                        compresslevel=levels[name],
+                    )
+                else:
+                    archive.writestr(member, np.ascontiguousarray(block[name], "<f8").tobytes())
+            chunk_rows.append(len(block[signals[0]]))
+        header = {
+            "format_version": COLUMNAR_VERSION,
+            "function": function,
+            "params": dict(params or {}),
+            "signals": list(signals),
+            "rows": sum(chunk_rows),
+            "chunk_rows": chunk_rows,
+            "compression": levels,
+        }
+        archive.writestr("header.json", json.dumps(header, indent=2))
+
+
+def read_columnar_header(path: str | os.PathLike[str]) -> dict[str, Any]:
+    with zipfile.ZipFile(path) as archive:
+        return json.loads(archive.read("header.json"))
+
+
+def _read_columnar(path: Path, signals: list[str] | None) -> dict[str, np.ndarray]:
+    with zipfile.ZipFile(path) as archive:
+        header = json.loads(archive.read("header.json"))
+        names = header["signals"]
+        result = {}
+        for name in names if signals is None else signals:
+            column = names.index(name)
+            shuffled = header["compression"][name] > 0
+            values = np.empty(header["rows"])
+            start = 0
+            for index, rows in enumerate(header["chunk_rows"]):
+                raw = archive.read(f"{column}/{index:06d}")
+                values[start : start + rows] = (
+                    _unshuffle(raw) if shuffled else np.frombuffer(raw, dtype="<f8")
+                )
+                start += rows
+            result[name] = values
+    return result
+
+
+def load_result(
+    path: str | os.PathLike[str], signals: list[str] | None = None
+) -> dict[str, np.ndarray]:
+    # Reads any export back as {signal: column}. .npy columns are read-only
+    # memmaps and .colz only decodes the requested signals.
+    fmt = _format_of(path)
+    path = Path(path)
+    if fmt == ".npy":
+        result = open_trajectory(path)
+    elif fmt == ".npz":
+        with np.load(path) as archive:
+            result = {name: archive[name] for name in archive.files}
+    elif fmt == ".colz":
+        result = _read_columnar(path, signals)
+    else:
+        with open(path) as handle:
+            names = handle.readline().strip().split(",")
+            table = np.loadtxt(handle, delimiter=",", ndmin=2).reshape(-1, len(names))
+        result = {name: table[:, idx] for idx, name in enumerate(names)}
+    if signals is None:
+        return result
+    missing = [name for name in signals if name not in result]
+    if missing:
+        raise ValueError(f"{path} has no signals {missing}")
+    return {name: result[name] for name in signals}
@@ -1,19 +1,362 @@
 from __future__ import annotations
 
+import sqlite3
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from datetime import datetime
+from tkinter import filedialog, messagebox, simpledialog, ttk
+from pathlib import Path
 from time import perf_counter
+from typing import Any, Callable
 
 import numpy as np
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 
+from .cache import ResultCache, cache_key
+from .checkpoint import Checkpoint, resume_simulation, simulate_resumable
 from .control import (
     simulate_admittance,
     simulate_pid,
     simulate_virtual_wall,
     virtual_wall_force,
 )
+from .coupling import CoupledWall
+from .export import EXPORT_FORMATS, export_result
+from .history import RunStore
+from .jobs import BackgroundJob
+from .plotting import LivePlot
+from .recording import SignalLog
+from .servo import VirtualWall
+from .storage import Trajectory, open_trajectory
+from .streaming import concat_chunks, iter_simulate_virtual_wall
+from .tuning import TuneResult, autotune
+
+# Shared by the PID and admittance tabs so rerunning a parameter set, or
+# stepping back to one, is served from memory instead of resimulated. Each
+# entry also holds the run's checkpoint as JSON under _CHECKPOINT_ENTRY, so a
+# cached run can still be extended.
+_RESULT_CACHE = ResultCache(max_entries=32)
+_CHECKPOINT_ENTRY = "checkpoint"
+
+
+def _resumable_run(
+    function: str,
+    previous: Checkpoint | None,
+    previous_result: dict[str, np.ndarray] | None,
+    duration: float,
+    dt: float,
+    on_chunk: Callable[[dict[str, np.ndarray]], None] | None = None,
+    **params: float,
+) -> tuple[dict[str, np.ndarray], Checkpoint, str]:
+    # Longer runs of the previous parameter set continue from its checkpoint;
+    # anything else comes from the cache or a fresh run. ``on_chunk`` receives
+    # the run in order as it is produced (an extension starts with the
+    # previous samples).
+    key = cache_key(function, {**params, "duration": duration, "dt": dt}, "resumable")
+    if (
+        previous is not None
+        and previous_result is not None
+        and previous.function == function
+        and previous.params == {**previous.params, **params, "dt": dt}
+        and int(duration / dt) + 1 >= previous.samples
+    ):
+        if on_chunk is not None:
+            on_chunk(previous_result)
+        result, checkpoint = resume_simulation(
+            previous_result, previous, duration, on_chunk=on_chunk
+        )
+        how = "extended" if checkpoint.samples > previous.samples else "unchanged"
+    else:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            checkpoint = Checkpoint.from_json(str(cached.pop(_CHECKPOINT_ENTRY)))
+            return cached, checkpoint, "cached"
+        result, checkpoint = simulate_resumable(
+            function, duration=duration, dt=dt, on_chunk=on_chunk, **params
+        )
+        how = "computed"
+    entry = _RESULT_CACHE.put(key, {**result, _CHECKPOINT_ENTRY: np.array(checkpoint.to_json())})
+    del entry[_CHECKPOINT_ENTRY]
+    return entry, checkpoint, how
+
+
+# The worker threads never touch widgets; the tabs poll their job from Tk's
+# after() loop at about 60 Hz and plot whatever chunks have arrived.
+_POLL_MS = 16
+_DEMO_CHUNK_SIZE = 4096
+# Rows of the virtual wall log kept in memory; older rows are dropped.
+_WALL_LOG_CAPACITY = 200_000
+_WALL_SIGNALS = ("time", "position", "velocity", "force", "penetration")
+# While the handle is dragged, a CoupledWall steps the wall physics on its own
+# thread at _PHYSICS_RATE_HZ. Pointer events only move its coupling target.
+# Drawing, and draining the physics states into the log, happens at most once
+# per frame, from a single pending after() tick.
+_RENDER_FPS = 60.0
+_PHYSICS_RATE_HZ = 1000.0
+
+
+def _watch_job(
+    widget: tk.Misc,
+    job: BackgroundJob,
+    on_chunks: Callable[[list[Any]], None],
+    on_done: Callable[[BackgroundJob], None],
+) -> None:
+    def poll() -> None:
+        done = job.done
+        chunks = job.poll()
+        if chunks:
+            on_chunks(chunks)
+        if done:
+            on_done(job)
+        else:
+            widget.after(_POLL_MS, poll)
+
+    widget.after(_POLL_MS, poll)
+
+
+_EXPORT_FILETYPES = [
+    ("CSV files", "*.csv"),
+    ("NumPy trajectory", "*.npy"),
+    ("NumPy archive", "*.npz"),
+    ("Columnar archive", "*.colz"),
+    ("All files", "*.*"),
+]
+
+
+def _export_job(
+    job: BackgroundJob, path: str, data: Any, signals: list[str], **kwargs: Any
+) -> Path:
+    return export_result(path, data, signals, on_block=job.emit, **kwargs)
+
+
+def _start_export(
+    widget: tk.Misc,
+    status_var: tk.StringVar,
+    title: str,
+    data: Any,
+    signals: list[str],
+    done_message: str | None = None,
+    **kwargs: Any,
+) -> None:
+    # Asks for a path and writes the export on a worker thread; the format
+    # follows the chosen extension. ``done_message`` may use {path}.
+    output_path = filedialog.asksaveasfilename(
+        title=title, defaultextension=".csv", filetypes=_EXPORT_FILETYPES
+    )
+    if not output_path:
+        return
+    if Path(output_path).suffix.lower() not in EXPORT_FORMATS:
+        messagebox.showerror(
+            "Cannot export", f"Use one of these extensions: {', '.join(EXPORT_FORMATS)}."
+        )
+        return
+
+    def on_chunks(progress: list[int]) -> None:
+        status_var.set(f"Exporting to {output_path}... {progress[-1]} rows")
+
+    def on_done(job: BackgroundJob) -> None:
+        if job.error is not None:
+            messagebox.showerror("Export failed", str(job.error))
+            status_var.set("Export failed.")
+            return
+        status_var.set((done_message or "Saved results to {path}").format(path=output_path))
+
+    status_var.set(f"Exporting to {output_path}...")
+    job = BackgroundJob(_export_job, output_path, data, signals, **kwargs)
+    _watch_job(widget, job, on_chunks, on_done)
+
+
+def _wall_demo(job: BackgroundJob, passivity: bool, **params: float) -> dict[str, np.ndarray]:
+    # The passivity controller needs the whole force history, so that run is
+    # computed in one piece; otherwise the demo streams in chunks.
+    if passivity:
+        return simulate_virtual_wall(passivity=True, **params)
+    chunks = []
+    for chunk in iter_simulate_virtual_wall(chunk_size=_DEMO_CHUNK_SIZE, **params):
+        job.emit(chunk)
+        chunks.append(chunk)
+    return concat_chunks(chunks)
+
+
+def _job_failed(job: BackgroundJob) -> bool:
+    # Reports a failed job the way the synchronous callbacks used to.
+    if job.error is None:
+        return False
+    if isinstance(job.error, ValueError):
+        messagebox.showerror("Invalid parameters", str(job.error))
+    else:
+        messagebox.showerror("Simulation failed", repr(job.error))
+    return True
+
+
+_RUN_STATUS = {
+    "cached": "Loaded cached result.",
+    "extended": "Extended the previous run; only the new samples were simulated.",
+    "unchanged": "Parameters unchanged; showing the previous run.",
+}
+
+
+def _open_saved_run(title: str, function: str) -> Trajectory | None:
+    input_path = filedialog.askopenfilename(
+        title=title,
+        filetypes=[("Trajectory files", "*.npy"), ("All files", "*.*")],
+    )
+    if not input_path:
+        return None
+    try:
+        trajectory = open_trajectory(input_path)
+    except (OSError, ValueError, KeyError) as err:
+        messagebox.showerror("Cannot open run", str(err))
+        return None
+    if trajectory.header.get("function") != function:
+        messagebox.showerror("Cannot open run", f"{input_path} is not a {function} run.")
+        return None
+    return trajectory
+
+
+# Finished runs are recorded in a run history database in the user's home
+# directory and can be reloaded from the History dialog of their tab. Old
+# runs are pruned by these limits; pinned runs (presets) are always kept.
+_HISTORY_PATH = Path.home() / ".haptic_workbench" / "runs.sqlite3"
+_HISTORY_LIMITS = {"max_runs": 500, "max_age": 90 * 86400.0, "max_bytes": 2 * 2**30}
+_HISTORY: RunStore | None = None
+
+
+def _history() -> RunStore | None:
+    # Opened on first use; None if the database cannot be opened.
+    global _HISTORY
+    if _HISTORY is None:
+        try:
+            _HISTORY = RunStore(_HISTORY_PATH, **_HISTORY_LIMITS)
+        except (OSError, sqlite3.Error):
+            return None
+    return _HISTORY
+
+
+def _record_run(
+    widget: tk.Misc,
+    status_var: tk.StringVar,
+    function: str,
+    result: dict[str, np.ndarray],
+    params: dict[str, Any],
+) -> None:
+    # Saves on a worker thread; a failure only adds a note to the status line.
+    store = _history()
+    if store is None:
+        return
+
+    def on_done(job: BackgroundJob) -> None:
+        if job.error is not None:
+            status_var.set(f"{status_var.get()} (Not saved to history: {job.error})")
+
+    job = BackgroundJob(lambda _job: store.save(function, result, params))
+    _watch_job(widget, job, lambda _chunks: None, on_done)
+
+
+def _format_params(params: dict[str, Any]) -> str:
+    return ", ".join(
+        f"{name}={value:.4g}" if isinstance(value, float) else f"{name}={value}"
+        for name, value in params.items()
+    )
+
+
+def _choose_run(parent: tk.Misc, function: str) -> int | None:
+    # Modal list of the stored ``function`` runs, newest first, where runs can
+    # be pinned, renamed or deleted. Returns the id of the run to load.
+    store = _history()
+    if store is None:
+        messagebox.showerror("Run history", f"Cannot open {_HISTORY_PATH}.")
+        return None
+
+    dialog = tk.Toplevel(parent)
+    dialog.title("Run History")
+    dialog.transient(parent.winfo_toplevel())
+    tree = ttk.Treeview(
+        dialog, columns=("created", "label", "params"), show="headings", height=14
+    )
+    for column, heading, width in (
+        ("created", "Created", 150),
+        ("label", "Label", 140),
+        ("params", "Parameters", 560),
+    ):
+        tree.heading(column, text=heading)
+        tree.column(column, width=width, anchor="w")
+    tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    chosen: list[int] = []
+
+    def refresh() -> None:
+        tree.delete(*tree.get_children())
+        for record in store.query(function, limit=_HISTORY_LIMITS["max_runs"]):
+            created = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+            label = f"[pinned] {record.label}" if record.pinned else record.label
+            values = (created, label, _format_params(record.params))
+            tree.insert("", tk.END, iid=str(record.id), values=values)
+
+    def selected() -> int | None:
+        selection = tree.selection()
+        return int(selection[0]) if selection else None
+
+    def load() -> None:
+        run_id = selected()
+        if run_id is not None:
+            chosen.append(run_id)
+            dialog.destroy()
+
+    def pin() -> None:
+        run_id = selected()
+        if run_id is None:
+            return
+        record = store.get(run_id)
+        if record.pinned:
+            store.update(run_id, pinned=False)
+        else:
+            label = simpledialog.askstring(
+                "Pin run", "Preset name:", initialvalue=record.label, parent=dialog
+            )
+            if label is None:
+                return
+            store.update(run_id, label=label, pinned=True)
+        refresh()
+        tree.selection_set(str(run_id))
+
+    def delete() -> None:
+        run_id = selected()
+        if run_id is not None and messagebox.askyesno(
+            "Delete run", "Delete the selected run?", parent=dialog
+        ):
+            store.delete(run_id)
+            refresh()
+
+    button_row = ttk.Frame(dialog)
+    button_row.pack(fill=tk.X, padx=10, pady=(0, 10))
+    for index, (text, command) in enumerate(
+        (("Load", load), ("Pin / Unpin", pin), ("Delete", delete), ("Close", dialog.destroy))
+    ):
+        ttk.Button(button_row, text=text, command=command).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8 if index else 0, 0)
+        )
+    tree.bind("<Double-1>", lambda _event: load())
+
+    try:
+        refresh()
+    except sqlite3.Error as err:
+        dialog.destroy()
+        messagebox.showerror("Run history", str(err))
+        return None
+    dialog.grab_set()
+    dialog.wait_window()
+    return chosen[0] if chosen else None
+
+
+def _load_run(parent: tk.Misc, function: str) -> tuple[int, dict[str, np.ndarray]] | None:
+    run_id = _choose_run(parent, function)
+    if run_id is None:
+        return None
+    try:
+        return run_id, _history().load(run_id)
+    except (KeyError, OSError, ValueError, sqlite3.Error) as err:
+        messagebox.showerror("Cannot load run", str(err))
+        return None
 
 
 def _float_from_var(var: tk.StringVar, field_name: str) -> float:
@@ -23,10 +366,126 @@ def _float_from_var(var: tk.StringVar, field_name: str) -> float:
         raise ValueError(f"{field_name} must be a valid number.") from exc
 
 
-class PIDTab(ttk.Frame):
+class _RunBuffer:
+    # Collects the chunks of a streamed run in place. The columns double when
+    # full, so a run of n samples costs O(n) copies however often it is polled,
+    # where re-concatenating the partial run on every poll cost O(n^2).
+    def __init__(self, capacity: int = 1) -> None:
+        self._capacity = max(int(capacity), 1)
+        self._columns: dict[str, np.ndarray] = {}
+        self.length = 0
+
+    def extend(self, chunks: list[dict[str, np.ndarray]]) -> None:
+        for chunk in chunks:
+            rows = len(chunk["time"])
+            needed = self.length + rows
+            if not self._columns or needed > len(self._columns["time"]):
+                capacity = max(needed, self._capacity, 2 * self.length)
+                grown = {
+                    key: np.empty((capacity, *np.shape(values)[1:]), np.asarray(values).dtype)
+                    for key, values in chunk.items()
+                }
+                for key, column in self._columns.items():
+                    grown[key][: self.length] = column[: self.length]
+                self._columns = grown
+            for key, values in chunk.items():
+                self._columns[key][self.length : needed] = values
+            self.length = needed
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {key: column[: self.length] for key, column in self._columns.items()}
+
+
+class _SimulationTab(ttk.Frame):
+    # Background runs shared by the PID and admittance tabs: the simulation
+    # runs on a worker thread, chunks are plotted as they arrive and Cancel
+    # stops it at the next chunk, keeping the previous result.
+    function = ""
+    done_message = ""
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, padding=12)
         self.last_result: dict[str, np.ndarray] | None = None
+        self._checkpoint: Checkpoint | None = None
+        self._job: BackgroundJob | None = None
+        self._partial = _RunBuffer()
+        self._expected_samples = 1
+        self.status_var = tk.StringVar(value="Configure parameters, then click Run Simulation.")
+
+    def _plot(self, result: dict[str, np.ndarray], start: int = 0) -> None:
+        # Redraws with ``result``; samples before ``start`` were already shown.
+        raise NotImplementedError
+
+    def _show_result(self, result: dict[str, np.ndarray]) -> None:
+        self.last_result = result
+        self._plot(result)
+
+    def _busy(self) -> bool:
+        if self._job is None:
+            return False
+        self.status_var.set("A run is already in progress; cancel it or wait for it to finish.")
+        return True
+
+    def _start_run(self, message: str | None = None, **params: float) -> None:
+        duration, dt = params["duration"], params["dt"]
+        self._expected_samples = int(duration / dt) + 1 if duration > 0 and dt > 0 else 1
+        self._partial = _RunBuffer(self._expected_samples)
+        previous, previous_result = self._checkpoint, self.last_result
+        self._job = BackgroundJob(
+            lambda job: _resumable_run(
+                self.function, previous, previous_result, on_chunk=job.emit, **params
+            )
+        )
+        self.status_var.set("Simulating...")
+        _watch_job(self, self._job, self._on_chunks, lambda job: self._on_run_done(job, message))
+
+    def _on_chunks(self, chunks: list[dict[str, np.ndarray]]) -> None:
+        start = self._partial.length
+        self._partial.extend(chunks)
+        self._plot(self._partial.columns(), start)
+        fraction = self._partial.length / self._expected_samples
+        self.status_var.set(f"Simulating... {min(fraction, 1.0):.0%}")
+
+    def _on_run_done(self, job: BackgroundJob, message: str | None) -> None:
+        self._job = None
+        self._partial = _RunBuffer()
+        if job.cancelled:
+            if self.last_result is not None:
+                self._plot(self.last_result)
+            self.status_var.set("Run cancelled; the previous result is kept.")
+            return
+        if _job_failed(job):
+            return
+
+        result, self._checkpoint, how = job.result
+        self._show_result(result)
+        self.status_var.set(message or _RUN_STATUS.get(how, self.done_message))
+        if how in ("computed", "extended"):
+            _record_run(self, self.status_var, self.function, result, self._checkpoint.params)
+
+    def open_history(self) -> None:
+        if self._busy():
+            return
+        loaded = _load_run(self, self.function)
+        if loaded is None:
+            return
+        run_id, result = loaded
+        self._checkpoint = None
+        self._show_result(result)
+        self.status_var.set(f"Loaded run {run_id} from the history.")
+
+    def cancel(self) -> None:
+        if self._job is not None:
+            self._job.cancel()
+            self.status_var.set("Cancelling...")
+
+
+class PIDTab(_SimulationTab):
+    function = "simulate_pid"
+    done_message = "Simulation complete. Adjust gains and rerun for tuning."
+
+    def __init__(self, parent: tk.Misc) -> None:
+        super().__init__(parent)
 
         self.kp_var = tk.StringVar(value="12.0")
         self.ki_var = tk.StringVar(value="1.2")
@@ -37,7 +496,6 @@ class PIDTab(ttk.Frame):
         self.mass_var = tk.StringVar(value="1.0")
         self.damping_var = tk.StringVar(value="5.0")
         self.stiffness_var = tk.StringVar(value="20.0")
-        self.status_var = tk.StringVar(value="Configure parameters, then click Run Simulation.")
 
         self._build_layout()
 
@@ -70,27 +528,57 @@ class PIDTab(ttk.Frame):
         ttk.Button(button_row, text="Run Simulation", command=self.run).pack(
             side=tk.LEFT, fill=tk.X, expand=True
         )
-        ttk.Button(button_row, text="Export CSV", command=self.export_csv).pack(
+        ttk.Button(button_row, text="Export Data", command=self.export_data).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
+        ttk.Button(button_row, text="Open Run", command=self.open_run).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
+        ttk.Button(button_row, text="History", command=self.open_history).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
+        tune_row = ttk.Frame(controls)
+        tune_row.grid(row=len(fields) + 1, column=0, columnspan=2, sticky="ew", pady=(8, 0))
+        ttk.Button(tune_row, text="Auto Tune Gains", command=self.auto_tune).pack(
+            side=tk.LEFT, fill=tk.X, expand=True
+        )
+        ttk.Button(tune_row, text="Cancel", command=self.cancel).pack(
             side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
         )
 
         ttk.Label(controls, textvariable=self.status_var, wraplength=280).grid(
-            row=len(fields) + 1, column=0, columnspan=2, sticky="w", pady=(8, 0)
+            row=len(fields) + 2, column=0, columnspan=2, sticky="w", pady=(8, 0)
         )
 
         fig = Figure(figsize=(8.0, 5.8), dpi=100)
         self.ax_position = fig.add_subplot(211)
         self.ax_control = fig.add_subplot(212)
+        (position_line,) = self.ax_position.plot([], [], label="Position")
+        (target_line,) = self.ax_position.plot([], [], "--", label="Target")
+        self.ax_position.set_ylabel("Position (m)")
+        self.ax_position.legend(loc="best")
+        self.ax_position.grid(alpha=0.3)
+
+        (control_line,) = self.ax_control.plot([], [], label="Control Signal")
+        self.ax_control.set_xlabel("Time (s)")
+        self.ax_control.set_ylabel("Force")
+        self.ax_control.grid(alpha=0.3)
+        self.ax_control.legend(loc="best")
         fig.tight_layout()
 
         plot_frame = ttk.Frame(self)
         plot_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.canvas = FigureCanvasTkAgg(fig, master=plot_frame)
+        toolbar = NavigationToolbar2Tk(self.canvas, plot_frame, pack_toolbar=False)
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._live_plot = LivePlot(self.canvas, [position_line, target_line, control_line])
 
-    def run(self) -> None:
+    def run(self, message: str | None = None) -> None:
+        if self._busy():
+            return
         try:
-            result = simulate_pid(
+            params = dict(
                 kp=_float_from_var(self.kp_var, "Kp"),
                 ki=_float_from_var(self.ki_var, "Ki"),
                 kd=_float_from_var(self.kd_var, "Kd"),
@@ -104,61 +592,94 @@ class PIDTab(ttk.Frame):
         except ValueError as err:
             messagebox.showerror("Invalid parameters", str(err))
             return
+        self._start_run(message, **params)
 
-        self.last_result = result
-        t = result["time"]
-        self.ax_position.clear()
-        self.ax_position.plot(t, result["position"], label="Position")
-        self.ax_position.plot(t, result["target"], "--", label="Target")
-        self.ax_position.set_ylabel("Position (m)")
-        self.ax_position.legend(loc="best")
-        self.ax_position.grid(alpha=0.3)
+    def auto_tune(self) -> None:
+        if self._busy():
+            return
+        try:
+            params = dict(
+                target=_float_from_var(self.target_var, "Target Position"),
+                duration=_float_from_var(self.duration_var, "Duration"),
+                dt=_float_from_var(self.dt_var, "Time Step"),
+                plant_mass=_float_from_var(self.mass_var, "Plant Mass"),
+                plant_damping=_float_from_var(self.damping_var, "Plant Damping"),
+                plant_stiffness=_float_from_var(self.stiffness_var, "Plant Stiffness"),
+            )
+        except ValueError as err:
+            messagebox.showerror("Invalid parameters", str(err))
+            return
 
-        self.ax_control.clear()
-        self.ax_control.plot(t, result["control"], label="Control Signal")
-        self.ax_control.set_xlabel("Time (s)")
-        self.ax_control.set_ylabel("Force")
-        self.ax_control.grid(alpha=0.3)
-        self.ax_control.legend(loc="best")
-        self.canvas.draw_idle()
-        self.status_var.set("Simulation complete. Adjust gains and rerun for tuning.")
+        # Each generation reports its best candidate and is a cancellation point.
+        self._job = BackgroundJob(
+            lambda job: autotune(callback=lambda _generation, best: job.emit(best), **params)
+        )
+        self.status_var.set("Auto-tuning...")
+        _watch_job(self, self._job, self._on_tune_progress, self._on_tune_done)
 
-    def export_csv(self) -> None:
-        if self.last_result is None:
-            messagebox.showwarning("No result", "Run a simulation before exporting.")
+    def _on_tune_progress(self, bests: list[TuneResult]) -> None:
+        best = bests[-1]
+        self.status_var.set(
+            f"Auto-tuning... generation {best.generations}: Kp={best.kp:.4g}, "
+            f"Ki={best.ki:.4g}, Kd={best.kd:.4g}, cost {best.cost:.4g}"
+        )
+
+    def _on_tune_done(self, job: BackgroundJob) -> None:
+        self._job = None
+        if job.cancelled:
+            self.status_var.set("Auto-tune cancelled; the gains are unchanged.")
+            return
+        if _job_failed(job):
             return
 
-        output_path = filedialog.asksaveasfilename(
-            title="Save PID Results",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+        tuned = job.result
+        self.kp_var.set(f"{tuned.kp:.4g}")
+        self.ki_var.set(f"{tuned.ki:.4g}")
+        self.kd_var.set(f"{tuned.kd:.4g}")
+        self.run(
+            f"Auto-tuned in {tuned.generations} generations ({tuned.evaluations} candidates): "
+            f"IAE {tuned.terms['iae']:.3f}, overshoot {tuned.terms['overshoot']:.1%}, "
+            f"settling {tuned.terms['settling_time']:.1%} of the run."
         )
-        if not output_path:
+
+    def open_run(self) -> None:
+        if self._busy():
             return
+        result = _open_saved_run("Open PID Run", "simulate_pid")
+        if result is None:
+            return
+        self._checkpoint = None
+        self._show_result(result)
+        self.status_var.set(f"Opened {result.path}")
 
-        data = np.column_stack(
-            [
-                self.last_result["time"],
-                self.last_result["position"],
-                self.last_result["velocity"],
-                self.last_result["control"],
-                self.last_result["target"],
-            ]
+    def _plot(self, result: dict[str, np.ndarray], start: int = 0) -> None:
+        t = result["time"]
+        self._live_plot.update(
+            [(t, result["position"]), (t, result["target"]), (t, result["control"])], start
         )
-        np.savetxt(
-            output_path,
-            data,
-            delimiter=",",
-            header="time,position,velocity,control,target",
-            comments="",
+
+    def export_data(self) -> None:
+        if self.last_result is None:
+            messagebox.showwarning("No result", "Run a simulation before exporting.")
+            return
+
+        _start_export(
+            self,
+            self.status_var,
+            "Save PID Results",
+            self.last_result,
+            ["time", "position", "velocity", "control", "target"],
+            function=self.function,
+            params=self._checkpoint.params if self._checkpoint else None,
         )
-        self.status_var.set(f"Saved results to {output_path}")
 
 
-class AdmittanceTab(ttk.Frame):
+class AdmittanceTab(_SimulationTab):
+    function = "simulate_admittance"
+    done_message = "Simulation complete. Tune parameters and rerun."
+
     def __init__(self, parent: tk.Misc) -> None:
-        super().__init__(parent, padding=12)
-        self.last_result: dict[str, np.ndarray] | None = None
+        super().__init__(parent)
 
         self.stiffness_var = tk.StringVar(value="45.0")
         self.damping_var = tk.StringVar(value="14.0")
@@ -167,7 +688,6 @@ class AdmittanceTab(ttk.Frame):
         self.force_freq_var = tk.StringVar(value="0.6")
         self.duration_var = tk.StringVar(value="5.0")
         self.dt_var = tk.StringVar(value="0.01")
-        self.status_var = tk.StringVar(value="Configure parameters, then click Run Simulation.")
 
         self._build_layout()
 
@@ -198,28 +718,57 @@ class AdmittanceTab(ttk.Frame):
         ttk.Button(button_row, text="Run Simulation", command=self.run).pack(
             side=tk.LEFT, fill=tk.X, expand=True
         )
-        ttk.Button(button_row, text="Export CSV", command=self.export_csv).pack(
+        ttk.Button(button_row, text="Export Data", command=self.export_data).pack(
             side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
         )
+        ttk.Button(button_row, text="Open Run", command=self.open_run).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
+        ttk.Button(button_row, text="History", command=self.open_history).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
+        ttk.Button(controls, text="Cancel", command=self.cancel).grid(
+            row=len(fields) + 1, column=0, columnspan=2, sticky="ew", pady=(8, 0)
+        )
 
         ttk.Label(controls, textvariable=self.status_var, wraplength=280).grid(
-            row=len(fields) + 1, column=0, columnspan=2, sticky="w", pady=(8, 0)
+            row=len(fields) + 2, column=0, columnspan=2, sticky="w", pady=(8, 0)
         )
 
         fig = Figure(figsize=(8.0, 5.8), dpi=100)
         self.ax_position = fig.add_subplot(311)
         self.ax_velocity = fig.add_subplot(312)
         self.ax_force = fig.add_subplot(313)
+        (position_line,) = self.ax_position.plot([], [], label="Position")
+        self.ax_position.set_ylabel("Position (m)")
+        self.ax_position.grid(alpha=0.3)
+        self.ax_position.legend(loc="best")
+
+        (velocity_line,) = self.ax_velocity.plot([], [], label="Velocity", color="tab:orange")
+        self.ax_velocity.set_ylabel("Velocity (m/s)")
+        self.ax_velocity.grid(alpha=0.3)
+        self.ax_velocity.legend(loc="best")
+
+        (force_line,) = self.ax_force.plot([], [], label="External Force", color="tab:green")
+        self.ax_force.set_xlabel("Time (s)")
+        self.ax_force.set_ylabel("Force (N)")
+        self.ax_force.grid(alpha=0.3)
+        self.ax_force.legend(loc="best")
         fig.tight_layout()
 
         plot_frame = ttk.Frame(self)
         plot_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.canvas = FigureCanvasTkAgg(fig, master=plot_frame)
+        toolbar = NavigationToolbar2Tk(self.canvas, plot_frame, pack_toolbar=False)
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._live_plot = LivePlot(self.canvas, [position_line, velocity_line, force_line])
 
     def run(self) -> None:
+        if self._busy():
+            return
         try:
-            result = simulate_admittance(
+            params = dict(
                 stiffness=_float_from_var(self.stiffness_var, "Stiffness"),
                 damping=_float_from_var(self.damping_var, "Damping"),
                 mass=_float_from_var(self.mass_var, "Mass"),
@@ -231,65 +780,44 @@ class AdmittanceTab(ttk.Frame):
         except ValueError as err:
             messagebox.showerror("Invalid parameters", str(err))
             return
+        self._start_run(**params)
 
-        self.last_result = result
-        t = result["time"]
-
-        self.ax_position.clear()
-        self.ax_position.plot(t, result["position"], label="Position")
-        self.ax_position.set_ylabel("Position (m)")
-        self.ax_position.grid(alpha=0.3)
-        self.ax_position.legend(loc="best")
-
-        self.ax_velocity.clear()
-        self.ax_velocity.plot(t, result["velocity"], label="Velocity", color="tab:orange")
-        self.ax_velocity.set_ylabel("Velocity (m/s)")
-        self.ax_velocity.grid(alpha=0.3)
-        self.ax_velocity.legend(loc="best")
-
-        self.ax_force.clear()
-        self.ax_force.plot(t, result["force"], label="External Force", color="tab:green")
-        self.ax_force.set_xlabel("Time (s)")
-        self.ax_force.set_ylabel("Force (N)")
-        self.ax_force.grid(alpha=0.3)
-        self.ax_force.legend(loc="best")
+    def open_run(self) -> None:
+        if self._busy():
+            return
+        result = _open_saved_run("Open Admittance Run", "simulate_admittance")
+        if result is None:
+            return
+        self._checkpoint = None
+        self._show_result(result)
+        self.status_var.set(f"Opened {result.path}")
 
-        self.canvas.draw_idle()
-        self.status_var.set("Simulation complete. Tune parameters and rerun.")
+    def _plot(self, result: dict[str, np.ndarray], start: int = 0) -> None:
+        t = result["time"]
+        self._live_plot.update(
+            [(t, result["position"]), (t, result["velocity"]), (t, result["force"])], start
+        )
 
-    def export_csv(self) -> None:
+    def export_data(self) -> None:
         if self.last_result is None:
             messagebox.showwarning("No result", "Run a simulation before exporting.")
             return
 
-        output_path = filedialog.asksaveasfilename(
-            title="Save Admittance Results",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+        _start_export(
+            self,
+            self.status_var,
+            "Save Admittance Results",
+            self.last_result,
+            ["time", "position", "velocity", "force"],
+            function=self.function,
+            params=self._checkpoint.params if self._checkpoint else None,
         )
-        if not output_path:
-            return
-
-        data = np.column_stack(
-            [
-                self.last_result["time"],
-                self.last_result["position"],
-                self.last_result["velocity"],
-                self.last_result["force"],
-            ]
-        )
-        np.savetxt(
-            output_path,
-            data,
-            delimiter=",",
-            header="time,position,velocity,force",
-            comments="",
-        )
-        self.status_var.set(f"Saved results to {output_path}")
 
 
 class VirtualWallTab(ttk.Frame):
-    def __init__(self, parent: tk.Misc) -> None:
+    def __init__(self, parent: tk.Misc, render_fps: float = _RENDER_FPS) -> None:
+        if render_fps <= 0:
+            raise ValueError("render_fps must be > 0")
         super().__init__(parent, padding=12)
         self.status_var = tk.StringVar(
             value="Drag the handle right until it hits the wall."
@@ -305,21 +833,30 @@ class VirtualWallTab(ttk.Frame):
         self.motion_center_var = tk.StringVar(value="0.56")
         self.motion_amplitude_var = tk.StringVar(value="0.24")
         self.motion_frequency_var = tk.StringVar(value="0.75")
+        self.passivity_var = tk.BooleanVar(value=False)
 
         self.current_position = 0.22
         self.current_force = 0.0
         self.current_penetration = 0.0
         self.dragging = False
-        self.last_event_time: float | None = None
+        self._coupling: CoupledWall | None = None
+        self._physics: BackgroundJob | None = None
+        # Session time at which the running physics job started.
+        self._physics_offset = 0.0
         self._params: dict[str, float] = {}
+        self._job: BackgroundJob | None = None
+        # Rows of the running auto demo already in the log.
+        self._demo_rows = 0
+        self._demo_params: dict[str, Any] = {}
 
-        self.log_time: list[float] = []
-        self.log_position: list[float] = []
-        self.log_velocity: list[float] = []
-        self.log_force: list[float] = []
-        self.log_penetration: list[float] = []
+        self.log = SignalLog(_WALL_SIGNALS, capacity=_WALL_LOG_CAPACITY)
         self.session_start_time: float | None = None
 
+        self._render_interval_ms = max(int(round(1000.0 / render_fps)), 1)
+        self._render_pending: str | None = None
+        # Log rows appended since the plot was last updated.
+        self._unplotted_rows = 0
+
         self._build_layout()
         self._apply_parameters(redraw_only=True)
 
@@ -356,6 +893,9 @@ class VirtualWallTab(ttk.Frame):
         ttk.Button(button_row_1, text="Run Auto Demo", command=self.run_auto_demo).pack(
             side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
         )
+        ttk.Button(button_row_1, text="Cancel", command=self.cancel).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
 
         button_row_2 = ttk.Frame(controls)
         button_row_2.grid(
@@ -364,12 +904,22 @@ class VirtualWallTab(ttk.Frame):
         ttk.Button(button_row_2, text="Clear Log", command=self.clear_log).pack(
             side=tk.LEFT, fill=tk.X, expand=True
         )
-        ttk.Button(button_row_2, text="Export CSV", command=self.export_csv).pack(
+        ttk.Button(button_row_2, text="Export Data", command=self.export_data).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
+        )
+        ttk.Button(button_row_2, text="History", command=self.open_history).pack(
             side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0)
         )
 
+        ttk.Checkbutton(
+            controls,
+            text="Passivity Control",
+            variable=self.passivity_var,
+            command=self._on_passivity_toggled,
+        ).grid(row=len(fields) + 2, column=0, columnspan=2, sticky="w", pady=(8, 0))
+
         ttk.Label(controls, textvariable=self.status_var, wraplength=300).grid(
-            row=len(fields) + 2, column=0, columnspan=2, sticky="w", pady=(8, 0)
+            row=len(fields) + 3, column=0, columnspan=2, sticky="w", pady=(8, 0)
         )
 
         right_panel = ttk.Frame(self)
@@ -386,17 +936,33 @@ class VirtualWallTab(ttk.Frame):
         self.interaction_canvas.bind("<ButtonPress-1>", self._on_pointer_down)
         self.interaction_canvas.bind("<B1-Motion>", self._on_pointer_move)
         self.interaction_canvas.bind("<ButtonRelease-1>", self._on_pointer_up)
-        self.interaction_canvas.bind("<Configure>", lambda _event: self._redraw_canvas())
+        self.interaction_canvas.bind("<Configure>", lambda _event: self._schedule_render())
+        self._create_scene()
 
         fig = Figure(figsize=(8.0, 4.0), dpi=100)
         self.ax_force = fig.add_subplot(211)
         self.ax_penetration = fig.add_subplot(212)
+        (force_line,) = self.ax_force.plot([], [], color="tab:red", label="Wall Force")
+        self.ax_force.set_ylabel("Force (N)")
+        self.ax_force.grid(alpha=0.3)
+        self.ax_force.legend(loc="best")
+
+        (penetration_line,) = self.ax_penetration.plot(
+            [], [], color="tab:blue", label="Penetration"
+        )
+        self.ax_penetration.set_xlabel("Time (s)")
+        self.ax_penetration.set_ylabel("Penetration (m)")
+        self.ax_penetration.grid(alpha=0.3)
+        self.ax_penetration.legend(loc="best")
         fig.tight_layout()
 
         plot_frame = ttk.Frame(right_panel)
         plot_frame.pack(fill=tk.BOTH, expand=True)
         self.plot_canvas = FigureCanvasTkAgg(fig, master=plot_frame)
+        toolbar = NavigationToolbar2Tk(self.plot_canvas, plot_frame, pack_toolbar=False)
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.plot_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._live_plot = LivePlot(self.plot_canvas, [force_line, penetration_line])
 
     def _parse_parameters(self) -> dict[str, float]:
         params = {
@@ -455,58 +1021,66 @@ class VirtualWallTab(ttk.Frame):
             return 0.0
         return float(np.clip((x_value - track_left) / (track_right - track_left), 0.0, 1.0))
 
+    def _create_scene(self) -> None:
+        # The items are created once; _redraw_canvas only moves and restyles
+        # them, which is much cheaper than deleting and recreating everything.
+        canvas = self.interaction_canvas
+        self._items = {
+            "title": canvas.create_text(
+                0,
+                0,
+                anchor="w",
+                text="Virtual Wall Interaction (click + drag the handle)",
+                fill="#0f172a",
+                font=("Segoe UI", 11, "bold"),
+            ),
+            "track": canvas.create_line(0, 0, 0, 0, width=4, fill="#64748b"),
+            "track_start": canvas.create_text(0, 0, anchor="w", text="0.0 m", fill="#334155"),
+            "track_end": canvas.create_text(0, 0, anchor="e", text="1.0 m", fill="#334155"),
+            "wall": canvas.create_rectangle(0, 0, 0, 0, fill="#ef4444", outline="#b91c1c"),
+            "wall_label": canvas.create_text(
+                0,
+                0,
+                anchor="w",
+                text="Virtual Wall",
+                fill="#991b1b",
+                font=("Segoe UI", 9, "bold"),
+            ),
+            "handle": canvas.create_oval(0, 0, 0, 0, outline="#1e293b", width=2),
+            "force": canvas.create_line(0, 0, 0, 0, width=4, arrow=tk.LAST),
+            "readout": canvas.create_text(
+                0, 0, anchor="w", fill="#0f172a", font=("Consolas", 10)
+            ),
+        }
+
     def _redraw_canvas(self) -> None:
         if not self._params:
             return
 
         canvas = self.interaction_canvas
-        canvas.delete("all")
+        items = self._items
         track_left, track_right, track_y = self._track_bounds()
         wall_x = self._x_from_position(self._params["wall_position"])
         handle_x = self._x_from_position(self.current_position)
         max_force = self._params["max_force"]
 
-        canvas.create_text(
-            track_left,
-            26,
-            anchor="w",
-            text="Virtual Wall Interaction (click + drag the handle)",
-            fill="#0f172a",
-            font=("Segoe UI", 11, "bold"),
-        )
-        canvas.create_line(track_left, track_y, track_right, track_y, width=4, fill="#64748b")
-        canvas.create_text(track_left, track_y + 26, anchor="w", text="0.0 m", fill="#334155")
-        canvas.create_text(track_right, track_y + 26, anchor="e", text="1.0 m", fill="#334155")
-
-        canvas.create_rectangle(
-            wall_x - 4,
-            track_y - 48,
-            wall_x + 4,
-            track_y + 48,
-            fill="#ef4444",
-            outline="#b91c1c",
-        )
-        canvas.create_text(
-            wall_x + 8,
-            track_y - 54,
-            anchor="w",
-            text="Virtual Wall",
-            fill="#991b1b",
-            font=("Segoe UI", 9, "bold"),
-        )
+        canvas.coords(items["title"], track_left, 26)
+        canvas.coords(items["track"], track_left, track_y, track_right, track_y)
+        canvas.coords(items["track_start"], track_left, track_y + 26)
+        canvas.coords(items["track_end"], track_right, track_y + 26)
+        canvas.coords(items["wall"], wall_x - 4, track_y - 48, wall_x + 4, track_y + 48)
+        canvas.coords(items["wall_label"], wall_x + 8, track_y - 54)
 
         contact = self.current_penetration > 0
-        handle_color = "#f97316" if contact else "#2563eb"
         radius = 14
-        canvas.create_oval(
+        canvas.coords(
+            items["handle"],
             handle_x - radius,
             track_y - radius,
             handle_x + radius,
             track_y + radius,
-            fill=handle_color,
-            outline="#1e293b",
-            width=2,
         )
+        canvas.itemconfigure(items["handle"], fill="#f97316" if contact else "#2563eb")
 
         force_scale = 120.0
         force_magnitude = min(abs(self.current_force) / max_force, 1.0) if max_force > 0 else 0.0
@@ -518,124 +1092,134 @@ class VirtualWallTab(ttk.Frame):
         else:
             arrow_end_x = handle_x
 
-        canvas.create_line(
-            handle_x,
-            track_y - 30,
-            arrow_end_x,
-            track_y - 30,
-            fill="#16a34a" if contact else "#94a3b8",
-            width=4,
-            arrow=tk.LAST,
-        )
+        canvas.coords(items["force"], handle_x, track_y - 30, arrow_end_x, track_y - 30)
+        canvas.itemconfigure(items["force"], fill="#16a34a" if contact else "#94a3b8")
 
-        canvas.create_text(
-            track_left,
-            228,
-            anchor="w",
+        canvas.coords(items["readout"], track_left, 228)
+        canvas.itemconfigure(
+            items["readout"],
             text=(
                 f"Position: {self.current_position:.3f} m  |  "
                 f"Penetration: {self.current_penetration:.3f} m  |  "
                 f"Output Force: {self.current_force:.2f} N"
             ),
-            fill="#0f172a",
-            font=("Consolas", 10),
         )
 
-    def _update_plot(self) -> None:
-        self.ax_force.clear()
-        self.ax_penetration.clear()
-
-        if self.log_time:
-            self.ax_force.plot(self.log_time, self.log_force, color="tab:red", label="Wall Force")
-            self.ax_penetration.plot(
-                self.log_time,
-                self.log_penetration,
-                color="tab:blue",
-                label="Penetration",
+    def _schedule_render(self, new_rows: int = 0) -> None:
+        # Coalesces redraws: any number of calls within one frame lead to a
+        # single canvas and plot update. Rows are counted rather than indexed
+        # because a full log shifts its rows on every append.
+        self._unplotted_rows += new_rows
+        if self._render_pending is None:
+            self._render_pending = self.after(self._render_interval_ms, self._render)
+
+    def _render(self) -> None:
+        self._render_pending = None
+        if self._physics is not None:
+            self._drain_physics()
+        self._redraw_canvas()
+        if self._unplotted_rows:
+            self._update_plot(start=max(len(self.log) - self._unplotted_rows, 0))
+        if self.dragging and self._coupling is not None:
+            message = (
+                f"Interactive contact. Position={self.current_position:.3f} m, "
+                f"Force={self.current_force:.2f} N"
             )
-
-        self.ax_force.set_ylabel("Force (N)")
-        self.ax_force.grid(alpha=0.3)
-        self.ax_force.legend(loc="best")
-
-        self.ax_penetration.set_xlabel("Time (s)")
-        self.ax_penetration.set_ylabel("Penetration (m)")
-        self.ax_penetration.grid(alpha=0.3)
-        self.ax_penetration.legend(loc="best")
-
-        self.plot_canvas.draw_idle()
-
-    def _append_log(
-        self,
-        timestamp: float,
-        position: float,
-        velocity: float,
-        force: float,
-        penetration: float,
-    ) -> None:
-        if self.session_start_time is None:
-            self.session_start_time = timestamp
-
-        elapsed = timestamp - self.session_start_time
-        self.log_time.append(float(elapsed))
-        self.log_position.append(float(position))
-        self.log_velocity.append(float(velocity))
-        self.log_force.append(float(force))
-        self.log_penetration.append(float(penetration))
-
-    def _update_from_position(self, new_position: float, event_time: float) -> None:
-        if not self._params:
-            return
-
-        dt = 1e-3
-        if self.last_event_time is not None:
-            dt = max(event_time - self.last_event_time, 1e-3)
-        velocity = (new_position - self.current_position) / dt
-        self.current_position = float(np.clip(new_position, 0.0, 1.0))
-
-        force = virtual_wall_force(
-            position=self.current_position,
-            velocity=velocity,
+            stats = self._coupling.stats
+            if stats is not None:
+                message += f" (physics at {stats.achieved_rate_hz:.0f} Hz"
+                if self._coupling.missed_ticks:
+                    message += f", {self._coupling.missed_ticks} late ticks caught up"
+                message += ")"
+            self.status_var.set(message)
+        if self._physics is not None:
+            # Keep ticking until the physics thread has stopped and is drained.
+            self._schedule_render()
+
+    def _drain_physics(self) -> None:
+        job = self._physics
+        done = job.done
+        states = job.poll()
+        if states:
+            time, _pointer, position, velocity, force, penetration = np.array(states).T
+            self.log.extend(
+                {
+                    "time": self._physics_offset + time,
+                    "position": position,
+                    "velocity": velocity,
+                    "force": force,
+                    "penetration": penetration,
+                }
+            )
+            self._unplotted_rows += len(states)
+            last = states[-1]
+            self.current_position = last.position
+            self.current_force = last.force
+            self.current_penetration = last.penetration
+        if done:
+            self._physics = None
+            self._coupling = None
+            _job_failed(job)
+
+    def _make_wall(self) -> VirtualWall:
+        return VirtualWall(
             wall_position=self._params["wall_position"],
             stiffness=self._params["stiffness"],
             damping=self._params["damping"],
             friction=self._params["friction"],
             max_force=self._params["max_force"],
         )
-        self.current_force = force
-        self.current_penetration = max(0.0, self.current_position - self._params["wall_position"])
 
-        self._append_log(
-            timestamp=event_time,
-            position=self.current_position,
-            velocity=velocity,
-            force=self.current_force,
-            penetration=self.current_penetration,
-        )
-        self._redraw_canvas()
-        self._update_plot()
-        self.status_var.set(
-            f"Interactive contact. Position={self.current_position:.3f} m, Force={self.current_force:.2f} N"
+    def _on_passivity_toggled(self) -> None:
+        if self._coupling is not None:
+            self._coupling.reset_passivity()
+            self._coupling.passivity = self.passivity_var.get()
+
+    def _update_plot(self, start: int = 0) -> None:
+        # During interaction only the rows appended since the last frame are
+        # rescanned.
+        self._unplotted_rows = 0
+        self._live_plot.update(
+            [
+                (self.log["time"], self.log["force"]),
+                (self.log["time"], self.log["penetration"]),
+            ],
+            start,
         )
-        self.last_event_time = event_time
 
     def _on_pointer_down(self, event: tk.Event[tk.Misc]) -> None:
+        if self._job is not None:
+            self.status_var.set("The auto demo is running; wait for it or cancel it first.")
+            return
+        if self._physics is not None:
+            return
         if not self._apply_parameters(redraw_only=True):
             return
         self.dragging = True
         now = perf_counter()
-        self.last_event_time = now
-        self._update_from_position(self._position_from_x(float(event.x)), now)
+        if self.session_start_time is None:
+            self.session_start_time = now
+        self._physics_offset = now - self.session_start_time
+        self._coupling = CoupledWall(
+            self._make_wall(),
+            position=self.current_position,
+            passivity=self.passivity_var.get(),
+            rate_hz=_PHYSICS_RATE_HZ,
+        )
+        self._coupling.pointer = self._position_from_x(float(event.x))
+        self._physics = BackgroundJob(self._coupling.run)
+        self._schedule_render()
 
     def _on_pointer_move(self, event: tk.Event[tk.Misc]) -> None:
-        if not self.dragging:
-            return
-        now = perf_counter()
-        self._update_from_position(self._position_from_x(float(event.x)), now)
+        # The physics thread reads the latest target on its next tick, so any
+        # burst of motion events collapses into a single position.
+        if self.dragging and self._coupling is not None:
+            self._coupling.pointer = self._position_from_x(float(event.x))
 
     def _on_pointer_up(self, _event: tk.Event[tk.Misc]) -> None:
         self.dragging = False
-        self.last_event_time = None
+        if self._physics is not None:
+            self._physics.cancel()
         self.status_var.set("Pointer released. Drag again to probe the wall.")
 
     def _apply_parameters(self, redraw_only: bool = False) -> bool:
@@ -646,6 +1230,9 @@ class VirtualWallTab(ttk.Frame):
                 messagebox.showerror("Invalid parameters", str(err))
             return False
 
+        if self._coupling is not None:
+            self._coupling.wall = self._make_wall()
+            self._coupling.reset_passivity()
         self.current_position = float(np.clip(self.current_position, 0.0, 1.0))
         self.current_penetration = max(0.0, self.current_position - self._params["wall_position"])
         self.current_force = virtual_wall_force(
@@ -666,46 +1253,104 @@ class VirtualWallTab(ttk.Frame):
         self._apply_parameters(redraw_only=False)
 
     def run_auto_demo(self) -> None:
+        if self._job is not None:
+            self.status_var.set("The auto demo is already running.")
+            return
+        if self._physics is not None:
+            return
         if not self._apply_parameters(redraw_only=True):
             messagebox.showerror("Invalid parameters", "Fix parameters before running demo.")
             return
 
-        result = simulate_virtual_wall(
-            wall_position=self._params["wall_position"],
-            stiffness=self._params["stiffness"],
-            damping=self._params["damping"],
-            friction=self._params["friction"],
-            max_force=self._params["max_force"],
-            motion_center=self._params["motion_center"],
-            motion_amplitude=self._params["motion_amplitude"],
-            motion_frequency_hz=self._params["motion_frequency"],
-            duration=self._params["duration"],
-            dt=self._params["dt"],
-        )
-
-        self.log_time = result["time"].tolist()
-        self.log_position = result["position"].tolist()
-        self.log_velocity = result["velocity"].tolist()
-        self.log_force = result["force"].tolist()
-        self.log_penetration = result["penetration"].tolist()
+        self._demo_rows = 0
+        self._demo_params = {
+            "passivity": self.passivity_var.get(),
+            "wall_position": self._params["wall_position"],
+            "stiffness": self._params["stiffness"],
+            "damping": self._params["damping"],
+            "friction": self._params["friction"],
+            "max_force": self._params["max_force"],
+            "motion_center": self._params["motion_center"],
+            "motion_amplitude": self._params["motion_amplitude"],
+            "motion_frequency_hz": self._params["motion_frequency"],
+            "duration": self._params["duration"],
+            "dt": self._params["dt"],
+        }
+        self._job = BackgroundJob(_wall_demo, **self._demo_params)
+        self.status_var.set("Running auto demo...")
+        _watch_job(self, self._job, self._on_demo_chunks, self._on_demo_done)
 
+    def _show_latest(self, result: dict[str, np.ndarray]) -> None:
         self.current_position = float(result["position"][-1])
         self.current_force = float(result["force"][-1])
         self.current_penetration = float(result["penetration"][-1])
         self.session_start_time = perf_counter() - float(result["time"][-1])
 
+    def _show_demo(self, result: dict[str, np.ndarray]) -> None:
+        self.log.clear()
+        self.log.extend(result)
+        self._show_latest(result)
         self._redraw_canvas()
         self._update_plot()
-        self.status_var.set(
-            "Auto demo complete. Drag the handle to compare your manual interaction."
-        )
+
+    def _on_demo_chunks(self, chunks: list[dict[str, np.ndarray]]) -> None:
+        # Only the new rows are appended; the render tick plots them
+        # incrementally, like the rows of an interactive drag.
+        if self._demo_rows == 0:
+            self.log.clear()
+            self._unplotted_rows = 0
+        for chunk in chunks:
+            self.log.extend(chunk)
+            rows = len(chunk["time"])
+            self._demo_rows += rows
+            self._schedule_render(rows)
+        self._show_latest(chunks[-1])
+        self.status_var.set(f"Running auto demo... t = {chunks[-1]['time'][-1]:.2f} s")
+
+    def _on_demo_done(self, job: BackgroundJob) -> None:
+        self._job = None
+        streamed, self._demo_rows = self._demo_rows, 0
+        if job.cancelled:
+            self.status_var.set("Auto demo cancelled; the partial run stays in the log.")
+            return
+        if _job_failed(job):
+            return
+
+        result = job.result
+        if streamed != len(result["time"]):
+            # The passivity run arrives in one piece.
+            self._show_demo(result)
+        message = "Auto demo complete. Drag the handle to compare your manual interaction."
+        if "passivity_energy" in result:
+            message += f" Observed energy: {float(result['passivity_energy'][-1]):.3f} J."
+        self.status_var.set(message)
+        _record_run(self, self.status_var, "simulate_virtual_wall", result, self._demo_params)
+
+    def open_history(self) -> None:
+        if self._job is not None:
+            self.status_var.set("The auto demo is running; cancel it before loading a run.")
+            return
+        if self._physics is not None:
+            return
+        loaded = _load_run(self, "simulate_virtual_wall")
+        if loaded is None:
+            return
+        run_id, result = loaded
+        self._show_demo(result)
+        self.status_var.set(f"Loaded run {run_id} from the history.")
+
+    def cancel(self) -> None:
+        if self._job is not None:
+            self._job.cancel()
+            self.status_var.set("Cancelling...")
 
     def clear_log(self) -> None:
-        self.log_time.clear()
-        self.log_position.clear()
-        self.log_velocity.clear()
-        self.log_force.clear()
-        self.log_penetration.clear()
+        if self._job is not None:
+            self.status_var.set("The auto demo is running; cancel it before clearing the log.")
+            return
+        if self._physics is not None:
+            return
+        self.log.clear()
         self.session_start_time = None
         self.current_force = 0.0
         self.current_penetration = max(
@@ -715,39 +1360,33 @@ class VirtualWallTab(ttk.Frame):
         self._update_plot()
         self.status_var.set("Interaction log cleared.")
 
-    def export_csv(self) -> None:
-        if not self.log_time:
+    def export_data(self) -> None:
+        if not self.log:
             messagebox.showwarning(
                 "No data",
                 "Run auto demo or interact with the wall before exporting.",
             )
             return
 
-        output_path = filedialog.asksaveasfilename(
-            title="Save Virtual Wall Data",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+        message = None
+        if self.log.dropped > self.log.spilled:
+            message = (
+                f"Saved the last {len(self.log)} samples to {{path}} "
+                f"({self.log.dropped - self.log.spilled} older samples were dropped)."
+            )
+        # Copied, since the log keeps changing while the export runs.
+        blocks = [
+            {name: np.array(values) for name, values in block.items()}
+            for block in self.log.iter_blocks()
+        ]
+        _start_export(
+            self,
+            self.status_var,
+            "Save Virtual Wall Data",
+            blocks,
+            list(_WALL_SIGNALS),
+            done_message=message,
         )
-        if not output_path:
-            return
-
-        data = np.column_stack(
-            [
-                np.array(self.log_time),
-                np.array(self.log_position),
-                np.array(self.log_velocity),
-                np.array(self.log_force),
-                np.array(self.log_penetration),
-            ]
-        )
-        np.savetxt(
-            output_path,
-            data,
-            delimiter=",",
-            header="time,position,velocity,force,penetration",
-            comments="",
-        )
-        self.status_var.set(f"Saved virtual wall data to {output_path}")
 
 
 class HapticWorkbenchApp(tk.Tk):
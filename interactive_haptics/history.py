@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+
+from .export import export_result, load_result
+from .storage import header_path
+
+# Run history in SQLite. Each saved run is one row in ``runs`` with the
+# function, library version and creation time as indexed columns and the full
+# parameters as JSON. Every numeric parameter is also a row in ``run_params``,
+# which is indexed on (name, value), so filters such as kp > 10 are answered
+# from the index instead of by decoding JSON. Trajectories up to
+# ``blob_limit`` bytes are stored in the row as a compressed .npz blob. Larger
+# ones go to a sidecar trajectory .npy next to the database and load back as
+# memmaps. After every save, the retention policy deletes unpinned runs,
+# oldest first, while there are more than ``max_runs`` of them, while the
+# oldest is older than ``max_age`` seconds, or while the stored trajectories
+# exceed ``max_bytes``. Pinned runs (presets) are never pruned.
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    function TEXT NOT NULL,
+    version TEXT NOT NULL,
+    created REAL NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    pinned INTEGER NOT NULL DEFAULT 0,
+    params TEXT NOT NULL,
+    signals TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    data BLOB,
+    sidecar TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_function_created ON runs (function, created);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created);
+CREATE INDEX IF NOT EXISTS runs_retention ON runs (pinned, created, id, bytes);
+CREATE TABLE IF NOT EXISTS run_params (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_params_name_value ON run_params (name, value, run_id);
+"""
+
+_OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+_COLUMNS = "id, function, version, created, label, pinned, params, signals, rows, bytes"
+
+
+@dataclass
+class RunRecord:
+    id: int
+    function: str
+    version: str
+    created: float
+    label: str
+    pinned: bool
+    params: dict[str, Any] = field(default_factory=dict)
+    signals: list[str] = field(default_factory=list)
+    rows: int = 0
+    bytes: int = 0
+
+
+class RunStore:
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_runs: int | None = None,
+        max_age: float | None = None,
+        max_bytes: int | None = None,
+        blob_limit: int = 8 * 2**20,
+    ) -> None:
+        limits = {"max_runs": max_runs, "max_age": max_age, "max_bytes": max_bytes}
+        for name, value in limits.items():
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0")
+        if blob_limit < 0:
+            raise ValueError("blob_limit must be >= 0")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sidecar_directory = self.path.with_name(self.path.name + ".runs")
+        self.max_runs = max_runs
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.blob_limit = blob_limit
+        self._lock = threading.Lock()
+        # One connection shared by the UI thread and background jobs; every
+        # use goes through _lock.
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        # With WAL, NORMAL only syncs at checkpoints and stays crash-safe.
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        with self._db:
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> RunStore:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def save(
+        self,
+        function: str,
+        result: Mapping[str, np.ndarray],
+        params: Mapping[str, Any] | None = None,
+        label: str = "",
+        pinned: bool = False,
+        version: str | None = None,
+        created: float | None = None,
+    ) -> int:
+        if version is None:
+            from . import __version__
+
+            version = __version__
+        params = dict(params or {})
+        signals = list(result)
+        rows = len(result[signals[0]]) if signals else 0
+        size = sum(np.asarray(values).nbytes for values in result.values())
+        blob = None
+        if size <= self.blob_limit:
+            buffer = io.BytesIO()
+            np.savez_compressed(
+                buffer, **{name: np.asarray(values) for name, values in result.items()}
+            )
+            blob = buffer.getvalue()
+
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT INTO runs (function, version, created, label, pinned, params, signals,"
+                " rows, bytes, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    function,
+                    version,
+                    time.time() if created is None else created,
+                    label,
+                    int(pinned),
+                    json.dumps(params),
+                    json.dumps(signals),
+                    rows,
+                    size if blob is None else len(blob),
+                    blob,
+                ),
+            )
+            run_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO run_params (run_id, name, value) VALUES (?, ?, ?)",
+                [
+                    (run_id, name, float(value))
+                    for name, value in params.items()
+                    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+                ],
+            )
+            if blob is None:
+                sidecar = self.sidecar_directory / f"{run_id}.npy"
+                self.sidecar_directory.mkdir(exist_ok=True)
+                export_result(sidecar, result, signals, function=function, params=params)
+                self._db.execute(
+                    "UPDATE runs SET sidecar = ? WHERE id = ?", (sidecar.name, run_id)
+                )
+        self.prune()
+        return run_id
+
+    def _record(self, row: tuple) -> RunRecord:
+        run_id, function, version, created, label, pinned, params, signals, rows, size = row
+        return RunRecord(
+            id=run_id,
+            function=function,
+            version=version,
+            created=created,
+            label=label,
+            pinned=bool(pinned),
+            params=json.loads(params),
+            signals=json.loads(signals),
+            rows=rows,
+            bytes=size,
+        )
+
+    def get(self, run_id: int) -> RunRecord:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(run_id)
+        return self._record(row)
+
+    def query(
+        self,
+        function: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        where: Mapping[str, Any] | None = None,
+        label: str | None = None,
+        limit: int | None = None,
+    ) -> list[RunRecord]:
+        # Newest first. ``where`` maps a parameter name to a value (equality)
+        # or to an (operator, value) pair, e.g. {"kp": (">", 10)}.
+        clauses, args = [], []
+        if function is not None:
+            clauses.append("function = ?")
+            args.append(function)
+        if since is not None:
+            clauses.append("created >= ?")
+            args.append(since)
+        if until is not None:
+            clauses.append("created < ?")
+            args.append(until)
+        if label is not None:
+            clauses.append("label = ?")
+            args.append(label)
+        for name, condition in (where or {}).items():
+            operator, value = condition if isinstance(condition, tuple) else ("=", condition)
+            if operator not in _OPERATORS:
+                raise ValueError(f"unsupported operator {operator!r}; use one of {_OPERATORS}")
+            clauses.append(
+                f"id IN (SELECT run_id FROM run_params WHERE name = ? AND value {operator} ?)"
+            )
+            args.extend([name, float(value)])
+        sql = f"SELECT {_COLUMNS} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [self._record(row) for row in rows]
+
+    def load(self, run_id: int) -> dict[str, np.ndarray]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, sidecar FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(run_id)
+        data, sidecar = row
+        if sidecar is not None:
+            return load_result(self.sidecar_directory / sidecar)
+        with np.load(io.BytesIO(data)) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    def update(self, run_id: int, label: str | None = None, pinned: bool | None = None) -> None:
+        with self._lock, self._db:
+            if label is not None:
+                self._db.execute("UPDATE runs SET label = ? WHERE id = ?", (label, run_id))
+            if pinned is not None:
+                self._db.execute("UPDATE runs SET pinned = ? WHERE id = ?", (int(pinned), run_id))
+
+    def delete(self, run_id: int) -> None:
+        self._delete([run_id])
+
+    def _delete(self, run_ids: list[int]) -> None:
+        if not run_ids:
+            return
+        with self._lock, self._db:
+            sidecars = [
+                name
+                for (name,) in self._db.execute(
+                    f"SELECT sidecar FROM runs WHERE sidecar IS NOT NULL AND id IN"
+                    f" ({', '.join('?' * len(run_ids))})",
+                    run_ids,
+                )
+            ]
+            self._db.executemany(
+                "DELETE FROM runs WHERE id = ?", [(run_id,) for run_id in run_ids]
+            )
+        for name in sidecars:
+            sidecar = self.sidecar_directory / name
+            sidecar.unlink(missing_ok=True)
+            header_path(sidecar).unlink(missing_ok=True)
+
+    def prune(self, now: float | None = None) -> list[int]:
+        # Applies the retention policy to unpinned runs, oldest first, and
+        # returns the ids it deleted. The oldest runs are read lazily from the
+        # retention index, so a prune that deletes nothing reads one row.
+        if self.max_runs is None and self.max_age is None and self.max_bytes is None:
+            return []
+        now = time.time() if now is None else now
+        doomed = []
+        with self._lock:
+            remaining = self._db.execute("SELECT COUNT(*) FROM runs WHERE pinned = 0").fetchone()[0]
+            total = 0
+            if self.max_bytes is not None:
+                total = self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM runs").fetchone()[0]
+            oldest = self._db.execute(
+                "SELECT id, created, bytes FROM runs WHERE pinned = 0 ORDER BY created, id"
+            )
+            for run_id, created, size in oldest:
+                too_many = self.max_runs is not None and remaining > self.max_runs
+                too_old = self.max_age is not None and now - created > self.max_age
+                too_big = self.max_bytes is not None and total > self.max_bytes
+                if not (too_many or too_old or too_big):
+                    break
+                doomed.append(run_id)
+                remaining -= 1
+                total -= size
+            oldest.close()
+        self._delete(doomed)
+        return doomed
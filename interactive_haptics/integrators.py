@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+import numpy as np
+
+# Integrators for the mass-spring-damper dynamics shared by the PID plant and
+# the admittance model, m * a = F(t) - c * v - k * x, stepped over whole
+# batches of (N,) states at once. Sample ``i`` is the state after integrating
+# over [t_i, t_i + dt], which is the convention of the original Euler loops.
+#
+# - symplectic_euler: the original update (v first, then x with the new v).
+#   This is what the backends implement; the functions here are only used for
+#   the other methods.
+# - rk4: classic fourth-order Runge-Kutta.
+# - implicit_midpoint: A-stable, second order and energy-conserving for the
+#   undamped spring; the linear system makes the implicit solve closed form.
+# - rk45: Dormand-Prince 5(4) with per-run step-size control between samples.
+
+INTEGRATORS = ("symplectic_euler", "rk4", "implicit_midpoint", "rk45")
+
+# Convergence order and the explicit stability limit on h * |lambda| along
+# the imaginary axis (the undamped oscillator). Implicit midpoint has none.
+_ORDER = {"symplectic_euler": 1, "rk4": 4, "implicit_midpoint": 2, "rk45": 5}
+_STABILITY = {"symplectic_euler": 2.0, "rk4": 2.8, "implicit_midpoint": math.inf, "rk45": 3.3}
+
+_DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_B5 = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0)
+_DP_B4 = (5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+
+ForceFunction = Callable[[float | np.ndarray], np.ndarray]
+
+
+def check_integrator(name: str, backend: str = "auto") -> None:
+    if name not in INTEGRATORS:
+        raise ValueError(f"unknown integrator {name!r}; expected one of {list(INTEGRATORS)}")
+    # Only symplectic Euler has backend kernels; the other methods are NumPy.
+    if name != "symplectic_euler" and backend != "auto":
+        raise ValueError(
+            f"backend={backend!r} only applies to symplectic_euler; "
+            f"leave it at 'auto' for integrator={name!r}"
+        )
+
+
+def _fastest_mode(stiffness: float, damping: float, mass: float) -> float:
+    # Largest |eigenvalue| of the linear system [[0, 1], [-k/m, -c/m]].
+    if mass <= 0:
+        raise ValueError("mass must be > 0")
+    trace = -damping / mass
+    det = stiffness / mass
+    disc = trace * trace - 4.0 * det
+    if disc >= 0:
+        root = math.sqrt(disc)
+        return max(abs(0.5 * (trace + root)), abs(0.5 * (trace - root)))
+    return math.sqrt(det)
+
+
+def recommend_dt(
+    stiffness: float,
+    damping: float = 0.0,
+    mass: float = 1.0,
+    integrator: str = "symplectic_euler",
+    tolerance: float = 1e-3,
+) -> float:
+    # For the closed PID loop pass stiffness + kp and damping + kd.
+    # An order-p method has an error of roughly (h * |lambda|)^p per unit of
+    # phase, so h = tolerance^(1/p) / |lambda|, kept at half the explicit
+    # stability limit so a stiff mode cannot blow up between samples.
+    check_integrator(integrator)
+    if not 0.0 < tolerance < 1.0:
+        raise ValueError("tolerance must be in (0, 1)")
+    rate = _fastest_mode(stiffness, damping, mass)
+    if rate == 0:
+        return math.inf
+    accuracy = tolerance ** (1.0 / _ORDER[integrator]) / rate
+    return min(accuracy, 0.5 * _STABILITY[integrator] / rate)
+
+
+def _acceleration(
+    force: np.ndarray | float,
+    x: np.ndarray,
+    v: np.ndarray,
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    mass: np.ndarray,
+) -> np.ndarray:
+    return (force - damping * v - stiffness * x) / mass
+
+
+def _rk4_step(
+    t: float,
+    h: float,
+    x: np.ndarray,
+    v: np.ndarray,
+    force: ForceFunction,
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    mass: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    k1x = v
+    k1v = _acceleration(force(t), x, v, stiffness, damping, mass)
+    mid = force(t + 0.5 * h)
+    k2x = v + 0.5 * h * k1v
+    k2v = _acceleration(mid, x + 0.5 * h * k1x, k2x, stiffness, damping, mass)
+    k3x = v + 0.5 * h * k2v
+    k3v = _acceleration(mid, x + 0.5 * h * k2x, k3x, stiffness, damping, mass)
+    k4x = v + h * k3v
+    k4v = _acceleration(force(t + h), x + h * k3x, k4x, stiffness, damping, mass)
+    x_next = x + h / 6.0 * (k1x + 2.0 * k2x + 2.0 * k3x + k4x)
+    v_next = v + h / 6.0 * (k1v + 2.0 * k2v + 2.0 * k3v + k4v)
+    return x_next, v_next
+
+
+def _implicit_midpoint_step(
+    t: float,
+    h: float,
+    x: np.ndarray,
+    v: np.ndarray,
+    force: ForceFunction,
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    mass: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # (I - h/2 A) y1 = (I + h/2 A) y0 + h b(t + h/2), solved in closed form.
+    half_k = 0.5 * h * stiffness / mass
+    half_c = 0.5 * h * damping / mass
+    r1 = x + 0.5 * h * v
+    r2 = v - half_k * x - half_c * v + h * force(t + 0.5 * h) / mass
+    det = 1.0 + half_c + 0.5 * h * half_k
+    x_next = ((1.0 + half_c) * r1 + 0.5 * h * r2) / det
+    v_next = (r2 - half_k * r1) / det
+    return x_next, v_next
+
+
+def _dormand_prince(
+    t: np.ndarray,
+    h: np.ndarray,
+    x: np.ndarray,
+    v: np.ndarray,
+    force: ForceFunction,
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    mass: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    kx: list[np.ndarray] = []
+    kv: list[np.ndarray] = []
+    for stage, (c, row) in enumerate(zip(_DP_C, _DP_A)):
+        xs = x + h * sum(a * kx[j] for j, a in enumerate(row) if a) if stage else x
+        vs = v + h * sum(a * kv[j] for j, a in enumerate(row) if a) if stage else v
+        kx.append(vs)
+        kv.append(_acceleration(force(t + c * h), xs, vs, stiffness, damping, mass))
+    # The seventh stage is evaluated at the fifth-order solution (FSAL).
+    x5, v5 = xs, vs
+    x_err = h * sum((b5 - b4) * k for b5, b4, k in zip(_DP_B5, _DP_B4, kx))
+    v_err = h * sum((b5 - b4) * k for b5, b4, k in zip(_DP_B5, _DP_B4, kv))
+    return x5, v5, x_err, v_err
+
+
+def _rk45_sample(
+    t: float,
+    dt: float,
+    x: np.ndarray,
+    v: np.ndarray,
+    h: np.ndarray,
+    force: ForceFunction,
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    mass: np.ndarray,
+    rtol: float,
+    atol: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Advances every run by exactly dt, each with its own step size, which is
+    # carried into the next sample.
+    elapsed = np.zeros_like(x)
+    while True:
+        remaining = dt - elapsed
+        active = remaining > 1e-12 * dt
+        if not active.any():
+            return x, v, h
+        step = np.where(active, np.minimum(h, remaining), 0.0)
+        x_new, v_new, x_err, v_err = _dormand_prince(
+            t + elapsed, step, x, v, force, stiffness, damping, mass
+        )
+        scale_x = atol + rtol * np.maximum(np.abs(x), np.abs(x_new))
+        scale_v = atol + rtol * np.maximum(np.abs(v), np.abs(v_new))
+        error = np.maximum(np.abs(x_err) / scale_x, np.abs(v_err) / scale_v)
+        # A run whose state has overflowed never gets a finite error again,
+        # so no step would be accepted; it is finished with NaN instead.
+        diverged = active & ~np.isfinite(error)
+        accepted = active & (error <= 1.0)
+        x = np.where(accepted, x_new, np.where(diverged, np.nan, x))
+        v = np.where(accepted, v_new, np.where(diverged, np.nan, v))
+        elapsed = np.where(accepted | diverged, elapsed + step, elapsed)
+        with np.errstate(divide="ignore"):
+            factor = np.clip(0.9 * error ** -0.2, 0.2, 5.0)
+        factor = np.where(np.isfinite(factor), factor, 5.0)
+        h = np.where(active, np.minimum(step * factor, dt), h)
+
+
+_FIXED_STEPS = {"rk4": _rk4_step, "implicit_midpoint": _implicit_midpoint_step}
+
+
+class _Stepper:
+    def __init__(
+        self,
+        integrator: str,
+        stiffness: np.ndarray,
+        damping: np.ndarray,
+        mass: np.ndarray,
+        dt: float,
+        rtol: float,
+        atol: float,
+    ) -> None:
+        check_integrator(integrator)
+        if integrator == "symplectic_euler":
+            raise ValueError("symplectic_euler runs through the simulation backends")
+        if rtol <= 0 or atol <= 0:
+            raise ValueError("rtol and atol must be > 0")
+        self.integrator = integrator
+        self.stiffness = stiffness
+        self.damping = damping
+        self.mass = mass
+        self.dt = dt
+        self.rtol = rtol
+        self.atol = atol
+        self._h = np.full(len(stiffness), dt)
+
+    def __call__(
+        self, t: float, x: np.ndarray, v: np.ndarray, force: ForceFunction
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if self.integrator == "rk45":
+            x, v, self._h = _rk45_sample(
+                t,
+                self.dt,
+                x,
+                v,
+                self._h,
+                force,
+                self.stiffness,
+                self.damping,
+                self.mass,
+                self.rtol,
+                self.atol,
+            )
+            return x, v
+        step = _FIXED_STEPS[self.integrator]
+        return step(t, self.dt, x, v, force, self.stiffness, self.damping, self.mass)
+
+
+def integrate_admittance(
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    mass: np.ndarray,
+    force_amplitude: np.ndarray,
+    force_frequency_hz: np.ndarray,
+    time: np.ndarray,
+    dt: float,
+    integrator: str,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> tuple[np.ndarray, np.ndarray]:
+    # The sinusoidal drive is evaluated continuously inside each step instead
+    # of being held at the sample value.
+    stepper = _Stepper(integrator, stiffness, damping, mass, dt, rtol, atol)
+    omega = 2.0 * np.pi * force_frequency_hz
+
+    def force(t: float | np.ndarray) -> np.ndarray:
+        return force_amplitude * np.sin(omega * t)
+
+    position = np.empty((len(stiffness), len(time)))
+    velocity = np.empty((len(stiffness), len(time)))
+    x = np.zeros(len(stiffness))
+    v = np.zeros(len(stiffness))
+    for idx, t in enumerate(time):
+        x, v = stepper(float(t), x, v, force)
+        position[:, idx] = x
+        velocity[:, idx] = v
+    return position, velocity
+
+
+def integrate_pid(
+    kp: np.ndarray,
+    ki: np.ndarray,
+    kd: np.ndarray,
+    target: np.ndarray,
+    plant_mass: np.ndarray,
+    plant_damping: np.ndarray,
+    plant_stiffness: np.ndarray,
+    integral_limit: np.ndarray,
+    output_limit: np.ndarray,
+    n_steps: int,
+    dt: float,
+    integrator: str,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The controller stays a discrete update at every sample; only the plant
+    # between samples (with the control force held) uses the integrator.
+    stepper = _Stepper(integrator, plant_stiffness, plant_damping, plant_mass, dt, rtol, atol)
+    size = len(kp)
+    position = np.empty((size, n_steps))
+    velocity = np.empty((size, n_steps))
+    control_signal = np.empty((size, n_steps))
+    x = np.zeros(size)
+    v = np.zeros(size)
+    integral = np.zeros(size)
+    prev_error = np.zeros(size)
+    for idx in range(n_steps):
+        error = target - x
+        integral = np.clip(integral + error * dt, -integral_limit, integral_limit)
+        u = kp * error + ki * integral + kd * ((error - prev_error) / dt)
+        u = np.clip(u, -output_limit, output_limit)
+        prev_error = error
+        x, v = stepper(idx * dt, x, v, lambda _t, u=u: u)
+        position[:, idx] = x
+        velocity[:, idx] = v
+        control_signal[:, idx] = u
+    return position, velocity, control_signal
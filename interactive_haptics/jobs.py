@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable
+
+# Background jobs for the GUI. A job runs ``target(job, *args, **kwargs)`` on a
+# daemon worker thread and never touches widgets: partial results go through
+# job.emit() into a queue that the UI thread drains with poll(), typically from
+# Tk's after() loop, so the event loop keeps running while the job computes.
+# The simulations spend their time in NumPy, which releases the GIL, so a
+# thread is enough and the results need no pickling.
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class BackgroundJob:
+    def __init__(self, target: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.cancelled = False
+        self._chunks: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(target, args, kwargs), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, target: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> None:
+        try:
+            self.result = target(self, *args, **kwargs)
+        except JobCancelled:
+            self.cancelled = True
+        except BaseException as err:  # handed to the UI thread through .error
+            self.error = err
+        finally:
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def check(self) -> None:
+        # Cancellation point for the target: raises once cancel() was called.
+        if self._cancel.is_set():
+            raise JobCancelled
+
+    def emit(self, chunk: Any) -> None:
+        self.check()
+        self._chunks.put(chunk)
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def poll(self) -> list[Any]:
+        # Everything emitted since the last poll. Read ``done`` before polling:
+        # once it is set, that poll is guaranteed to return the last chunks.
+        chunks = []
+        while True:
+            try:
+                chunks.append(self._chunks.get_nowait())
+            except queue.Empty:
+                return chunks
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .control import PIDController, _build_time_vector
+
+
+def _matrix_powers(a: np.ndarray, count: int) -> np.ndarray:
+    n = a.shape[0]
+    powers = np.empty((count, n, n))
+    powers[0] = np.eye(n)
+    filled = 1
+    while filled < count:
+        take = min(filled, count - filled)
+        step = powers[filled - 1] @ a
+        powers[filled : filled + take] = powers[:take] @ step
+        filled += take
+    return powers
+
+
+# Exact propagation of x[k+1] = A x[k] + B w[k], y[k] = C x[k] + D w[k].
+# Transition-matrix powers and the FFT of the impulse response are built once
+# per block size; each block is then one batched matrix product for the free
+# response plus an FFT convolution for the forced response. An unstable A makes
+# the impulse response explode, and its FFT round-off then swamps even the
+# first samples, so such systems are stepped sample by sample instead.
+class LTIPropagator:
+    def __init__(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        d: np.ndarray,
+        block_size: int = 4096,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1")
+        self.a = np.atleast_2d(np.asarray(a, dtype=float))
+        self.b = np.asarray(b, dtype=float).reshape(self.a.shape[0], -1)
+        self.c = np.atleast_2d(np.asarray(c, dtype=float))
+        self.d = np.asarray(d, dtype=float).reshape(self.c.shape[0], -1)
+        self.block_size = int(block_size)
+
+        # A spectral radius of one (an undamped spring) keeps the powers bounded
+        # up to rounding; anything that grows over a block is unstable here.
+        radius = max(float(np.max(np.abs(np.linalg.eigvals(self.a)))), 1.0)
+        self.stable = self.block_size * np.log(radius) < np.log(2.0)
+        if self.stable:
+            powers = _matrix_powers(self.a, self.block_size + 1)
+            self.stable = bool(np.isfinite(powers).all())
+        if not self.stable:
+            return
+        self._free = powers[1:]
+        impulse = powers[:-1] @ self.b
+        self._step = np.cumsum(impulse, axis=0)
+        self._n_fft = 1 << int(2 * self.block_size - 1).bit_length()
+        self._impulse_fft = np.fft.rfft(impulse, n=self._n_fft, axis=0)
+
+    def _check_length(self, length: int) -> None:
+        if length > self.block_size:
+            raise ValueError("inputs longer than block_size")
+
+    def _outputs(self, x0: np.ndarray, states: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        previous = np.vstack([x0[None, :], states[:-1]])
+        return previous @ self.c.T + inputs @ self.d.T
+
+    def _stepped(self, x0: np.ndarray, inputs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        a, b = self.a, self.b
+        states = np.empty((len(inputs), a.shape[0]))
+        state = x0
+        for k, w in enumerate(inputs):
+            state = a @ state + b @ w
+            states[k] = state
+        return states, self._outputs(x0, states, inputs)
+
+    def block(self, x0: np.ndarray, inputs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        inputs = np.asarray(inputs, dtype=float).reshape(len(inputs), -1)
+        length = len(inputs)
+        self._check_length(length)
+
+        x0 = np.asarray(x0, dtype=float)
+        if not self.stable:
+            return self._stepped(x0, inputs)
+        input_fft = np.fft.rfft(inputs, n=self._n_fft, axis=0)
+        forced = np.fft.irfft(
+            np.einsum("fil,fl->fi", self._impulse_fft, input_fft), n=self._n_fft, axis=0
+        )[:length]
+        states = self._free[:length] @ x0 + forced
+        return states, self._outputs(x0, states, inputs)
+
+    def block_constant(
+        self, x0: np.ndarray, level: np.ndarray | float, length: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Held input: the forced response is the step response, no FFT needed,
+        # so the cost is proportional to ``length`` rather than the block size.
+        self._check_length(length)
+        level = np.asarray(level, dtype=float).reshape(-1)
+        x0 = np.asarray(x0, dtype=float)
+        if not self.stable:
+            return self._stepped(x0, np.broadcast_to(level, (length, level.size)))
+        states = self._free[:length] @ x0 + self._step[:length] @ level
+        inputs = np.broadcast_to(level, (length, level.size))
+        return states, self._outputs(x0, states, inputs)
+
+    def propagate(self, x0: np.ndarray, inputs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        inputs = np.asarray(inputs, dtype=float).reshape(len(inputs), -1)
+        states = np.empty((len(inputs), self.a.shape[0]))
+        outputs = np.empty((len(inputs), self.c.shape[0]))
+        state = np.asarray(x0, dtype=float)
+        for start in range(0, len(inputs), self.block_size):
+            stop = min(start + self.block_size, len(inputs))
+            states[start:stop], outputs[start:stop] = self.block(state, inputs[start:stop])
+            state = states[stop - 1]
+        return states, outputs
+
+
+def admittance_system(
+    stiffness: float, damping: float, mass: float, dt: float
+) -> tuple[np.ndarray, np.ndarray]:
+    # Semi-implicit Euler step of AdmittanceController with state (x, v).
+    if mass <= 0:
+        raise ValueError("mass must be > 0")
+    k = dt * stiffness / mass
+    c = 1.0 - dt * damping / mass
+    a = np.array([[1.0 - dt * k, dt * c], [-k, c]])
+    b = np.array([[dt * dt / mass], [dt / mass]])
+    return a, b
+
+
+def pid_system(
+    kp: float,
+    ki: float,
+    kd: float,
+    plant_mass: float,
+    plant_damping: float,
+    plant_stiffness: float,
+    dt: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Unsaturated closed loop with state (x, v, integral, prev_error) and the
+    # setpoint as input; the output is the control signal of that step.
+    if plant_mass <= 0:
+        raise ValueError("plant_mass must be > 0")
+    gain = kp + ki * dt + kd / dt
+    c_u = np.array([[-gain, 0.0, ki, -kd / dt]])
+    d_u = np.array([[gain]])
+
+    accel = (c_u - np.array([[plant_stiffness, plant_damping, 0.0, 0.0]])) / plant_mass
+    v_row = np.array([[0.0, 1.0, 0.0, 0.0]]) + dt * accel
+    x_row = np.array([[1.0, 0.0, 0.0, 0.0]]) + dt * v_row
+    i_row = np.array([[-dt, 0.0, 1.0, 0.0]])
+    e_row = np.array([[-1.0, 0.0, 0.0, 0.0]])
+    a = np.vstack([x_row, v_row, i_row, e_row])
+
+    v_in = dt * d_u / plant_mass
+    b = np.vstack([dt * v_in, v_in, [[dt]], [[1.0]]])
+    return a, b, c_u, d_u
+
+
+class AdmittanceSolver:
+    # Stateful exact solver: each advance() continues from the last state.
+    def __init__(
+        self,
+        stiffness: float,
+        damping: float,
+        mass: float,
+        dt: float,
+        block_size: int = 4096,
+        position: float = 0.0,
+        velocity: float = 0.0,
+    ) -> None:
+        a, b = admittance_system(stiffness, damping, mass, dt)
+        self._propagator = LTIPropagator(a, b, np.eye(2), np.zeros((2, 1)), block_size)
+        self.state = np.array([position, velocity], dtype=float)
+
+    def advance(self, force: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if len(force) == 0:
+            return np.empty(0), np.empty(0)
+        states, _ = self._propagator.propagate(self.state, force)
+        self.state = states[-1].copy()
+        return states[:, 0].copy(), states[:, 1].copy()
+
+
+class PIDSolver:
+    # Stateful exact solver for the saturating PID loop. ``state`` holds
+    # (x, v, integral, prev_error) and carries over between advance() calls.
+    def __init__(
+        self,
+        kp: float,
+        ki: float,
+        kd: float,
+        target: float,
+        plant_mass: float,
+        plant_damping: float,
+        plant_stiffness: float,
+        integral_limit: float,
+        output_limit: float,
+        dt: float,
+        block_size: int = 4096,
+        resume_after: int = 8,
+        retry_window: int = 64,
+        state: np.ndarray | None = None,
+    ) -> None:
+        a, b, c_u, d_u = pid_system(
+            kp, ki, kd, plant_mass, plant_damping, plant_stiffness, dt
+        )
+        self._propagator = LTIPropagator(a, b, c_u, d_u, block_size=block_size)
+        self.target = float(target)
+        self.plant_mass = float(plant_mass)
+        self.plant_damping = float(plant_damping)
+        self.plant_stiffness = float(plant_stiffness)
+        self.dt = float(dt)
+        self.resume_after = resume_after
+        self.retry_window = retry_window
+
+        self.integral_limit = abs(integral_limit)
+        self.output_limit = abs(output_limit)
+        self._pid = PIDController(
+            kp=kp,
+            ki=ki,
+            kd=kd,
+            integral_limit=self.integral_limit if np.isfinite(self.integral_limit) else None,
+            output_limit=self.output_limit if np.isfinite(self.output_limit) else None,
+        )
+        self.state = np.zeros(4) if state is None else np.array(state, dtype=float)
+
+    def advance(self, n_steps: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        propagator = self._propagator
+        pid = self._pid
+        target, dt = self.target, self.dt
+        plant_mass, plant_damping, plant_stiffness = (
+            self.plant_mass,
+            self.plant_damping,
+            self.plant_stiffness,
+        )
+        integral_limit, output_limit = self.integral_limit, self.output_limit
+
+        position = np.empty(n_steps)
+        velocity = np.empty(n_steps)
+        control_signal = np.empty(n_steps)
+
+        state = self.state
+        window = propagator.block_size
+        idx = 0
+        while idx < n_steps:
+            take = min(window, n_steps - idx)
+            states, outputs = propagator.block_constant(state, target, take)
+            saturated = (np.abs(states[:, 2]) > integral_limit) | (
+                np.abs(outputs[:, 0]) > output_limit
+            )
+            accepted = int(np.argmax(saturated)) if saturated.any() else take
+
+            position[idx : idx + accepted] = states[:accepted, 0]
+            velocity[idx : idx + accepted] = states[:accepted, 1]
+            control_signal[idx : idx + accepted] = outputs[:accepted, 0]
+            idx += accepted
+            if accepted:
+                state = states[accepted - 1]
+            if accepted == take:
+                window = min(2 * window, propagator.block_size)
+                continue
+
+            # A limit is active: step the reference controller until it has been
+            # clear of both limits for a few samples, then resume exact propagation.
+            x, v, pid._integral, pid._prev_error = (float(value) for value in state)
+            quiet = 0
+            while idx < n_steps and quiet < self.resume_after:
+                u = pid.update(target, x, dt)
+                a_plant = (u - plant_damping * v - plant_stiffness * x) / plant_mass
+                v += a_plant * dt
+                x += v * dt
+
+                position[idx] = x
+                velocity[idx] = v
+                control_signal[idx] = u
+                idx += 1
+                clipped = abs(pid._integral) >= integral_limit or abs(u) >= output_limit
+                quiet = 0 if clipped else quiet + 1
+            state = np.array([x, v, pid._integral, pid._prev_error])
+            # Short retry windows keep chattering saturation from paying for a
+            # full block per attempt; the window doubles while runs stay linear.
+            window = min(self.retry_window, propagator.block_size)
+
+        self.state = np.array(state, dtype=float)
+        return position, velocity, control_signal
+
+
+def admittance_trajectory(
+    stiffness: float,
+    damping: float,
+    mass: float,
+    force: np.ndarray,
+    dt: float,
+    block_size: int = 4096,
+) -> tuple[np.ndarray, np.ndarray]:
+    solver = AdmittanceSolver(stiffness, damping, mass, dt, min(block_size, len(force)))
+    return solver.advance(force)
+
+
+def pid_trajectory(
+    kp: float,
+    ki: float,
+    kd: float,
+    target: float,
+    plant_mass: float,
+    plant_damping: float,
+    plant_stiffness: float,
+    integral_limit: float,
+    output_limit: float,
+    n_steps: int,
+    dt: float,
+    block_size: int = 4096,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    solver = PIDSolver(
+        kp,
+        ki,
+        kd,
+        target,
+        plant_mass,
+        plant_damping,
+        plant_stiffness,
+        integral_limit,
+        output_limit,
+        dt,
+        block_size=min(block_size, n_steps),
+    )
+    return solver.advance(n_steps)
+
+
+def simulate_admittance_lti(
+    stiffness: float = 45.0,
+    damping: float = 14.0,
+    mass: float = 1.0,
+    force_amplitude: float = 12.0,
+    force_frequency_hz: float = 0.6,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    block_size: int = 4096,
+) -> dict[str, np.ndarray]:
+    time = _build_time_vector(duration, dt)
+    force = force_amplitude * np.sin(2.0 * np.pi * force_frequency_hz * time)
+    position, velocity = admittance_trajectory(
+        stiffness, damping, mass, force, dt, block_size=block_size
+    )
+    return {
+        "time": time,
+        "position": position,
+        "velocity": velocity,
+        "force": force,
+    }
+
+
+def simulate_pid_lti(
+    kp: float = 12.0,
+    ki: float = 1.2,
+    kd: float = 0.4,
+    target: float = 0.15,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    plant_mass: float = 1.0,
+    plant_damping: float = 5.0,
+    plant_stiffness: float = 20.0,
+    block_size: int = 4096,
+) -> dict[str, np.ndarray]:
+    time = _build_time_vector(duration, dt)
+    position, velocity, control_signal = pid_trajectory(
+        kp,
+        ki,
+        kd,
+        target,
+        plant_mass,
+        plant_damping,
+        plant_stiffness,
+        integral_limit=10.0,
+        output_limit=120.0,
+        n_steps=len(time),
+        dt=dt,
+        block_size=block_size,
+    )
+    return {
+        "time": time,
+        "position": position,
+        "velocity": velocity,
+        "control": control_signal,
+        "target": np.full_like(time, target),
+    }
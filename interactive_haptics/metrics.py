@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import numpy as np
+
+# Step-response and tracking metrics over trajectory batches. Signals are
+# (..., T) arrays with time along the last axis (a single run is just (T,)),
+# ``time`` is (T,) or broadcastable to the signals, and per-run values such as
+# ``target`` are scalars or arrays of the leading batch shape. Every function
+# reduces the time axis with whole-array NumPy operations and returns an array
+# of the batch shape, or a float for a single run. Runs where a metric is
+# undefined (a step that never reaches 90%, a response that never settles)
+# get NaN.
+
+
+def _per_run(value: float | np.ndarray) -> np.ndarray:
+    return np.asarray(value, dtype=float)[..., None]
+
+
+def _finish(value: np.ndarray) -> float | np.ndarray:
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def _trapezoid(values: np.ndarray, time: np.ndarray) -> np.ndarray:
+    dt = np.diff(np.asarray(time, dtype=float), axis=-1)
+    return np.sum(0.5 * (values[..., 1:] + values[..., :-1]) * dt, axis=-1)
+
+
+def _step(position: np.ndarray, target: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Signed step size per run, and its magnitude with 1.0 standing in for a
+    # zero step so relative metrics stay finite.
+    step = _per_run(target) - position[..., :1]
+    scale = np.abs(step)
+    return step, np.where(scale > 0, scale, 1.0)
+
+
+def _first_true(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return np.argmax(mask, axis=-1), mask.any(axis=-1)
+
+
+def _time_at(time: np.ndarray, index: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    time = np.broadcast_to(np.asarray(time, dtype=float), shape)
+    return np.take_along_axis(time, index[..., None], axis=-1)[..., 0] - time[..., 0]
+
+
+def rise_time(
+    time: np.ndarray,
+    position: np.ndarray,
+    target: float | np.ndarray,
+    low: float = 0.1,
+    high: float = 0.9,
+) -> float | np.ndarray:
+    if not 0.0 <= low < high <= 1.0:
+        raise ValueError("rise time fractions must satisfy 0 <= low < high <= 1")
+    position = np.asarray(position, dtype=float)
+    step, _scale = _step(position, target)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = (position - position[..., :1]) / step
+    start, reached_low = _first_true(fraction >= low)
+    stop, reached_high = _first_true(fraction >= high)
+    value = _time_at(time, stop, position.shape) - _time_at(time, start, position.shape)
+    valid = reached_low & reached_high & (step[..., 0] != 0)
+    return _finish(np.where(valid, value, np.nan))
+
+
+def overshoot(position: np.ndarray, target: float | np.ndarray) -> float | np.ndarray:
+    # Peak excursion past the target in the direction of the step, as a
+    # fraction of the step size.
+    position = np.asarray(position, dtype=float)
+    step, scale = _step(position, target)
+    direction = np.where(step >= 0, 1.0, -1.0)
+    excursion = np.max(direction * (position - _per_run(target)), axis=-1)
+    return _finish(np.maximum(0.0, excursion) / scale[..., 0])
+
+
+def settling_time(
+    time: np.ndarray,
+    position: np.ndarray,
+    target: float | np.ndarray,
+    band: float = 0.02,
+) -> float | np.ndarray:
+    # Time from the start after which the error stays within band * |step|.
+    if band <= 0:
+        raise ValueError("band must be > 0")
+    position = np.asarray(position, dtype=float)
+    _step_size, scale = _step(position, target)
+    outside = np.abs(_per_run(target) - position) > band * scale
+    samples = outside.shape[-1]
+    last_outside = samples - 1 - np.argmax(outside[..., ::-1], axis=-1)
+    index = np.where(outside.any(axis=-1), last_outside + 1, 0)
+    settled = index < samples
+    value = _time_at(time, np.minimum(index, samples - 1), position.shape)
+    return _finish(np.where(settled, value, np.nan))
+
+
+def steady_state_error(
+    position: np.ndarray, target: float | np.ndarray, window: float = 0.1
+) -> float | np.ndarray:
+    # Signed target - position, averaged over the final ``window`` fraction.
+    if not 0.0 < window <= 1.0:
+        raise ValueError("window must be in (0, 1]")
+    position = np.asarray(position, dtype=float)
+    tail = max(1, int(round(position.shape[-1] * window)))
+    return _finish(np.asarray(target, dtype=float) - np.mean(position[..., -tail:], axis=-1))
+
+
+def iae(time: np.ndarray, position: np.ndarray, target: float | np.ndarray) -> float | np.ndarray:
+    error = np.abs(_per_run(target) - np.asarray(position, dtype=float))
+    return _finish(_trapezoid(error, time))
+
+
+def ise(time: np.ndarray, position: np.ndarray, target: float | np.ndarray) -> float | np.ndarray:
+    error = _per_run(target) - np.asarray(position, dtype=float)
+    return _finish(_trapezoid(error * error, time))
+
+
+def itae(
+    time: np.ndarray, position: np.ndarray, target: float | np.ndarray
+) -> float | np.ndarray:
+    time = np.asarray(time, dtype=float)
+    error = np.abs(_per_run(target) - np.asarray(position, dtype=float))
+    return _finish(_trapezoid((time - time[..., :1]) * error, time))
+
+
+def peak_force(force: np.ndarray) -> float | np.ndarray:
+    return _finish(np.max(np.abs(np.asarray(force, dtype=float)), axis=-1))
+
+
+def contact_energy(
+    time: np.ndarray, force: np.ndarray, velocity: np.ndarray
+) -> float | np.ndarray:
+    # Net energy delivered into the environment, -integral(F * v) dt, where F
+    # is the force on the probe. Positive means the contact absorbed energy;
+    # negative means it gave back more than it took (active behaviour).
+    power = -np.asarray(force, dtype=float) * np.asarray(velocity, dtype=float)
+    return _finish(_trapezoid(power, time))
+
+
+def step_metrics(
+    time: np.ndarray,
+    position: np.ndarray,
+    target: float | np.ndarray,
+    band: float = 0.02,
+) -> dict[str, float | np.ndarray]:
+    return {
+        "rise_time": rise_time(time, position, target),
+        "overshoot": overshoot(position, target),
+        "settling_time": settling_time(time, position, target, band),
+        "steady_state_error": steady_state_error(position, target),
+        "iae": iae(time, position, target),
+        "ise": ise(time, position, target),
+        "itae": itae(time, position, target),
+    }
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .control import _build_time_vector
+
+# N-DOF counterparts of PIDController, AdmittanceController and
+# MassSpringDamperPlant. State lives in contiguous (*batch, dof) arrays, so one
+# update handles every axis of every batch row in a handful of NumPy calls.
+#
+# Gains (and masses) can be:
+# - a scalar: the same value on every axis
+# - a (dof,) vector: a diagonal matrix
+# - a (..., dof, dof) array: full matrices, with any leading axes acting as
+#   batch axes (per-row diagonal gains are k[..., None] * np.eye(dof))
+# Limits are per-axis boxes: a scalar or a (dof,) vector, None for no limit.
+# With diagonal gains every axis follows the 1-DOF classes operation for
+# operation.
+
+
+def _infer_dof(dof: int | None, **values: float | np.ndarray | None) -> int:
+    if dof is not None:
+        if dof < 1:
+            raise ValueError("dof must be >= 1")
+        return int(dof)
+    for value in values.values():
+        array = np.asarray(value if value is not None else 0.0)
+        if array.ndim:
+            return int(array.shape[-1])
+    raise ValueError("dof is required when every gain is a scalar")
+
+
+def _gain(value: float | np.ndarray, dof: int, name: str) -> np.ndarray:
+    array = np.asarray(value, dtype=float)
+    if array.ndim == 1 and array.shape != (dof,):
+        raise ValueError(f"{name} must have {dof} entries, got shape {array.shape}")
+    if array.ndim >= 2 and array.shape[-2:] != (dof, dof):
+        raise ValueError(f"{name} must be a ({dof}, {dof}) matrix, got shape {array.shape}")
+    return array
+
+
+def _batch_of(gain: np.ndarray) -> tuple[int, ...]:
+    return gain.shape[:-2] if gain.ndim >= 2 else ()
+
+
+def _apply(gain: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    if gain.ndim <= 1:
+        return gain * vector
+    return np.matmul(gain, vector[..., None])[..., 0]
+
+
+def _limit(value: float | np.ndarray | None, dof: int, name: str) -> np.ndarray:
+    if value is None:
+        return np.asarray(np.inf)
+    array = np.abs(np.asarray(value, dtype=float))
+    if array.ndim > 1 or (array.ndim == 1 and array.shape != (dof,)):
+        raise ValueError(f"{name} must be a scalar or have {dof} entries")
+    return array
+
+
+def _check_mass(mass: np.ndarray, name: str) -> np.ndarray | None:
+    # Returns the inverse of a full mass matrix, or None when dividing by a
+    # scalar/diagonal mass is enough.
+    if mass.ndim <= 1:
+        if np.any(mass <= 0):
+            raise ValueError(f"{name} must be > 0")
+        return None
+    if not np.allclose(mass, np.swapaxes(mass, -1, -2)):
+        raise ValueError(f"{name} must be symmetric")
+    try:
+        np.linalg.cholesky(mass)
+    except np.linalg.LinAlgError:
+        raise ValueError(f"{name} must be positive definite") from None
+    return np.linalg.inv(mass)
+
+
+def _state(
+    value: float | np.ndarray | None, shape: tuple[int, ...], name: str
+) -> np.ndarray:
+    state = np.zeros(shape)
+    if value is not None:
+        try:
+            state[...] = value
+        except ValueError:
+            raise ValueError(f"{name} does not broadcast to shape {shape}") from None
+    return state
+
+
+class PIDControllerND:
+    def __init__(
+        self,
+        kp: float | np.ndarray,
+        ki: float | np.ndarray,
+        kd: float | np.ndarray,
+        integral_limit: float | np.ndarray | None = None,
+        output_limit: float | np.ndarray | None = None,
+        dof: int | None = None,
+        batch_shape: tuple[int, ...] = (),
+    ) -> None:
+        self.dof = _infer_dof(dof, kp=kp, ki=ki, kd=kd)
+        self.kp = _gain(kp, self.dof, "kp")
+        self.ki = _gain(ki, self.dof, "ki")
+        self.kd = _gain(kd, self.dof, "kd")
+        self.integral_limit = _limit(integral_limit, self.dof, "integral_limit")
+        self.output_limit = _limit(output_limit, self.dof, "output_limit")
+        self.shape = (
+            *np.broadcast_shapes(
+                tuple(batch_shape), *(_batch_of(gain) for gain in (self.kp, self.ki, self.kd))
+            ),
+            self.dof,
+        )
+        self._integral = np.zeros(self.shape)
+        self._prev_error = np.zeros(self.shape)
+
+    def reset(self) -> None:
+        self._integral.fill(0.0)
+        self._prev_error.fill(0.0)
+
+    def snapshot(self) -> dict[str, list]:
+        return {"integral": self._integral.tolist(), "prev_error": self._prev_error.tolist()}
+
+    def restore(self, snapshot: dict[str, list]) -> None:
+        self._integral[...] = snapshot["integral"]
+        self._prev_error[...] = snapshot["prev_error"]
+
+    def update(
+        self, setpoint: float | np.ndarray, measurement: float | np.ndarray, dt: float
+    ) -> np.ndarray:
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+
+        error = np.broadcast_to(np.subtract(setpoint, measurement), self.shape)
+        integral = self._integral
+        integral += error * dt
+        np.clip(integral, -self.integral_limit, self.integral_limit, out=integral)
+
+        output = (
+            _apply(self.kp, error)
+            + _apply(self.ki, integral)
+            + _apply(self.kd, (error - self._prev_error) / dt)
+        )
+        np.clip(output, -self.output_limit, self.output_limit, out=output)
+
+        self._prev_error[...] = error
+        return output
+
+
+class _SecondOrderND:
+    # M a = f - D v - K x, stepped with the same semi-implicit Euler update as
+    # the 1-DOF classes.
+    _mass_name = "mass"
+
+    def __init__(
+        self,
+        stiffness: float | np.ndarray,
+        damping: float | np.ndarray,
+        mass: float | np.ndarray,
+        position: float | np.ndarray | None,
+        velocity: float | np.ndarray | None,
+        dof: int | None,
+        batch_shape: tuple[int, ...],
+    ) -> None:
+        self.dof = _infer_dof(
+            dof, stiffness=stiffness, damping=damping, mass=mass, position=position
+        )
+        self.stiffness = _gain(stiffness, self.dof, "stiffness")
+        self.damping = _gain(damping, self.dof, "damping")
+        self.mass = _gain(mass, self.dof, self._mass_name)
+        self._inverse_mass = _check_mass(self.mass, self._mass_name)
+        gains = (self.stiffness, self.damping, self.mass)
+        batch = np.broadcast_shapes(tuple(batch_shape), *(_batch_of(gain) for gain in gains))
+        self.shape = (*batch, self.dof)
+        self.position = _state(position, self.shape, "position")
+        self.velocity = _state(velocity, self.shape, "velocity")
+
+    def step(self, force: float | np.ndarray, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+
+        net = force - _apply(self.damping, self.velocity) - _apply(self.stiffness, self.position)
+        if self._inverse_mass is None:
+            acceleration = net / self.mass
+        else:
+            acceleration = _apply(self._inverse_mass, net)
+        self.velocity += acceleration * dt
+        self.position += self.velocity * dt
+        return self.position.copy(), self.velocity.copy()
+
+    def snapshot(self) -> dict[str, list]:
+        return {"position": self.position.tolist(), "velocity": self.velocity.tolist()}
+
+    def restore(self, snapshot: dict[str, list]) -> None:
+        self.position[...] = snapshot["position"]
+        self.velocity[...] = snapshot["velocity"]
+
+
+class AdmittanceControllerND(_SecondOrderND):
+    def __init__(
+        self,
+        stiffness: float | np.ndarray,
+        damping: float | np.ndarray,
+        mass: float | np.ndarray = 1.0,
+        position: float | np.ndarray | None = None,
+        velocity: float | np.ndarray | None = None,
+        dof: int | None = None,
+        batch_shape: tuple[int, ...] = (),
+    ) -> None:
+        super().__init__(stiffness, damping, mass, position, velocity, dof, batch_shape)
+
+
+class MassSpringDamperPlantND(_SecondOrderND):
+    _mass_name = "plant_mass"
+
+    def __init__(
+        self,
+        mass: float | np.ndarray = 1.0,
+        damping: float | np.ndarray = 5.0,
+        stiffness: float | np.ndarray = 20.0,
+        position: float | np.ndarray | None = None,
+        velocity: float | np.ndarray | None = None,
+        dof: int | None = None,
+        batch_shape: tuple[int, ...] = (),
+    ) -> None:
+        super().__init__(stiffness, damping, mass, position, velocity, dof, batch_shape)
+
+
+def _record(samples: np.ndarray) -> np.ndarray:
+    # (T, *batch, dof) buffer -> (*batch, dof, T), time last like the batch API.
+    return np.ascontiguousarray(np.moveaxis(samples, 0, -1))
+
+
+def simulate_pid_nd(
+    kp: float | np.ndarray = 12.0,
+    ki: float | np.ndarray = 1.2,
+    kd: float | np.ndarray = 0.4,
+    target: float | np.ndarray = 0.15,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    plant_mass: float | np.ndarray = 1.0,
+    plant_damping: float | np.ndarray = 5.0,
+    plant_stiffness: float | np.ndarray = 20.0,
+    integral_limit: float | np.ndarray | None = 10.0,
+    output_limit: float | np.ndarray | None = 120.0,
+    dof: int | None = None,
+) -> dict[str, np.ndarray]:
+    # ``target`` may be a scalar, a (dof,) vector or (*batch, dof) setpoints.
+    # Signals come back as (*batch, dof, T).
+    dof = _infer_dof(
+        dof,
+        kp=kp,
+        ki=ki,
+        kd=kd,
+        target=target,
+        plant_mass=plant_mass,
+        plant_damping=plant_damping,
+        plant_stiffness=plant_stiffness,
+    )
+    target = np.asarray(target, dtype=float)
+    if target.ndim and target.shape[-1] != dof:
+        raise ValueError(f"target must end in an axis of {dof} entries")
+    time = _build_time_vector(duration, dt)
+    gains = (kp, ki, kd, plant_mass, plant_damping, plant_stiffness)
+    batch_shape = np.broadcast_shapes(
+        target.shape[:-1], *(_batch_of(np.asarray(gain)) for gain in gains)
+    )
+    pid = PIDControllerND(
+        kp,
+        ki,
+        kd,
+        integral_limit=integral_limit,
+        output_limit=output_limit,
+        dof=dof,
+        batch_shape=batch_shape,
+    )
+    plant = MassSpringDamperPlantND(
+        plant_mass, plant_damping, plant_stiffness, dof=dof, batch_shape=batch_shape
+    )
+
+    position = np.empty((len(time), *pid.shape))
+    velocity = np.empty_like(position)
+    control_signal = np.empty_like(position)
+    for idx in range(len(time)):
+        control_signal[idx] = pid.update(target, plant.position, dt)
+        position[idx], velocity[idx] = plant.step(control_signal[idx], dt)
+
+    return {
+        "time": time,
+        "position": _record(position),
+        "velocity": _record(velocity),
+        "control": _record(control_signal),
+        "target": _record(np.broadcast_to(target, position.shape)),
+    }
+
+
+def simulate_admittance_nd(
+    stiffness: float | np.ndarray = 45.0,
+    damping: float | np.ndarray = 14.0,
+    mass: float | np.ndarray = 1.0,
+    force_amplitude: float | np.ndarray = 12.0,
+    force_frequency_hz: float | np.ndarray = 0.6,
+    duration: float = 5.0,
+    dt: float = 0.01,
+    dof: int | None = None,
+) -> dict[str, np.ndarray]:
+    # Each axis is driven by its own sinusoid; amplitudes and frequencies are
+    # scalars, (dof,) vectors or (*batch, dof). Signals come back as
+    # (*batch, dof, T).
+    dof = _infer_dof(
+        dof,
+        stiffness=stiffness,
+        damping=damping,
+        mass=mass,
+        force_amplitude=force_amplitude,
+        force_frequency_hz=force_frequency_hz,
+    )
+    amplitude, frequency = np.broadcast_arrays(
+        np.asarray(force_amplitude, dtype=float), np.asarray(force_frequency_hz, dtype=float)
+    )
+    if amplitude.ndim and amplitude.shape[-1] != dof:
+        raise ValueError(f"force_amplitude and force_frequency_hz must have {dof} entries")
+    time = _build_time_vector(duration, dt)
+    controller = AdmittanceControllerND(
+        stiffness, damping, mass, dof=dof, batch_shape=amplitude.shape[:-1]
+    )
+
+    force = np.broadcast_to(
+        amplitude[..., None] * np.sin(2.0 * np.pi * frequency[..., None] * time),
+        (*controller.shape, len(time)),
+    )
+    position = np.empty((len(time), *controller.shape))
+    velocity = np.empty_like(position)
+    for idx in range(len(time)):
+        position[idx], velocity[idx] = controller.step(force[..., idx], dt)
+
+    return {
+        "time": time,
+        "position": _record(position),
+        "velocity": _record(velocity),
+        "force": np.ascontiguousarray(force),
+    }
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# Time-domain passivity observer/controller (Hannaford and Ryu) for rendered
+# contacts. ``force`` is the force on the probe and ``velocity`` the probe
+# velocity, so -force * velocity is the power flowing into the rendered
+# environment. A passive environment never returns more energy than it was
+# given. Each sample's force is held until the next one, which is where a
+# sampled spring gains energy, so the observer charges each interval with the
+# force that was actually held over it and the velocity measured across it.
+# While the total is negative the controller adds the damping that would
+# dissipate the deficit over the next interval.
+
+
+class PassivityObserver:
+    __slots__ = ("energy", "_held_force")
+
+    def __init__(self) -> None:
+        self.energy = 0.0
+        self._held_force = 0.0
+
+    def reset(self) -> None:
+        self.energy = 0.0
+        self._held_force = 0.0
+
+    def update(self, force: float, velocity: float, dt: float) -> float:
+        # ``velocity`` is measured over the interval that just ended; ``force``
+        # is the new command, held over the next one.
+        self.energy -= self._held_force * velocity * dt
+        self._held_force = force
+        return self.energy
+
+
+class PassivityController:
+    # O(1) per sample: observe, then dissipate any deficit through a variable
+    # damper alpha, capped at ``max_damping`` when the actuator cannot render
+    # more. The corrected force is clipped to ``max_force`` again, like the
+    # wall force it replaces. The dissipation shows up in the energy one
+    # interval later, once the corrected force has actually been held.
+    __slots__ = ("_max_damping", "_max_force", "energy", "damping", "_held_force")
+
+    def __init__(self, max_damping: float | None = None, max_force: float | None = None) -> None:
+        if max_damping is not None and max_damping < 0:
+            raise ValueError("max_damping must be >= 0 when provided")
+        self._max_damping = math.inf if max_damping is None else float(max_damping)
+        self.max_force = max_force
+        self.energy = 0.0
+        self.damping = 0.0
+        self._held_force = 0.0
+
+    @property
+    def max_damping(self) -> float | None:
+        return None if self._max_damping == math.inf else self._max_damping
+
+    @property
+    def max_force(self) -> float | None:
+        return None if self._max_force == math.inf else self._max_force
+
+    @max_force.setter
+    def max_force(self, value: float | None) -> None:
+        if value is not None and value <= 0:
+            raise ValueError("max_force must be > 0 when provided")
+        self._max_force = math.inf if value is None else float(value)
+
+    def reset(self) -> None:
+        self.energy = 0.0
+        self.damping = 0.0
+        self._held_force = 0.0
+
+    def update(self, force: float, velocity: float, dt: float) -> float:
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+        energy = self.energy - self._held_force * velocity * dt
+        alpha = 0.0
+        if energy < 0.0 and velocity != 0.0:
+            alpha = -energy / (velocity * velocity * dt)
+            if alpha > self._max_damping:
+                alpha = self._max_damping
+        output = force - alpha * velocity
+        limit = self._max_force
+        if output > limit:
+            output = limit
+        elif output < -limit:
+            output = -limit
+        self.energy = energy
+        self.damping = alpha
+        self._held_force = output
+        return output
+
+    __call__ = update
+
+
+def passivity_control(
+    force: np.ndarray,
+    velocity: np.ndarray,
+    dt: float,
+    max_damping: float | np.ndarray | None = None,
+    max_force: float | np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    # Batched counterpart of PassivityController over (..., T) arrays: the
+    # recurrence runs along time once, vectorized over every run in the batch.
+    # ``max_force`` (scalar or one per run) clips the corrected force.
+    if dt <= 0:
+        raise ValueError("dt must be > 0")
+    force, velocity = np.broadcast_arrays(
+        np.asarray(force, dtype=float), np.asarray(velocity, dtype=float)
+    )
+    cap = np.inf if max_damping is None else np.asarray(max_damping, dtype=float)
+    if np.any(cap < 0):
+        raise ValueError("max_damping must be >= 0 when provided")
+    limit = np.inf if max_force is None else np.asarray(max_force, dtype=float)
+    if np.any(limit <= 0):
+        raise ValueError("max_force must be > 0 when provided")
+
+    output = np.empty_like(force)
+    energy = np.empty_like(force)
+    alpha = np.empty_like(force)
+    total = np.zeros(force.shape[:-1])
+    held = np.zeros(force.shape[:-1])
+    for idx in range(force.shape[-1]):
+        v = velocity[..., idx]
+        total = total - held * v * dt
+        deficit = (total < 0.0) & (v != 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            needed = np.where(deficit, -total / (v * v * dt), 0.0)
+        damping = np.minimum(needed, cap)
+        held = np.clip(force[..., idx] - damping * v, -limit, limit)
+        output[..., idx] = held
+        energy[..., idx] = total
+        alpha[..., idx] = damping
+    return {"force": output, "energy": energy, "damping": alpha}
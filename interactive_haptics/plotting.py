@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+from .downsample import TrajectoryIndex
+
+# Retained-mode plotting for the GUI tabs. Lines are created once and updated
+# with set_data(). Each axis keeps running data bounds, so appending samples
+# only scans the new ones. While the data stays inside the current limits,
+# only the lines are redrawn over a cached background (blitting). Limits grow
+# with some headroom, which keeps full redraws rare while data streams in.
+# Lines longer than ``index_threshold`` samples are not handed to matplotlib
+# whole. A TrajectoryIndex is built over them, and the line only shows the
+# min/max-preserving window for the current x limits, about two points per
+# pixel. Incremental updates append only the new samples to the index. Pan
+# and zoom (xlim_changed) re-query that window, so the cost is O(pixels) per
+# view change however long the run is.
+
+
+class LivePlot:
+    def __init__(
+        self,
+        canvas: Any,
+        lines: Sequence[Line2D],
+        headroom: float = 0.1,
+        index_threshold: int = 20_000,
+    ) -> None:
+        if headroom < 0:
+            raise ValueError("headroom must be >= 0")
+        if index_threshold < 1:
+            raise ValueError("index_threshold must be >= 1")
+        self.canvas = canvas
+        self.lines = list(lines)
+        self.headroom = headroom
+        self.index_threshold = index_threshold
+        self._axes = list(dict.fromkeys(line.axes for line in self.lines))
+        self._bounds = {axes: np.array([np.inf, -np.inf, np.inf, -np.inf]) for axes in self._axes}
+        self._background = None
+        self._indexes: dict[Line2D, TrajectoryIndex] = {}
+        self._first_x: dict[Line2D, float] = {}
+        self._rescaling = False
+        for line in self.lines:
+            line.set_animated(True)
+        for axes in self._axes:
+            axes.callbacks.connect("xlim_changed", self._on_xlim_changed)
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, _event: Any) -> None:
+        # Every full draw renders everything but the lines; cache that and put
+        # the lines on top.
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_lines()
+
+    def _on_xlim_changed(self, axes: Any) -> None:
+        # Pan/zoom from the toolbar; the redraw that follows picks up the data.
+        if not self._rescaling:
+            for line in self.lines:
+                if line.axes is axes and line in self._indexes:
+                    self._show_window(line)
+
+    def _show_window(self, line: Line2D) -> None:
+        x_min, x_max = line.axes.get_xlim()
+        pixels = max(int(line.axes.bbox.width), 1)
+        x, y = self._indexes[line].window("y", x_min, x_max, pixels)
+        # The index may still hold rows the caller has since dropped.
+        kept = x >= self._first_x[line]
+        line.set_data(x[kept], y[kept])
+
+    def _index(self, line: Line2D, x: Any, y: Any, start: int) -> None:
+        # The index copies the data, since the caller may reuse the buffers
+        # (SignalLog views). When the samples before ``start`` are the ones
+        # indexed last time, only the new samples are appended. A bounded log
+        # that dropped rows from the front still appends; the index is only
+        # rebuilt once it holds twice the rows of the data.
+        index = self._indexes.get(line)
+        if (
+            start > 0
+            and index is not None
+            and len(index.time)
+            and index.time[-1] == x[start - 1]
+            and len(index.time) + len(x) - start <= 2 * len(x)
+        ):
+            index.append(x[start:], {"y": y[start:]})
+        else:
+            self._indexes[line] = TrajectoryIndex(x, {"y": y})
+        self._first_x[line] = float(x[0])
+
+    def _draw_lines(self) -> None:
+        for line in self.lines:
+            line.axes.draw_artist(line)
+
+    def _grow(self, axes: Any, x: np.ndarray, y: np.ndarray) -> None:
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not np.any(finite):
+            return
+        x, y = x[finite], y[finite]
+        bounds = self._bounds[axes]
+        bounds[0] = min(bounds[0], float(np.min(x)))
+        bounds[1] = max(bounds[1], float(np.max(x)))
+        bounds[2] = min(bounds[2], float(np.min(y)))
+        bounds[3] = max(bounds[3], float(np.max(y)))
+
+    def _padded(self, low: float, high: float) -> tuple[float, float]:
+        span = high - low if high > low else max(abs(high), 1.0)
+        return low - self.headroom * span, high + self.headroom * span
+
+    def _rescale(self, axes: Any, refit: bool) -> bool:
+        # Returns True when the limits changed (and a full redraw is needed).
+        x_low, x_high, y_low, y_high = self._bounds[axes]
+        if x_low > x_high:
+            return False
+        (x_min, x_max), (y_min, y_max) = axes.get_xlim(), axes.get_ylim()
+        changed = False
+        if refit or x_low < x_min or x_high > x_max:
+            axes.set_xlim(*self._padded(x_low, x_high))
+            changed = True
+        if refit or y_low < y_min or y_high > y_max:
+            axes.set_ylim(*self._padded(y_low, y_high))
+            changed = True
+        return changed
+
+    def update(self, data: Sequence[tuple[Any, Any]], start: int = 0) -> None:
+        # ``data[i]`` is the full (x, y) of ``lines[i]``. Samples before
+        # ``start`` are unchanged since the previous call, so only the rest is
+        # scanned; start=0 refits the limits to the new data.
+        refit = start == 0
+        if refit:
+            for bounds in self._bounds.values():
+                bounds[:] = (np.inf, -np.inf, np.inf, -np.inf)
+        for line, (x, y) in zip(self.lines, data):
+            if len(x) > self.index_threshold:
+                self._index(line, x, y, start)
+            else:
+                self._indexes.pop(line, None)
+                line.set_data(x, y)
+            self._grow(
+                line.axes,
+                np.asarray(x[start:], dtype=float),
+                np.asarray(y[start:], dtype=float),
+            )
+
+        self._rescaling = True
+        try:
+            rescaled = [self._rescale(axes, refit) for axes in self._axes]
+        finally:
+            self._rescaling = False
+        for line in self._indexes:
+            self._show_window(line)
+        if any(rescaled) or self._background is None:
+            self._background = None
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.canvas.figure.bbox)
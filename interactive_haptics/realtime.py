@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+
+
+@dataclass
+class LoopStats:
+    rate_hz: float
+    realtime: bool
+    lateness: np.ndarray
+    compute_time: np.ndarray
+    missed_ticks: int = 0
+    elapsed: float = 0.0
+    stopped_early: bool = False
+
+    @property
+    def ticks(self) -> int:
+        return len(self.compute_time)
+
+    @property
+    def period(self) -> float:
+        return 1.0 / self.rate_hz
+
+    @property
+    def overruns(self) -> int:
+        return int(np.count_nonzero(self.compute_time > self.period))
+
+    @property
+    def achieved_rate_hz(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed > 0 else 0.0
+
+    def jitter_histogram(self, bins: int | np.ndarray = 20) -> tuple[np.ndarray, np.ndarray]:
+        return np.histogram(self.lateness, bins=bins)
+
+    def overrun_histogram(self, bins: int | np.ndarray = 20) -> tuple[np.ndarray, np.ndarray]:
+        # Histogram of how far each overrunning tick exceeded the period.
+        excess = self.compute_time[self.compute_time > self.period] - self.period
+        return np.histogram(excess, bins=bins)
+
+    def summary(self) -> dict[str, float]:
+        if self.ticks == 0:
+            return {"ticks": 0.0}
+        lateness = self.lateness
+        return {
+            "ticks": float(self.ticks),
+            "achieved_rate_hz": self.achieved_rate_hz,
+            "jitter_mean_s": float(np.mean(lateness)),
+            "jitter_p99_s": float(np.percentile(lateness, 99)),
+            "jitter_max_s": float(np.max(lateness)),
+            "compute_mean_s": float(np.mean(self.compute_time)),
+            "compute_max_s": float(np.max(self.compute_time)),
+            "overruns": float(self.overruns),
+            "missed_ticks": float(self.missed_ticks),
+        }
+
+
+@dataclass
+class HapticLoop:
+    callback: Callable[[float, float], object]
+    rate_hz: float = 1000.0
+    realtime: bool = True
+    spin_threshold: float = 2e-4
+    clock: Callable[[], float] = time.perf_counter
+    sleep: Callable[[float], object] = time.sleep
+    _stop_requested: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate_hz <= 0:
+            raise ValueError("rate_hz must be > 0")
+        if self.spin_threshold < 0:
+            raise ValueError("spin_threshold must be >= 0")
+
+    def stop(self) -> None:
+        self._stop_requested = True
+
+    def run(self, duration: float | None = None, ticks: int | None = None) -> LoopStats:
+        if (duration is None) == (ticks is None):
+            raise ValueError("provide exactly one of duration or ticks")
+        if duration is not None:
+            if duration <= 0:
+                raise ValueError("duration must be > 0")
+            ticks = int(round(duration * self.rate_hz))
+        if ticks <= 0:
+            raise ValueError("ticks must be > 0")
+
+        period = 1.0 / self.rate_hz
+        lateness = np.zeros(ticks)
+        compute_time = np.zeros(ticks)
+        clock = self.clock
+        callback = self.callback
+        missed = 0
+        self._stop_requested = False
+
+        start = clock()
+        # Deadlines are absolute multiples of the period from ``start``, so the
+        # cost of the loop body and of the wait itself never accumulates.
+        slot = 0
+        done = 0
+        while slot < ticks and not self._stop_requested:
+            deadline = start + slot * period
+            if self.realtime:
+                now = self._wait_until(deadline)
+                late = now - deadline
+                if late >= period:
+                    # Skip the slots we can no longer make instead of bursting.
+                    skipped = min(int(late // period), ticks - slot)
+                    missed += skipped
+                    slot += skipped
+                    if slot >= ticks:
+                        break
+                    late -= skipped * period
+                lateness[done] = late
+            tick_start = clock()
+            callback(slot * period, period)
+            compute_time[done] = clock() - tick_start
+            slot += 1
+            done += 1
+
+        return LoopStats(
+            rate_hz=self.rate_hz,
+            realtime=self.realtime,
+            lateness=lateness[:done],
+            compute_time=compute_time[:done],
+            missed_ticks=missed,
+            elapsed=clock() - start,
+            stopped_early=slot < ticks,
+        )
+
+    def _wait_until(self, deadline: float) -> float:
+        # Coarse OS sleep until just before the deadline, then spin on the clock
+        # for the last ``spin_threshold`` seconds where sleep granularity is poor.
+        clock = self.clock
+        now = clock()
+        remaining = deadline - now
+        if remaining > self.spin_threshold:
+            self.sleep(remaining - self.spin_threshold)
+            now = clock()
+        while now < deadline:
+            now = clock()
+        return now
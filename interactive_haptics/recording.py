@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator, Mapping, Sequence
+
+import numpy as np
+
+# Bounded logs for interactive sessions. SignalLog keeps the newest
+# ``capacity`` rows of a fixed set of float signals in a preallocated
+# Fortran-ordered (2 * capacity, signals) array. Rows are appended at the end,
+# and once the end of the array is reached the live window is moved back to
+# the front. That costs one copy per ``capacity`` appends, so appends are O(1)
+# amortized, and every column of the window is a contiguous view without
+# wrap-around. Rows that fall out of the window are dropped. With
+# ``spill_path`` set, they are first appended to a raw float64 file in bulk
+# at each compaction, so a session of any length can still be exported.
+
+
+class SignalLog:
+    def __init__(
+        self,
+        signals: Sequence[str],
+        capacity: int = 100_000,
+        spill_path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        if not signals:
+            raise ValueError("signals must not be empty")
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.signals = tuple(signals)
+        self.capacity = int(capacity)
+        self.spill_path = None if spill_path is None else Path(spill_path)
+        self._index = {name: idx for idx, name in enumerate(self.signals)}
+        self._data = np.empty((2 * self.capacity, len(self.signals)), order="F")
+        self.clear()
+
+    def clear(self) -> None:
+        self._start = 0
+        self._end = 0
+        # Rows in [_mark, _start) have left the window but are not spilled yet.
+        self._mark = 0
+        self.dropped = 0
+        self._spilled = 0
+        if self.spill_path is not None:
+            self.spill_path.write_bytes(b"")
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        # Zero-copy view of one column of the window; it is only valid until
+        # the next append, which may move the window.
+        return self._data[self._start : self._end, self._index[name]]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self[name] for name in self.signals}
+
+    @property
+    def spilled(self) -> int:
+        return self._spilled + (self._start - self._mark if self.spill_path else 0)
+
+    def _flush(self) -> None:
+        if self.spill_path is not None and self._start > self._mark:
+            with open(self.spill_path, "ab") as handle:
+                # tofile() always writes C order, i.e. whole rows.
+                self._data[self._mark : self._start].tofile(handle)
+            self._spilled += self._start - self._mark
+        self._mark = self._start
+
+    def _compact(self) -> None:
+        self._flush()
+        size = self._end - self._start
+        # The window never exceeds capacity and only moves once the array end
+        # is reached, so source and destination never overlap.
+        self._data[:size] = self._data[self._start : self._end]
+        self._start, self._end, self._mark = 0, size, 0
+
+    def _evict(self) -> None:
+        excess = self._end - self._start - self.capacity
+        if excess > 0:
+            self._start += excess
+            self.dropped += excess
+            if self.spill_path is None:
+                self._mark = self._start
+
+    def append(self, *values: float) -> None:
+        if len(values) != len(self.signals):
+            raise ValueError(f"expected {len(self.signals)} values, got {len(values)}")
+        if self._end == len(self._data):
+            self._compact()
+        self._data[self._end] = values
+        self._end += 1
+        self._evict()
+
+    def extend(self, columns: Mapping[str, np.ndarray]) -> None:
+        # Appends equal-length columns for every signal, block by block.
+        arrays = [np.asarray(columns[name], dtype=float) for name in self.signals]
+        rows = len(arrays[0])
+        if any(array.shape != (rows,) for array in arrays):
+            raise ValueError("columns must be 1-D and of equal length")
+        done = 0
+        while done < rows:
+            if self._end == len(self._data):
+                self._compact()
+            take = min(rows - done, len(self._data) - self._end)
+            for idx, array in enumerate(arrays):
+                self._data[self._end : self._end + take, idx] = array[done : done + take]
+            self._end += take
+            done += take
+            self._evict()
+
+    def spilled_columns(self) -> dict[str, np.ndarray]:
+        # Memory-mapped (strided) columns of every spilled row, oldest first.
+        self._flush()
+        if self.spill_path is None or self._spilled == 0:
+            return {name: np.empty(0) for name in self.signals}
+        rows = np.memmap(
+            self.spill_path, dtype=np.float64, mode="r", shape=(self._spilled, len(self.signals))
+        )
+        return {name: rows[:, idx] for idx, name in enumerate(self.signals)}
+
+    def iter_blocks(self) -> Iterator[dict[str, np.ndarray]]:
+        # The whole recorded session in order: spilled rows, then the window.
+        spilled = self.spilled_columns()
+        if len(spilled[self.signals[0]]):
+            yield spilled
+        if len(self):
+            yield self.columns()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import math
+
+from .control import _check_wall_parameters
+
+# Slotted, allocation-free variants of the per-sample hot paths for servo-rate
+# callbacks. They follow the reference classes in control.py operation for
+# operation (so results match bit for bit) but keep every value a Python float:
+# no NumPy scalars, no instance dict and no per-call argument validation beyond
+# what guards against division by zero.
+
+
+class FastPIDController:
+    __slots__ = (
+        "kp",
+        "ki",
+        "kd",
+        "_integral_limit",
+        "_output_limit",
+        "_integral",
+        "_prev_error",
+    )
+
+    def __init__(
+        self,
+        kp: float,
+        ki: float,
+        kd: float,
+        integral_limit: float | None = None,
+        output_limit: float | None = None,
+    ) -> None:
+        self.kp = float(kp)
+        self.ki = float(ki)
+        self.kd = float(kd)
+        self._integral_limit = math.inf if integral_limit is None else abs(float(integral_limit))
+        self._output_limit = math.inf if output_limit is None else abs(float(output_limit))
+        self._integral = 0.0
+        self._prev_error = 0.0
+
+    @property
+    def integral_limit(self) -> float | None:
+        return None if self._integral_limit == math.inf else self._integral_limit
+
+    @property
+    def output_limit(self) -> float | None:
+        return None if self._output_limit == math.inf else self._output_limit
+
+    def reset(self) -> None:
+        self._integral = 0.0
+        self._prev_error = 0.0
+
+    def update(self, setpoint: float, measurement: float, dt: float) -> float:
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+
+        error = setpoint - measurement
+        integral = self._integral + error * dt
+        limit = self._integral_limit
+        if integral > limit:
+            integral = limit
+        elif integral < -limit:
+            integral = -limit
+        self._integral = integral
+
+        output = (
+            self.kp * error
+            + self.ki * integral
+            + self.kd * ((error - self._prev_error) / dt)
+        )
+        limit = self._output_limit
+        if output > limit:
+            output = limit
+        elif output < -limit:
+            output = -limit
+
+        self._prev_error = error
+        return output
+
+
+class FastAdmittanceController:
+    __slots__ = ("stiffness", "damping", "_mass", "position", "velocity")
+
+    def __init__(
+        self,
+        stiffness: float,
+        damping: float,
+        mass: float = 1.0,
+        position: float = 0.0,
+        velocity: float = 0.0,
+    ) -> None:
+        self.stiffness = float(stiffness)
+        self.damping = float(damping)
+        self.mass = mass
+        self.position = float(position)
+        self.velocity = float(velocity)
+
+    @property
+    def mass(self) -> float:
+        return self._mass
+
+    @mass.setter
+    def mass(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("mass must be > 0")
+        self._mass = float(value)
+
+    def step(self, external_force: float, dt: float) -> tuple[float, float]:
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+
+        velocity = self.velocity
+        position = self.position
+        velocity += (
+            (external_force - self.damping * velocity - self.stiffness * position) / self._mass
+        ) * dt
+        position += velocity * dt
+        self.velocity = velocity
+        self.position = position
+        return position, velocity
+
+
+class VirtualWall:
+    # Wall parameters are validated once here; force() is then pure float math.
+    __slots__ = ("wall_position", "stiffness", "damping", "friction", "_max_force")
+
+    def __init__(
+        self,
+        wall_position: float = 0.7,
+        stiffness: float = 250.0,
+        damping: float = 3.0,
+        friction: float = 0.2,
+        max_force: float | None = 35.0,
+    ) -> None:
+        _check_wall_parameters(stiffness, damping, friction, max_force)
+        self.wall_position = float(wall_position)
+        self.stiffness = float(stiffness)
+        self.damping = float(damping)
+        self.friction = float(friction)
+        self._max_force = math.inf if max_force is None else float(max_force)
+
+    @property
+    def max_force(self) -> float | None:
+        return None if self._max_force == math.inf else self._max_force
+
+    def force(self, position: float, velocity: float) -> float:
+        penetration = position - self.wall_position
+        if penetration <= 0:
+            return 0.0
+
+        if velocity > 0:
+            damping_term = self.damping * velocity
+            friction_term = self.friction if velocity >= 1e-9 else 0.0
+        else:
+            damping_term = 0.0
+            friction_term = -self.friction if velocity <= -1e-9 else 0.0
+        force = -(self.stiffness * penetration + damping_term + friction_term)
+
+        limit = self._max_force
+        if force > limit:
+            return limit
+        if force < -limit:
+            return -limit
+        return force
+
+    __call__ = force
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping, TextIO
+
+import numpy as np
+
+# On-disk trajectories: one Fortran-ordered (rows, signals) .npy file, so each
+# signal is a contiguous column that np.memmap can expose without reading the
+# rest, plus a small JSON header next to it with the signal names and the
+# parameters of the run.
+
+FORMAT_VERSION = 1
+
+
+class Trajectory(dict):
+    # A result dict whose values are read-only memmap views of the columns.
+    def __init__(self, path: Path, header: dict[str, Any], columns: np.ndarray) -> None:
+        super().__init__(
+            (name, columns[:, idx]) for idx, name in enumerate(header["signals"])
+        )
+        self.path = path
+        self.header = header
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return self.header.get("params", {})
+
+    @property
+    def rows(self) -> int:
+        return int(self.header["rows"])
+
+
+def _npy_path(path: str | os.PathLike[str]) -> Path:
+    path = Path(path)
+    return path if path.suffix == ".npy" else path.with_name(path.name + ".npy")
+
+
+def header_path(path: str | os.PathLike[str]) -> Path:
+    return _npy_path(path).with_suffix(".json")
+
+
+def write_trajectory(
+    path: str | os.PathLike[str],
+    chunks: Iterable[Mapping[str, np.ndarray]],
+    rows: int,
+    signals: list[str],
+    function: str = "",
+    params: Mapping[str, Any] | None = None,
+) -> Trajectory:
+    # The columns are filled under a temporary name and only renamed into
+    # place once every chunk arrived, so a run that fails midway leaves no
+    # headerless .npy behind (and keeps any trajectory already at ``path``).
+    npy_path = _npy_path(path)
+    temporary = npy_path.with_name(npy_path.name + ".tmp")
+    try:
+        _write_columns(temporary, chunks, rows, signals)
+        os.replace(temporary, npy_path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "function": function,
+        "params": dict(params or {}),
+        "signals": list(signals),
+        "rows": rows,
+    }
+    header_path(npy_path).write_text(json.dumps(header, indent=2))
+    return open_trajectory(npy_path)
+
+
+def _write_columns(
+    path: Path, chunks: Iterable[Mapping[str, np.ndarray]], rows: int, signals: list[str]
+) -> None:
+    columns = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float64, shape=(rows, len(signals)), fortran_order=True
+    )
+    written = 0
+    for chunk in chunks:
+        size = len(chunk[signals[0]])
+        if written + size > rows:
+            raise ValueError("chunks hold more rows than the trajectory was sized for")
+        for idx, name in enumerate(signals):
+            columns[written : written + size, idx] = chunk[name]
+        written += size
+    if written != rows:
+        raise ValueError(f"expected {rows} rows, got {written}")
+    columns.flush()
+
+
+def open_trajectory(path: str | os.PathLike[str], mode: str = "r") -> Trajectory:
+    npy_path = _npy_path(path)
+    header = json.loads(header_path(npy_path).read_text())
+    columns = np.load(npy_path, mmap_mode=mode)
+    if columns.shape != (header["rows"], len(header["signals"])):
+        raise ValueError(f"{npy_path} does not match its header")
+    return Trajectory(npy_path, header, columns)
+
+
+def write_csv_blocks(
+    target: str | os.PathLike[str] | TextIO,
+    result: Mapping[str, np.ndarray],
+    signals: list[str],
+    block_rows: int = 65536,
+    header: bool = True,
+) -> None:
+    # Writes exactly what np.savetxt(..., delimiter=",") would, block_rows at
+    # a time through one reused buffer, so neither a full column_stack copy
+    # nor the full text is ever held in memory. Each block is formatted by a
+    # single % over all of its values rather than savetxt's per-row loop.
+    # header=False appends rows to an already started file.
+    def write(handle: TextIO) -> None:
+        if header:
+            handle.write(",".join(signals) + "\n")
+        rows = len(result[signals[0]])
+        block = np.empty((min(block_rows, rows), len(signals)))
+        line = ",".join(["%.18e"] * len(signals)) + "\n"
+        for start in range(0, rows, block_rows):
+            size = min(block_rows, rows - start)
+            for idx, name in enumerate(signals):
+                block[:size, idx] = result[name][start : start + size]
+            handle.write((line * size) % tuple(block[:size].ravel().tolist()))
+
+    if hasattr(target, "write"):
+        write(target)
+    else:
+        with open(target, "w", newline="") as handle:
+            write(handle)
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .control import _check_wall_parameters, _wall_force_unchecked
+from .lti import AdmittanceSolver, PIDSolver
+
+# Chunked counterparts of the simulate_* functions. Each yields dicts with the
+# same keys as the matching simulate_* result, holding at most ``chunk_size``
+# samples, and carries controller and plant state from one chunk to the next,
+# so memory stays constant however long the run is. ``duration=None`` streams
+# forever; stop by closing the generator or breaking out of the loop.
+
+
+class _TimeBase:
+    def __init__(self, duration: float | None, dt: float, chunk_size: int) -> None:
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be > 0")
+        if dt <= 0:
+            raise ValueError("dt must be > 0")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.dt = dt
+        self.chunk_size = chunk_size
+        if duration is None:
+            self.total = None
+            self._step = dt
+        else:
+            # Same grid as _build_time_vector, without materializing it.
+            steps = int(duration / dt)
+            self.total = steps + 1
+            self._end = steps * dt
+            self._step = self._end / steps if steps else 0.0
+
+    def bounds(self, start: int = 0) -> Iterator[tuple[int, int]]:
+        while self.total is None or start < self.total:
+            stop = start + self.chunk_size
+            if self.total is not None:
+                stop = min(stop, self.total)
+            yield start, stop
+            start = stop
+
+    def times(self, start: int, stop: int) -> np.ndarray:
+        time = np.arange(start, stop, dtype=float) * self._step
+        if self.total is not None and stop == self.total and self.total > 1:
+            time[-1] = self._end
+        return time
+
+
+def iter_simulate_pid(
+    kp: float = 12.0,
+    ki: float = 1.2,
+    kd: float = 0.4,
+    target: float = 0.15,
+    duration: float | None = 5.0,
+    dt: float = 0.01,
+    plant_mass: float = 1.0,
+    plant_damping: float = 5.0,
+    plant_stiffness: float = 20.0,
+    chunk_size: int = 4096,
+) -> Iterator[dict[str, np.ndarray]]:
+    if plant_mass <= 0:
+        raise ValueError("plant_mass must be > 0")
+    base = _TimeBase(duration, dt, chunk_size)
+    solver = PIDSolver(
+        kp,
+        ki,
+        kd,
+        target,
+        plant_mass,
+        plant_damping,
+        plant_stiffness,
+        integral_limit=10.0,
+        output_limit=120.0,
+        dt=dt,
+        block_size=chunk_size,
+    )
+    return _pid_chunks(base, solver, target)
+
+
+def _pid_chunks(
+    base: _TimeBase, solver: PIDSolver, target: float, first: int = 0
+) -> Iterator[dict[str, np.ndarray]]:
+    for start, stop in base.bounds(first):
+        position, velocity, control_signal = solver.advance(stop - start)
+        yield {
+            "time": base.times(start, stop),
+            "position": position,
+            "velocity": velocity,
+            "control": control_signal,
+            "target": np.full(stop - start, target),
+        }
+
+
+def iter_simulate_admittance(
+    stiffness: float = 45.0,
+    damping: float = 14.0,
+    mass: float = 1.0,
+    force_amplitude: float = 12.0,
+    force_frequency_hz: float = 0.6,
+    duration: float | None = 5.0,
+    dt: float = 0.01,
+    chunk_size: int = 4096,
+) -> Iterator[dict[str, np.ndarray]]:
+    base = _TimeBase(duration, dt, chunk_size)
+    solver = AdmittanceSolver(stiffness, damping, mass, dt, block_size=chunk_size)
+    return _admittance_chunks(base, solver, force_amplitude, force_frequency_hz)
+
+
+def _admittance_chunks(
+    base: _TimeBase,
+    solver: AdmittanceSolver,
+    force_amplitude: float,
+    force_frequency_hz: float,
+    first: int = 0,
+) -> Iterator[dict[str, np.ndarray]]:
+    for start, stop in base.bounds(first):
+        time = base.times(start, stop)
+        force = force_amplitude * np.sin(2.0 * np.pi * force_frequency_hz * time)
+        position, velocity = solver.advance(force)
+        yield {"time": time, "position": position, "velocity": velocity, "force": force}
+
+
+def iter_simulate_virtual_wall(
+    wall_position: float = 0.7,
+    stiffness: float = 250.0,
+    damping: float = 3.0,
+    friction: float = 0.2,
+    max_force: float = 35.0,
+    motion_center: float = 0.55,
+    motion_amplitude: float = 0.25,
+    motion_frequency_hz: float = 0.7,
+    duration: float | None = 5.0,
+    dt: float = 0.01,
+    chunk_size: int = 4096,
+) -> Iterator[dict[str, np.ndarray]]:
+    if not 0.0 <= wall_position <= 1.0:
+        raise ValueError("wall_position must be in [0, 1]")
+    if motion_amplitude < 0:
+        raise ValueError("motion_amplitude must be >= 0")
+    _check_wall_parameters(stiffness, damping, friction, max_force)
+    base = _TimeBase(duration, dt, chunk_size)
+    return _virtual_wall_chunks(
+        base,
+        wall_position,
+        stiffness,
+        damping,
+        friction,
+        max_force,
+        motion_center,
+        motion_amplitude,
+        motion_frequency_hz,
+    )
+
+
+def _virtual_wall_chunks(
+    base: _TimeBase,
+    wall_position: float,
+    stiffness: float,
+    damping: float,
+    friction: float,
+    max_force: float,
+    motion_center: float,
+    motion_amplitude: float,
+    motion_frequency_hz: float,
+    first: int = 0,
+) -> Iterator[dict[str, np.ndarray]]:
+    for start, stop in base.bounds(first):
+        # One sample of overlap on each side keeps np.gradient's central
+        # differences identical to a gradient over the whole run.
+        lo = max(start - 1, 0)
+        hi = stop + 1 if base.total is None else min(stop + 1, base.total)
+        extended = motion_center + motion_amplitude * np.sin(
+            2.0 * np.pi * motion_frequency_hz * base.times(lo, hi)
+        )
+        extended = np.clip(extended, 0.0, 1.0)
+        window = slice(start - lo, start - lo + stop - start)
+        position = extended[window]
+        velocity = np.gradient(extended, base.dt)[window]
+        yield {
+            "time": base.times(start, stop),
+            "position": position,
+            "velocity": velocity,
+            "force": _wall_force_unchecked(
+                position, velocity, wall_position, stiffness, damping, friction, max_force
+            ),
+            "penetration": np.maximum(0.0, position - wall_position),
+            "wall": np.full(stop - start, wall_position),
+        }
+
+
+def concat_chunks(chunks: Iterable[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    collected: dict[str, list[np.ndarray]] = {}
+    for chunk in chunks:
+        for key, values in chunk.items():
+            collected.setdefault(key, []).append(values)
+    return {key: np.concatenate(parts) for key, parts in collected.items()}
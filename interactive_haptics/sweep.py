@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from .control import (
+    _as_batch,
+    _build_time_vector,
+    simulate_admittance_batch,
+    simulate_pid_batch,
+    simulate_virtual_wall_batch,
+)
+
+# Parameter sweeps across a persistent process pool. The grid is cut into
+# chunks of points; each worker runs its chunk through the matching *_batch
+# simulation and writes the rows straight into one shared-memory block laid
+# out as (signals, points, samples). Only chunk bounds travel back through
+# the pool, never trajectories.
+
+SWEEP_FUNCTIONS: dict[str, tuple[Callable[..., dict[str, np.ndarray]], tuple[str, ...]]] = {
+    "pid": (simulate_pid_batch, ("position", "velocity", "control")),
+    "admittance": (simulate_admittance_batch, ("position", "velocity", "force")),
+    "virtual_wall": (
+        simulate_virtual_wall_batch,
+        ("position", "velocity", "force", "penetration"),
+    ),
+}
+
+
+def parameter_grid(**axes: float | Sequence[float] | np.ndarray) -> dict[str, np.ndarray]:
+    # Cartesian product of the axes, flattened to one 1-D array per parameter.
+    values = [np.atleast_1d(np.asarray(axis, dtype=float)) for axis in axes.values()]
+    for name, axis in zip(axes, values):
+        if axis.ndim != 1 or axis.size == 0:
+            raise ValueError(f"grid axis {name!r} must be a non-empty 1-D sequence")
+    if not values:
+        return {}
+    mesh = np.meshgrid(*values, indexing="ij")
+    return {name: grid.ravel() for name, grid in zip(axes, mesh)}
+
+
+def _run_chunk(
+    shm_name: str,
+    shape: tuple[int, int, int],
+    kind: str,
+    start: int,
+    points: dict[str, np.ndarray],
+    fixed: dict[str, Any],
+) -> tuple[int, int]:
+    function, signals = SWEEP_FUNCTIONS[kind]
+    result = function(**points, **fixed)
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        stop = start + len(result[signals[0]])
+        for idx, signal in enumerate(signals):
+            view[idx, start:stop] = result[signal]
+        del view
+    finally:
+        block.close()
+    return start, stop
+
+
+class _SharedArray:
+    # Owns the mapping of a shared-memory block. Arrays are made with
+    # np.asarray(self), so every view of the block has this object as its
+    # base and the mapping is only closed once the last view is gone.
+    def __init__(self, block: shared_memory.SharedMemory, shape: tuple[int, ...]) -> None:
+        self._block = block
+        self._array = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        self.__array_interface__ = self._array.__array_interface__
+
+    def __del__(self) -> None:
+        del self._array
+        self._block.close()
+
+
+class SweepResult:
+    # Views into the shared block. close() (or the context manager) unlinks
+    # it; the memory itself is released once no column view is left.
+    def __init__(
+        self,
+        kind: str,
+        points: dict[str, np.ndarray],
+        time: np.ndarray,
+        block: shared_memory.SharedMemory,
+        completed: np.ndarray,
+        cancelled: bool,
+    ) -> None:
+        self.kind = kind
+        self.points = points
+        self.time = time
+        self.signals = SWEEP_FUNCTIONS[kind][1]
+        self.completed = completed
+        self.cancelled = cancelled
+        self._block: shared_memory.SharedMemory | None = block
+        self._data = np.asarray(
+            _SharedArray(block, (len(self.signals), len(completed), len(time)))
+        )
+
+    def __len__(self) -> int:
+        return len(self.completed)
+
+    def __getitem__(self, signal: str) -> np.ndarray:
+        if self._block is None:
+            raise ValueError("sweep result is closed")
+        return self._data[self.signals.index(signal)]
+
+    def to_dict(self) -> dict[str, np.ndarray]:
+        result = {"time": self.time.copy()}
+        result.update((signal, self[signal].copy()) for signal in self.signals)
+        return result
+
+    def close(self) -> None:
+        if self._block is None:
+            return
+        block, self._block = self._block, None
+        del self._data
+        block.unlink()
+
+    def __enter__(self) -> SweepResult:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class SweepExecutor:
+    # The pool is created on first use and kept across sweeps so repeated runs
+    # do not pay process start-up (and, with numba, JIT warm-up) each time.
+    def __init__(self, max_workers: int | None = None, chunk_size: int | None = None) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool: ProcessPoolExecutor | None = None
+        self._cancel = threading.Event()
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _chunk_bounds(self, total: int) -> list[tuple[int, int]]:
+        # A few chunks per worker keeps cores busy when chunks finish unevenly
+        # and gives progress updates some resolution.
+        size = self.chunk_size or max(1, -(-total // (self.max_workers * 4)))
+        return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def run(
+        self,
+        kind: str,
+        points: Mapping[str, float | Sequence[float] | np.ndarray],
+        duration: float = 5.0,
+        dt: float = 0.01,
+        backend: str = "auto",
+        progress: Callable[[int, int], None] | None = None,
+        **fixed: Any,
+    ) -> SweepResult:
+        if kind not in SWEEP_FUNCTIONS:
+            raise ValueError(
+                f"unknown sweep {kind!r}; expected one of {sorted(SWEEP_FUNCTIONS)}"
+            )
+        points = _as_batch(**points) if points else {}
+        total = len(next(iter(points.values()))) if points else 1
+        time = _build_time_vector(duration, dt)
+        fixed.update(duration=duration, dt=dt, backend=backend)
+        signals = SWEEP_FUNCTIONS[kind][1]
+        shape = (len(signals), total, len(time))
+
+        self._cancel.clear()
+        block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+        completed = np.zeros(total, dtype=bool)
+        pending: set[Future] = set()
+        try:
+            pool = self._ensure_pool()
+            for start, stop in self._chunk_bounds(total):
+                chunk = {name: values[start:stop] for name, values in points.items()}
+                pending.add(pool.submit(_run_chunk, block.name, shape, kind, start, chunk, fixed))
+
+            done_points = 0
+            while pending:
+                if self._cancel.is_set():
+                    for future in pending:
+                        future.cancel()
+                done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    start, stop = future.result()
+                    completed[start:stop] = True
+                    done_points += stop - start
+                    if progress is not None:
+                        progress(done_points, total)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            block.close()
+            block.unlink()
+            raise
+
+        return SweepResult(
+            kind,
+            points,
+            time,
+            block,
+            completed,
+            cancelled=self._cancel.is_set() and not completed.all(),
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> SweepExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
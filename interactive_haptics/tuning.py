@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
+
+import numpy as np
+
+from . import metrics
+from .control import simulate_pid_batch
+
+# Differential evolution (rand/1/bin) over (kp, ki, kd). Every generation is
+# one simulate_pid_batch call over the whole population, so the simulation
+# cost per generation is a single lockstep batch rather than one run per
+# candidate. The saturation limits are part of the simulated controller, so
+# candidates are judged on what the limited controller actually does.
+
+GAINS = ("kp", "ki", "kd")
+DEFAULT_BOUNDS = {"kp": (0.0, 200.0), "ki": (0.0, 50.0), "kd": (0.0, 20.0)}
+DEFAULT_WEIGHTS = {"iae": 1.0, "overshoot": 1.0, "settling_time": 1.0, "peak_control": 0.0}
+
+
+@dataclass
+class TuneResult:
+    kp: float
+    ki: float
+    kd: float
+    cost: float
+    terms: dict[str, float]
+    history: list[float] = field(default_factory=list)
+    evaluations: int = 0
+
+    @property
+    def gains(self) -> dict[str, float]:
+        return {"kp": self.kp, "ki": self.ki, "kd": self.kd}
+
+    @property
+    def generations(self) -> int:
+        return len(self.history) - 1
+
+
+def step_response_costs(
+    time: np.ndarray,
+    position: np.ndarray,
+    control: np.ndarray,
+    target: float,
+    output_limit: float | None,
+    settling_band: float = 0.02,
+) -> dict[str, np.ndarray]:
+    # Normalized so that 1.0 is "bad" for every term and weights are comparable:
+    # IAE against a run that never moves, overshoot as a fraction of the step,
+    # settling time as a fraction of the run, peak effort against the limit.
+    scale = abs(target) or 1.0
+    duration = time[-1] - time[0] or 1.0
+    settling = metrics.settling_time(time, position, target, settling_band)
+    peak_control = metrics.peak_force(control)
+    if output_limit is not None:
+        peak_control = peak_control / abs(output_limit)
+
+    costs = {
+        "iae": metrics.iae(time, position, target) / (scale * duration),
+        "overshoot": metrics.overshoot(position, target),
+        "settling_time": np.where(np.isnan(settling), duration, settling) / duration,
+        "peak_control": peak_control,
+    }
+    finite = np.all(np.isfinite(position), axis=1)
+    return {name: np.where(finite, value, np.inf) for name, value in costs.items()}
+
+
+def _resolve(
+    overrides: Mapping[str, object] | None, defaults: Mapping[str, object], kind: str
+) -> dict:
+    resolved = dict(defaults)
+    for name, value in (overrides or {}).items():
+        if name not in defaults:
+            raise ValueError(f"unknown {kind} {name!r}; expected one of {sorted(defaults)}")
+        resolved[name] = value
+    return resolved
+
+
+def autotune(
+    target: float = 0.15,
+    duration: float = 3.0,
+    dt: float = 0.01,
+    plant_mass: float = 1.0,
+    plant_damping: float = 5.0,
+    plant_stiffness: float = 20.0,
+    integral_limit: float | None = 10.0,
+    output_limit: float | None = 120.0,
+    bounds: Mapping[str, tuple[float, float]] | None = None,
+    weights: Mapping[str, float] | None = None,
+    population: int = 24,
+    generations: int = 40,
+    mutation: float = 0.7,
+    crossover: float = 0.9,
+    tolerance: float = 1e-6,
+    seed: int | None = None,
+    backend: str = "auto",
+    callback: Callable[[int, TuneResult], None] | None = None,
+) -> TuneResult:
+    bounds = _resolve(bounds, DEFAULT_BOUNDS, "gain")
+    weights = _resolve(weights, DEFAULT_WEIGHTS, "cost")
+    if population < 4:
+        raise ValueError("population must be >= 4")
+    if generations < 0:
+        raise ValueError("generations must be >= 0")
+    if not 0.0 < mutation <= 2.0:
+        raise ValueError("mutation must be in (0, 2]")
+    if not 0.0 <= crossover <= 1.0:
+        raise ValueError("crossover must be in [0, 1]")
+    low = np.array([float(bounds[name][0]) for name in GAINS])
+    high = np.array([float(bounds[name][1]) for name in GAINS])
+    if np.any(high < low):
+        raise ValueError("each gain bound must be (low, high) with low <= high")
+
+    def evaluate(candidates: np.ndarray) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        result = simulate_pid_batch(
+            kp=candidates[:, 0],
+            ki=candidates[:, 1],
+            kd=candidates[:, 2],
+            target=target,
+            duration=duration,
+            dt=dt,
+            plant_mass=plant_mass,
+            plant_damping=plant_damping,
+            plant_stiffness=plant_stiffness,
+            integral_limit=integral_limit,
+            output_limit=output_limit,
+            backend=backend,
+        )
+        terms = step_response_costs(
+            result["time"], result["position"], result["control"], target, output_limit
+        )
+        total = np.zeros(len(candidates))
+        for name, weight in weights.items():
+            if weight:
+                total = total + weight * terms[name]
+        return total, terms
+
+    def best_of(
+        members: np.ndarray, costs: np.ndarray, terms: dict[str, np.ndarray], history: list[float]
+    ) -> TuneResult:
+        best = int(np.argmin(costs))
+        return TuneResult(
+            kp=float(members[best, 0]),
+            ki=float(members[best, 1]),
+            kd=float(members[best, 2]),
+            cost=float(costs[best]),
+            terms={name: float(value[best]) for name, value in terms.items()},
+            history=list(history),
+            evaluations=evaluations,
+        )
+
+    rng = np.random.default_rng(seed)
+    members = low + rng.random((population, len(GAINS))) * (high - low)
+    costs, terms = evaluate(members)
+    evaluations = population
+    history = [float(np.min(costs))]
+    if callback is not None:
+        callback(0, best_of(members, costs, terms, history))
+
+    rows = np.arange(population)
+    for generation in range(1, generations + 1):
+        # Three distinct donors per member, none equal to the member itself.
+        donors = np.argsort(rng.random((population, population - 1)), axis=1)[:, :3]
+        donors += donors >= rows[:, None]
+        a, b, c = (members[donors[:, k]] for k in range(3))
+        mutant = a + mutation * (b - c)
+        # Reflect out-of-range coordinates back inside the box.
+        mutant = np.where(mutant < low, 2.0 * low - mutant, mutant)
+        mutant = np.where(mutant > high, 2.0 * high - mutant, mutant)
+        mutant = np.clip(mutant, low, high)
+
+        cross = rng.random(members.shape) < crossover
+        cross[rows, rng.integers(0, len(GAINS), population)] = True
+        trial = np.where(cross, mutant, members)
+
+        trial_costs, trial_terms = evaluate(trial)
+        evaluations += population
+        improved = trial_costs <= costs
+        members[improved] = trial[improved]
+        costs = np.where(improved, trial_costs, costs)
+        terms = {name: np.where(improved, trial_terms[name], terms[name]) for name in terms}
+        history.append(float(np.min(costs)))
+        if callback is not None:
+            callback(generation, best_of(members, costs, terms, history))
+
+        finite = costs[np.isfinite(costs)]
+        if len(finite) == population and np.ptp(finite) <= tolerance * max(1.0, finite.min()):
+            break
+
+    return best_of(members, costs, terms, history)
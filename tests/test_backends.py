@@ -0,0 +1,117 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics import backends
+from interactive_haptics.control import (
+    simulate_admittance,
+    simulate_pid,
+    simulate_pid_batch,
+    simulate_virtual_wall,
+)
+
+
+class _UncompiledJitBackend(backends.NumbaBackend):
+    # Runs the JIT loop kernels as plain Python so they are covered without numba.
+    name = "uncompiled-jit"
+
+    def __init__(self) -> None:
+        self._pid_loop = backends._pid_loop
+        self._admittance_loop = backends._admittance_loop
+        self._wall_loop = backends._wall_loop
+
+
+class BackendConformanceTests(unittest.TestCase):
+    def backends_under_test(self) -> list[backends.SimulationBackend]:
+        found = [backends.get_backend(name) for name in backends.available_backends()]
+        return found + [_UncompiledJitBackend()]
+
+    def assert_results_close(self, expected, actual, name: str) -> None:
+        for key in expected:
+            np.testing.assert_allclose(
+                actual[key], expected[key], rtol=1e-9, atol=1e-10, err_msg=f"{name}: {key}"
+            )
+
+    def test_reference_and_numpy_are_registered(self) -> None:
+        self.assertIn("python", backends.available_backends())
+        self.assertIn("numpy", backends.available_backends())
+        self.assertIn(backends.get_backend("auto").name, {"numpy", "numba"})
+
+    def test_unknown_backend_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_pid(backend="fortran")
+
+    def test_numba_backend_when_installed(self) -> None:
+        if backends.numba is None:
+            self.skipTest("numba is not installed")
+        self.assertEqual(backends.get_backend("auto").name, "numba")
+
+    def test_pid_backends_agree(self) -> None:
+        cases = (
+            {},
+            {"kp": 400.0, "ki": 100.0, "kd": 5.0, "dt": 1e-3, "duration": 2.0},
+        )
+        for params in cases:
+            expected = simulate_pid(backend="python", **params)
+            for backend in self.backends_under_test():
+                with self.subTest(backend=backend.name, params=params):
+                    actual = self._run(backend, simulate_pid, **params)
+                    self.assert_results_close(expected, actual, backend.name)
+
+    def test_pid_batch_backends_agree(self) -> None:
+        params = {
+            "kp": np.array([12.0, 400.0, 50.0]),
+            "ki": np.array([1.2, 100.0, 0.0]),
+            "kd": np.array([0.4, 5.0, 1.0]),
+            "output_limit": None,
+            "duration": 1.0,
+            "dt": 1e-3,
+        }
+        expected = simulate_pid_batch(backend="python", **params)
+        for backend in self.backends_under_test():
+            with self.subTest(backend=backend.name):
+                actual = self._run(backend, simulate_pid_batch, **params)
+                self.assert_results_close(expected, actual, backend.name)
+
+    def test_admittance_backends_agree(self) -> None:
+        params = {"stiffness": 3000.0, "damping": 4.0, "dt": 1e-3, "duration": 3.0}
+        expected = simulate_admittance(backend="python", **params)
+        for backend in self.backends_under_test():
+            with self.subTest(backend=backend.name):
+                actual = self._run(backend, simulate_admittance, **params)
+                self.assert_results_close(expected, actual, backend.name)
+
+    def test_virtual_wall_backends_agree(self) -> None:
+        params = {"stiffness": 900.0, "friction": 0.5, "dt": 0.005}
+        expected = simulate_virtual_wall(backend="python", **params)
+        for backend in self.backends_under_test():
+            with self.subTest(backend=backend.name):
+                actual = self._run(backend, simulate_virtual_wall, **params)
+                self.assert_results_close(expected, actual, backend.name)
+
+    def test_virtual_wall_kernels_broadcast(self) -> None:
+        position = np.linspace(0.6, 0.9, 7)
+        velocity = np.linspace(-1.0, 1.0, 7)
+        stiffness = np.array([[50.0], [500.0]])
+        expected = backends.get_backend("python").virtual_wall(
+            position, velocity, 0.7, stiffness, 3.0, 0.2, np.inf
+        )
+        for backend in self.backends_under_test():
+            with self.subTest(backend=backend.name):
+                actual = backend.virtual_wall(position, velocity, 0.7, stiffness, 3.0, 0.2, np.inf)
+                np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+    def _run(self, backend, function, **params):
+        backends.register_backend(backend)
+        try:
+            return function(backend=backend.name, **params)
+        finally:
+            self._unregister_extra(backend)
+
+    def _unregister_extra(self, backend) -> None:
+        if isinstance(backend, _UncompiledJitBackend):
+            backends._BACKENDS.pop(backend.name, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
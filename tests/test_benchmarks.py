@@ -0,0 +1,34 @@
+import unittest
+
+from benchmarks.bench_control import QUICK_MATRIX, build_cases, compare, run_suite
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_cases_respect_sample_cap(self) -> None:
+        matrix = {"duration": (1.0,), "dt": (1e-3,), "batch": (1, 100)}
+        cases = build_cases(matrix, ["numpy"], max_samples=50_000)
+        self.assertTrue(cases)
+        self.assertTrue(all(case.steps * case.batch <= 50_000 for case in cases))
+        self.assertNotIn(100, {case.batch for case in cases})
+
+    def test_suite_records_metrics(self) -> None:
+        matrix = {**QUICK_MATRIX, "batch": (1,), "duration": (0.05,)}
+        report = run_suite(build_cases(matrix, ["numpy"], 10**6), repeat=1, verbose=False)
+        self.assertIn("numpy", report["meta"])
+        for row in report["results"].values():
+            self.assertGreater(row["wall_time_s"], 0.0)
+            self.assertGreater(row["per_step_ns"], 0.0)
+            self.assertGreaterEqual(row["peak_memory_bytes"], 0.0)
+
+    def test_compare_flags_regressions_only_above_threshold(self) -> None:
+        baseline = {"results": {"a": {"wall_time_s": 1.0, "peak_memory_bytes": 100.0}}}
+        faster = {"results": {"a": {"wall_time_s": 1.1, "peak_memory_bytes": 100.0}}}
+        slower = {"results": {"a": {"wall_time_s": 1.5, "peak_memory_bytes": 100.0}}}
+        unknown = {"results": {"b": {"wall_time_s": 9.0, "peak_memory_bytes": 1.0}}}
+        self.assertEqual(compare(faster, baseline, threshold=1.25), [])
+        self.assertEqual(len(compare(slower, baseline, threshold=1.25)), 1)
+        self.assertEqual(compare(unknown, baseline), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
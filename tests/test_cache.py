@@ -0,0 +1,143 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+import interactive_haptics
+from interactive_haptics.cache import ResultCache, cache_key
+from interactive_haptics.control import simulate_admittance, simulate_pid, simulate_pid_batch
+
+
+class CacheKeyTests(unittest.TestCase):
+    def test_key_is_canonical(self) -> None:
+        first = cache_key("simulate_pid", {"kp": 1, "kd": 0.5}, "numpy")
+        self.assertEqual(first, cache_key("simulate_pid", {"kd": 0.5, "kp": 1.0}, "numpy"))
+        self.assertNotEqual(first, cache_key("simulate_pid", {"kp": 1.0, "kd": 0.6}, "numpy"))
+        self.assertNotEqual(
+            first, cache_key("simulate_admittance", {"kp": 1.0, "kd": 0.5}, "numpy")
+        )
+        self.assertNotEqual(first, cache_key("simulate_pid", {"kp": 1.0, "kd": 0.5}, "python"))
+
+    def test_key_depends_on_version_and_array_contents(self) -> None:
+        kp = np.linspace(1.0, 2.0, 5)
+        key = cache_key("simulate_pid_batch", {"kp": kp}, "numpy")
+        self.assertEqual(key, cache_key("simulate_pid_batch", {"kp": kp.copy()}, "numpy"))
+        changed = kp.copy()
+        changed[3] += 1e-12
+        self.assertNotEqual(key, cache_key("simulate_pid_batch", {"kp": changed}, "numpy"))
+        with mock.patch.object(interactive_haptics, "__version__", "0.0.0-test"):
+            self.assertNotEqual(key, cache_key("simulate_pid_batch", {"kp": kp}, "numpy"))
+
+    def test_unhashable_parameter_rejected(self) -> None:
+        with self.assertRaises(TypeError):
+            cache_key("simulate_pid", {"kp": object()}, "numpy")
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_memory_hits_skip_the_simulation(self) -> None:
+        cache = ResultCache(max_entries=4)
+        calls = []
+
+        def simulate_pid_counted(backend: str = "auto", **params):
+            calls.append(params)
+            return simulate_pid(backend=backend, **params)
+
+        first = cache.call(simulate_pid_counted, backend="numpy", kp=20.0, duration=1.0)
+        second = cache.call(simulate_pid_counted, backend="numpy", kp=20.0, duration=1.0)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        np.testing.assert_array_equal(first["position"], second["position"])
+        expected = simulate_pid(kp=20.0, duration=1.0, backend="numpy")
+        np.testing.assert_array_equal(second["position"], expected["position"])
+        with self.assertRaises(ValueError):
+            second["position"][0] = 1.0
+
+    def test_defaults_are_part_of_the_key(self) -> None:
+        cache = ResultCache()
+        cache.call(simulate_pid, backend="numpy")
+        cache.call(simulate_pid, backend="numpy", kp=12.0)
+        cache.call(simulate_pid, backend="numpy", kp=12, ki=1.2)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        cache.call(simulate_pid, backend="numpy", kp=13.0)
+        self.assertEqual(cache.misses, 2)
+        with self.assertRaises(TypeError):
+            cache.call(simulate_pid, backend="numpy", gain=1.0)
+
+    def test_non_euler_integrators_are_cached(self) -> None:
+        cache = ResultCache()
+        first = cache.call(simulate_pid, integrator="rk4", kp=20.0, duration=0.5)
+        second = cache.call(simulate_pid, integrator="rk4", kp=20.0, duration=0.5)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        expected = simulate_pid(integrator="rk4", kp=20.0, duration=0.5)
+        np.testing.assert_array_equal(first["position"], expected["position"])
+        np.testing.assert_array_equal(second["position"], expected["position"])
+        with self.assertRaises(ValueError):
+            cache.call(simulate_pid, backend="numpy", integrator="rk4")
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        cache = ResultCache(max_entries=2)
+        for kp in (1.0, 2.0):
+            cache.call(simulate_pid, backend="numpy", kp=kp, duration=0.5)
+        cache.call(simulate_pid, backend="numpy", kp=1.0, duration=0.5)
+        cache.call(simulate_pid, backend="numpy", kp=3.0, duration=0.5)
+        self.assertEqual(len(cache), 2)
+        cache.call(simulate_pid, backend="numpy", kp=1.0, duration=0.5)
+        cache.call(simulate_pid, backend="numpy", kp=2.0, duration=0.5)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_disk_tier_survives_a_new_cache(self) -> None:
+        kp = np.array([5.0, 50.0])
+        writer = ResultCache(directory=self.tmp)
+        written = writer.call(simulate_pid_batch, backend="numpy", kp=kp, duration=1.0)
+        self.assertEqual(len(list(self.tmp.glob("*.npz"))), 1)
+        self.assertEqual(list(self.tmp.glob("*.tmp")), [])
+
+        reader = ResultCache(directory=self.tmp)
+        loaded = reader.call(simulate_pid_batch, backend="numpy", kp=kp, duration=1.0)
+        self.assertEqual(reader.stats()["disk_hits"], 1)
+        self.assertEqual(set(loaded), set(written))
+        for key in written:
+            np.testing.assert_array_equal(loaded[key], written[key])
+        reader.call(simulate_pid_batch, backend="numpy", kp=kp, duration=1.0)
+        self.assertEqual((reader.hits, reader.disk_hits, reader.misses), (2, 1, 0))
+
+    def test_disk_tier_is_trimmed_oldest_first(self) -> None:
+        probe = ResultCache(max_entries=0, directory=self.tmp / "probe")
+        probe.call(simulate_admittance, backend="numpy", duration=1.0)
+        entry_size = probe.stats()["disk_bytes"]
+
+        cache = ResultCache(
+            max_entries=0,
+            directory=self.tmp / "capped",
+            max_disk_bytes=2 * entry_size + entry_size // 2,
+        )
+        for stiffness in (10.0, 20.0, 30.0):
+            cache.call(simulate_admittance, backend="numpy", stiffness=stiffness, duration=1.0)
+        self.assertLessEqual(cache.stats()["disk_bytes"], cache.max_disk_bytes)
+        self.assertEqual(len(list((self.tmp / "capped").glob("*.npz"))), 2)
+        cache.call(simulate_admittance, backend="numpy", stiffness=30.0, duration=1.0)
+        cache.call(simulate_admittance, backend="numpy", stiffness=10.0, duration=1.0)
+        self.assertEqual((cache.disk_hits, cache.misses), (1, 4))
+
+    def test_clear_resets_counters(self) -> None:
+        cache = ResultCache(directory=self.tmp)
+        cache.call(simulate_admittance, backend="numpy", duration=0.5)
+        cache.clear(disk=True)
+        self.assertEqual(
+            cache.stats(),
+            {"hits": 0, "disk_hits": 0, "misses": 0, "entries": 0, "disk_bytes": 0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
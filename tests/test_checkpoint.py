@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from interactive_haptics.checkpoint import Checkpoint, resume_simulation, simulate_resumable
+from interactive_haptics.control import (
+    MassSpringDamperPlant,
+    simulate_admittance,
+    simulate_pid,
+    simulate_virtual_wall,
+)
+from interactive_haptics.lti import AdmittanceSolver, PIDSolver
+
+
+class PlantTests(unittest.TestCase):
+    def test_plant_validates(self) -> None:
+        with self.assertRaises(ValueError):
+            MassSpringDamperPlant(mass=0.0).step(1.0, 0.01)
+
+
+class ResumeTests(unittest.TestCase):
+    def assert_results_close(self, expected, actual) -> None:
+        self.assertEqual(set(expected), set(actual))
+        for key in expected:
+            np.testing.assert_allclose(actual[key], expected[key], rtol=1e-9, atol=1e-10)
+
+    def test_resumed_runs_match_full_runs(self) -> None:
+        cases = (
+            ("simulate_pid", simulate_pid, {"kp": 300.0, "kd": 4.0}),
+            ("simulate_admittance", simulate_admittance, {"stiffness": 80.0}),
+            ("simulate_virtual_wall", simulate_virtual_wall, {"damping": 6.0}),
+        )
+        for name, function, params in cases:
+            with self.subTest(function=name):
+                short, checkpoint = simulate_resumable(name, duration=2.0, dt=1e-3, **params)
+                self.assert_results_close(
+                    function(duration=2.0, dt=1e-3, backend="numpy", **params), short
+                )
+                checkpoint = Checkpoint.from_json(checkpoint.to_json())
+                extended, checkpoint = resume_simulation(short, checkpoint, 7.5)
+                full = function(duration=7.5, dt=1e-3, backend="numpy", **params)
+                self.assert_results_close(full, extended)
+                self.assertEqual(checkpoint.samples, len(full["time"]))
+
+                again, _ = resume_simulation(extended, checkpoint, 9.0)
+                self.assert_results_close(
+                    function(duration=9.0, dt=1e-3, backend="numpy", **params), again
+                )
+
+    def test_resume_only_simulates_new_samples(self) -> None:
+        short, checkpoint = simulate_resumable("simulate_admittance", duration=1.0)
+        marked = dict(short)
+        marked["position"] = np.full_like(short["position"], 123.0)
+        extended, _ = resume_simulation(marked, checkpoint, 2.0)
+        np.testing.assert_array_equal(extended["position"][: checkpoint.samples], 123.0)
+        self.assertFalse(np.any(extended["position"][checkpoint.samples :] == 123.0))
+
+    def test_extension_only_advances_the_new_samples(self) -> None:
+        for name, solver_class in (
+            ("simulate_pid", PIDSolver),
+            ("simulate_admittance", AdmittanceSolver),
+        ):
+            with self.subTest(function=name):
+                short, checkpoint = simulate_resumable(name, duration=5.0, dt=1e-3)
+                advance = solver_class.advance
+                with mock.patch.object(
+                    solver_class, "advance", autospec=True, side_effect=advance
+                ) as spy:
+                    extended, _ = resume_simulation(short, checkpoint, 5.1)
+                new = len(extended["time"]) - checkpoint.samples
+                self.assertGreater(new, 0)
+                solvers = {id(call.args[0]): call.args[0] for call in spy.call_args_list}
+                self.assertEqual(len(solvers), 1)
+                solver = next(iter(solvers.values()))
+                # The precomputed block is sized to the extension, not the run.
+                self.assertEqual(solver._propagator.block_size, new)
+                advanced = sum(
+                    call.args[1] if name == "simulate_pid" else len(call.args[1])
+                    for call in spy.call_args_list
+                )
+                self.assertEqual(advanced, new)
+
+    def test_resume_validation(self) -> None:
+        short, checkpoint = simulate_resumable("simulate_pid", duration=2.0)
+        same, unchanged = resume_simulation(short, checkpoint, 2.0)
+        self.assertIs(same, short)
+        self.assertIs(unchanged, checkpoint)
+        with self.assertRaises(ValueError):
+            resume_simulation(short, checkpoint, 1.0)
+        with self.assertRaises(ValueError):
+            resume_simulation({"time": short["time"][:-1]}, checkpoint, 3.0)
+        with self.assertRaises(ValueError):
+            simulate_resumable("simulate_impedance")
+        with self.assertRaises(TypeError):
+            simulate_resumable("simulate_pid", stiffness=3.0)
+        with self.assertRaises(ValueError):
+            simulate_resumable("simulate_pid", plant_mass=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ import numpy as np
 from interactive_haptics.control import (
     simulate_admittance,
     simulate_pid,
+    simulate_pid_batch,
     simulate_virtual_wall,
     virtual_wall_force,
 )
@@ -28,6 +29,37 @@ class ControlSimulationTests(unittest.TestCase):
         self.assertEqual(n, len(result["control"]))
         self.assertTrue(np.all(np.isfinite(result["control"])))
 
+    def test_pid_batch_matches_scalar_runs(self) -> None:
+        kp = np.array([12.0, 40.0, 2.0, 300.0])
+        ki = np.array([1.2, 8.0, 0.0, 50.0])
+        kd = np.array([0.4, 2.0, 0.1, 9.0])
+        stiffness = np.array([20.0, 5.0, 60.0, 20.0])
+        batch = simulate_pid_batch(
+            kp=kp, ki=ki, kd=kd, target=0.3, duration=2.0, plant_stiffness=stiffness
+        )
+        self.assertEqual(batch["position"].shape, (4, len(batch["time"])))
+        for idx in range(len(kp)):
+            scalar = simulate_pid(
+                kp=kp[idx],
+                ki=ki[idx],
+                kd=kd[idx],
+                target=0.3,
+                duration=2.0,
+                plant_stiffness=stiffness[idx],
+            )
+            for key in ("position", "velocity", "control", "target"):
+                np.testing.assert_allclose(batch[key][idx], scalar[key], rtol=1e-12, atol=1e-12)
+
+    def test_pid_batch_applies_limits(self) -> None:
+        batch = simulate_pid_batch(kp=[500.0, 500.0], output_limit=[5.0, 50.0], duration=0.5)
+        self.assertLessEqual(float(np.max(np.abs(batch["control"][0]))), 5.0)
+        self.assertLessEqual(float(np.max(np.abs(batch["control"][1]))), 50.0)
+        self.assertGreater(float(np.max(np.abs(batch["control"][1]))), 5.0)
+
+    def test_pid_batch_rejects_invalid_mass(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_pid_batch(plant_mass=[1.0, 0.0])
+
     def test_admittance_zero_force_stays_near_origin(self) -> None:
         result = simulate_admittance(
             force_amplitude=0.0,
@@ -74,6 +106,31 @@ class ControlSimulationTests(unittest.TestCase):
         )
         self.assertAlmostEqual(force, -20.0, places=6)
 
+    def test_virtual_wall_force_accepts_arrays(self) -> None:
+        position = np.array([0.4, 0.75, 0.9, 0.8])
+        velocity = np.array([0.3, 0.0, -0.5, 2.0])
+        forces = virtual_wall_force(position, velocity, max_force=30.0)
+        self.assertEqual(forces.shape, position.shape)
+        for idx in range(len(position)):
+            expected = virtual_wall_force(
+                float(position[idx]), float(velocity[idx]), max_force=30.0
+            )
+            self.assertEqual(float(forces[idx]), expected)
+
+    def test_virtual_wall_force_broadcasts_over_wall_parameters(self) -> None:
+        position = np.linspace(0.5, 1.0, 11)
+        velocity = np.full_like(position, 0.2)
+        stiffness = np.array([[10.0], [100.0], [1000.0]])
+        forces = virtual_wall_force(position, velocity, stiffness=stiffness, max_force=None)
+        self.assertEqual(forces.shape, (3, 11))
+        self.assertTrue(np.all(np.diff(forces[:, -1]) < 0.0))
+
+    def test_virtual_wall_force_validates_array_parameters(self) -> None:
+        with self.assertRaises(ValueError):
+            virtual_wall_force(0.8, 0.0, stiffness=np.array([10.0, -1.0]))
+        with self.assertRaises(ValueError):
+            virtual_wall_force(0.8, 0.0, max_force=np.array([5.0, 0.0]))
+
     def test_virtual_wall_simulation_shapes(self) -> None:
         result = simulate_virtual_wall(duration=2.0, dt=0.02)
         n = len(result["time"])
@@ -0,0 +1,162 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import virtual_wall_force
+from interactive_haptics.coupling import CoupledWall
+from interactive_haptics.jobs import BackgroundJob
+from interactive_haptics.servo import VirtualWall
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1e-6
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class StallingWall(VirtualWall):
+    # Every 100th force evaluation stalls the clock for 5 ms, like a physics
+    # thread starved by a busy UI thread.
+    __slots__ = ("clock", "calls")
+
+    def __init__(self, clock: FakeClock) -> None:
+        super().__init__()
+        self.clock = clock
+        self.calls = 0
+
+    def force(self, position: float, velocity: float) -> float:
+        self.calls += 1
+        if self.calls % 100 == 0:
+            self.clock.now += 5e-3
+        return super().force(position, velocity)
+
+
+class CoupledWallTests(unittest.TestCase):
+    def test_proxy_follows_pointer_in_free_space(self) -> None:
+        coupled = CoupledWall(VirtualWall(wall_position=0.9), position=0.1)
+        coupled.pointer = 0.5
+        for _ in range(2000):
+            state = coupled.step()
+        self.assertAlmostEqual(state.position, 0.5, places=4)
+        self.assertEqual(state.force, 0.0)
+        self.assertEqual(state.penetration, 0.0)
+
+    def test_pushing_into_wall_settles_at_spring_balance(self) -> None:
+        wall = VirtualWall(
+            wall_position=0.5, stiffness=600.0, damping=3.0, friction=0.0, max_force=None
+        )
+        coupled = CoupledWall(wall, position=0.4, coupling_stiffness=200.0)
+        coupled.pointer = 0.8
+        previous = coupled.snapshot
+        for _ in range(5000):
+            state = coupled.step()
+            expected = virtual_wall_force(
+                previous.position, previous.velocity, 0.5, 600.0, 3.0, 0.0, None
+            )
+            self.assertEqual(state.force, expected)
+            previous = state
+        balance = (200.0 * 0.8 + 600.0 * 0.5) / 800.0
+        self.assertAlmostEqual(state.position, balance, places=4)
+        self.assertAlmostEqual(state.force, -600.0 * (balance - 0.5), places=2)
+
+    def test_passivity_removes_energy_injected_by_the_sampled_wall(self) -> None:
+        def late_energy(passivity: bool) -> float:
+            wall = VirtualWall(
+                wall_position=0.5, stiffness=5000.0, damping=0.0, friction=0.0, max_force=None
+            )
+            # Without coupling damping, only the passivity controller dissipates.
+            coupled = CoupledWall(
+                wall, position=0.3, coupling_damping=0.0, passivity=passivity, rate_hz=200.0
+            )
+            coupled.pointer = 0.6
+            states = [coupled.step() for _ in range(600)]
+            return max(
+                0.5 * 0.1 * state.velocity**2
+                + 0.5 * 400.0 * (0.6 - state.position) ** 2
+                + 0.5 * 5000.0 * state.penetration**2
+                for state in states[-100:]
+            )
+
+        initial = 0.5 * 400.0 * 0.3**2
+        self.assertGreater(late_energy(False), initial)
+        self.assertLess(late_energy(True), initial)
+
+    def test_passivity_correction_respects_the_force_limit(self) -> None:
+        wall = VirtualWall(
+            wall_position=0.5, stiffness=5000.0, damping=0.0, friction=0.0, max_force=3.0
+        )
+        coupled = CoupledWall(
+            wall, position=0.3, coupling_damping=0.0, passivity=True, rate_hz=200.0
+        )
+        coupled.pointer = 0.6
+        forces = [coupled.step().force for _ in range(600)]
+        self.assertLessEqual(max(abs(force) for force in forces), 3.0)
+        self.assertIn(-3.0, forces)
+
+        # The limit of a rebound wall applies from the next step.
+        coupled.wall = VirtualWall(
+            wall_position=0.5, stiffness=5000.0, damping=0.0, friction=0.0, max_force=1.0
+        )
+        forces = [coupled.step().force for _ in range(600)]
+        self.assertLessEqual(max(abs(force) for force in forces), 1.0)
+
+    def test_run_emits_evenly_spaced_states_until_cancelled(self) -> None:
+        coupled = CoupledWall(VirtualWall(), position=0.2)
+        job = BackgroundJob(coupled.run, segment_ticks=100, realtime=False)
+        states = []
+        while len(states) < 500:
+            states.extend(job.poll())
+            job.wait(0.001)
+        job.cancel()
+        self.assertTrue(job.wait(5.0))
+        self.assertTrue(job.cancelled)
+        states.extend(job.poll())
+        times = np.array([state.time for state in states])
+        np.testing.assert_allclose(np.diff(times), 1e-3)
+        self.assertIsNotNone(coupled.stats)
+
+    def test_skipped_slots_are_integrated_and_stamped_with_slot_time(self) -> None:
+        clock = FakeClock()
+        coupled = CoupledWall(StallingWall(clock), position=0.2)
+        coupled.pointer = 0.8
+        job = BackgroundJob(
+            coupled.run, segment_ticks=200, clock=clock, sleep=clock.sleep
+        )
+        states = []
+        while len(states) < 2000:
+            states.extend(job.poll())
+            job.wait(0.001)
+        job.cancel()
+        self.assertTrue(job.wait(5.0))
+        states.extend(job.poll())
+
+        self.assertGreater(coupled.missed_ticks, 50)
+        times = np.array([state.time for state in states])
+        np.testing.assert_allclose(np.diff(times), 1e-3)
+        # Physics time keeps up with the (fake) wall clock despite the stalls.
+        self.assertAlmostEqual(times[-1], clock.now, delta=0.01)
+
+        # The skipped slots were integrated, not dropped: the trace matches
+        # stepping without any stalls.
+        reference = CoupledWall(VirtualWall(), position=0.2)
+        reference.pointer = 0.8
+        expected = [reference.step().position for _ in range(len(states))]
+        np.testing.assert_allclose([state.position for state in states], expected)
+
+    def test_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            CoupledWall(VirtualWall(), proxy_mass=0.0)
+        with self.assertRaises(ValueError):
+            CoupledWall(VirtualWall(), coupling_stiffness=-1.0)
+        with self.assertRaises(ValueError):
+            CoupledWall(VirtualWall(), coupling_damping=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
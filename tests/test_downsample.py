@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.downsample import TrajectoryIndex, lttb
+
+
+class LTTBTests(unittest.TestCase):
+    def test_keeps_endpoints_and_count(self) -> None:
+        x = np.linspace(0.0, 1.0, 1000)
+        picks = lttb(x, np.sin(20 * x), 50)
+        self.assertEqual(len(picks), 50)
+        self.assertEqual(picks[0], 0)
+        self.assertEqual(picks[-1], 999)
+        self.assertTrue(np.all(np.diff(picks) > 0))
+
+    def test_short_input_is_returned_whole(self) -> None:
+        np.testing.assert_array_equal(lttb([0.0, 1.0, 2.0], [0.0, 1.0, 0.0], 10), [0, 1, 2])
+
+    def test_keeps_an_isolated_spike(self) -> None:
+        x = np.arange(10_000, dtype=float)
+        y = np.zeros_like(x)
+        y[4321] = 1.0
+        self.assertIn(4321, lttb(x, y, 100))
+
+
+class TrajectoryIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(3)
+        self.time = np.arange(100_003) * 1e-3
+        self.values = np.cumsum(rng.normal(size=self.time.size))
+        self.values[77_777] = 1e4
+        self.index = TrajectoryIndex(self.time, {"y": self.values})
+
+    def test_window_is_bounded_and_keeps_extremes(self) -> None:
+        x, y = self.index.window("y", pixels=300)
+        self.assertLessEqual(len(x), 600)
+        self.assertTrue(np.all(np.diff(x) >= 0))
+        self.assertEqual(np.max(y), self.values.max())
+        self.assertEqual(np.min(y), self.values.min())
+
+    def test_zoomed_window_returns_raw_samples(self) -> None:
+        x, y = self.index.window("y", 10.0, 10.1, pixels=800)
+        inside = slice(9_999, 10_102)
+        np.testing.assert_array_equal(x, self.time[inside])
+        np.testing.assert_array_equal(y, self.values[inside])
+
+    def test_envelope_matches_brute_force(self) -> None:
+        envelope = self.index.envelope("y", pixels=100)
+        size = 4 ** self.index._level_for(0, self.time.size, 100)
+        blocks = [self.values[i : i + size] for i in range(0, self.values.size, size)]
+        np.testing.assert_array_equal(envelope["min"], [block.min() for block in blocks])
+        np.testing.assert_array_equal(envelope["max"], [block.max() for block in blocks])
+        np.testing.assert_allclose(envelope["mean"], [block.mean() for block in blocks])
+
+    def test_nan_does_not_hide_extremes(self) -> None:
+        values = np.array([1.0, np.nan, -2.0, 3.0, np.nan, 0.0, 0.0, 0.0])
+        index = TrajectoryIndex(np.arange(8.0), {"y": values}, factor=2)
+        envelope = index.envelope("y", pixels=1)
+        self.assertEqual(envelope["min"].min(), -2.0)
+        self.assertEqual(envelope["max"].max(), 3.0)
+
+    def test_appending_matches_a_full_build(self) -> None:
+        index = TrajectoryIndex(self.time[:0], {"y": self.values[:0]})
+        for start, stop in ((0, 1), (1, 5000), (5000, 5003), (5003, 64_000), (64_000, 100_003)):
+            index.append(self.time[start:stop], {"y": self.values[start:stop]})
+        self.assertEqual(index.depth, self.index.depth)
+        for built, appended in zip(self.index.levels["y"], index.levels["y"]):
+            for expected, actual in zip(built, appended):
+                np.testing.assert_array_equal(actual, expected)
+        np.testing.assert_array_equal(
+            index.window("y", 3.0, 90.0, pixels=300)[1],
+            self.index.window("y", 3.0, 90.0, pixels=300)[1],
+        )
+
+    def test_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            TrajectoryIndex(np.arange(3.0), {"y": np.arange(3.0)}, factor=1)
+        with self.assertRaises(ValueError):
+            TrajectoryIndex(np.arange(3.0), {"y": np.arange(4.0)})
+        with self.assertRaises(ValueError):
+            self.index.append(np.arange(3.0), {"z": np.arange(3.0)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from interactive_haptics.control import simulate_admittance
+from interactive_haptics.export import export_result, load_result, read_columnar_header
+from interactive_haptics.streaming import concat_chunks, iter_simulate_admittance
+
+
+class ExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.result = simulate_admittance(duration=2.0, dt=1e-3)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_every_format_round_trips(self) -> None:
+        for suffix in (".csv", ".npy", ".npz", ".colz"):
+            with self.subTest(suffix=suffix):
+                path = export_result(self.tmp / f"run{suffix}", self.result, block_rows=300)
+                loaded = load_result(path)
+                self.assertEqual(list(loaded), list(self.result))
+                for name, values in self.result.items():
+                    np.testing.assert_array_equal(loaded[name], values)
+
+    def test_chunks_stream_with_progress(self) -> None:
+        chunks = iter_simulate_admittance(duration=2.0, dt=1e-3, chunk_size=256)
+        progress = []
+        export_result(self.tmp / "run.colz", chunks, block_rows=100, on_block=progress.append)
+        self.assertEqual(progress[-1], len(self.result["time"]))
+        self.assertEqual(progress, sorted(progress))
+        loaded = load_result(self.tmp / "run.colz", signals=["force", "time"])
+        self.assertEqual(list(loaded), ["force", "time"])
+        np.testing.assert_array_equal(loaded["force"], self.result["force"])
+
+    def test_npy_and_npz_stream_chunks_of_unknown_length(self) -> None:
+        expected = concat_chunks(iter_simulate_admittance(duration=2.0, dt=1e-3, chunk_size=256))
+        for suffix in (".npy", ".npz"):
+            with self.subTest(suffix=suffix):
+                chunks = iter_simulate_admittance(duration=2.0, dt=1e-3, chunk_size=256)
+                progress = []
+                path = export_result(
+                    self.tmp / f"stream{suffix}", chunks, block_rows=100, on_block=progress.append
+                )
+                self.assertEqual(progress[-1], len(self.result["time"]))
+                loaded = load_result(path)
+                for name, values in expected.items():
+                    np.testing.assert_array_equal(loaded[name], values)
+        # The spool files are temporary.
+        self.assertEqual(
+            sorted(path.name for path in self.tmp.iterdir()),
+            ["stream.json", "stream.npy", "stream.npz"],
+        )
+
+    def test_npz_matches_savez(self) -> None:
+        export_result(self.tmp / "run.npz", self.result, block_rows=300)
+        np.savez(self.tmp / "reference.npz", **self.result)
+        with np.load(self.tmp / "run.npz") as run, np.load(self.tmp / "reference.npz") as ref:
+            self.assertEqual(run.files, ref.files)
+            for name in ref.files:
+                np.testing.assert_array_equal(run[name], ref[name])
+
+    def test_columnar_compression_is_per_column(self) -> None:
+        path = self.tmp / "run.colz"
+        export_result(
+            path, self.result, ["time", "force"], compression={"time": 0, "force": 6}
+        )
+        header = read_columnar_header(path)
+        self.assertEqual(header["compression"], {"time": 0, "force": 6})
+        self.assertEqual(header["rows"], len(self.result["time"]))
+        with zipfile.ZipFile(path) as archive:
+            types = {info.filename[0]: info.compress_type for info in archive.infolist()}
+        self.assertEqual(types["0"], zipfile.ZIP_STORED)
+        self.assertEqual(types["1"], zipfile.ZIP_DEFLATED)
+        np.testing.assert_array_equal(load_result(path)["time"], self.result["time"])
+
+    def test_npy_loads_as_memmap_trajectory(self) -> None:
+        export_result(self.tmp / "run.npy", self.result, function="simulate_admittance")
+        loaded = load_result(self.tmp / "run.npy")
+        self.assertIsInstance(loaded["position"], np.memmap)
+        self.assertEqual(loaded.header["function"], "simulate_admittance")
+
+    def test_unknown_format_and_signals_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            export_result(self.tmp / "run.txt", self.result)
+        export_result(self.tmp / "run.npz", self.result)
+        with self.assertRaises(ValueError):
+            load_result(self.tmp / "run.npz", signals=["missing"])
+        with self.assertRaises(ValueError):
+            export_result(self.tmp / "run.colz", self.result, compression=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
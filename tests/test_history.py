@@ -0,0 +1,104 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from interactive_haptics.control import simulate_admittance, simulate_pid
+from interactive_haptics.history import RunStore
+
+
+class RunStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.store = RunStore(self.tmp / "runs.sqlite3")
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self._tmp.cleanup()
+
+    def test_save_and_reload(self) -> None:
+        params = {"kp": 40.0, "kd": 4.0, "duration": 1.0}
+        result = simulate_pid(**params)
+        run_id = self.store.save("simulate_pid", result, params, label="baseline")
+        record = self.store.get(run_id)
+        self.assertEqual(record.function, "simulate_pid")
+        self.assertEqual(record.params, params)
+        self.assertEqual(record.label, "baseline")
+        self.assertEqual(record.rows, len(result["time"]))
+        loaded = self.store.load(run_id)
+        for name, values in result.items():
+            np.testing.assert_array_equal(loaded[name], values)
+        with self.assertRaises(KeyError):
+            self.store.get(run_id + 1)
+
+    def test_parameter_and_time_queries(self) -> None:
+        now = time.time()
+        for kp, age_days in ((5.0, 0), (15.0, 1), (25.0, 10)):
+            self.store.save(
+                "simulate_pid",
+                simulate_pid(kp=kp, duration=0.1),
+                {"kp": kp, "duration": 0.1},
+                created=now - age_days * 86400,
+            )
+        self.store.save("simulate_admittance", simulate_admittance(duration=0.1), {"kp": 50.0})
+
+        week = self.store.query("simulate_pid", since=now - 7 * 86400, where={"kp": (">", 10)})
+        self.assertEqual([record.params["kp"] for record in week], [15.0])
+        everything = self.store.query(where={"kp": (">=", 5)})
+        self.assertEqual(len(everything), 4)
+        self.assertEqual(everything[0].function, "simulate_admittance")
+        self.assertEqual(len(self.store.query(where={"duration": 0.1}, limit=2)), 2)
+        with self.assertRaises(ValueError):
+            self.store.query(where={"kp": ("LIKE", 1)})
+
+    def test_large_runs_use_memmapped_sidecars(self) -> None:
+        store = RunStore(self.tmp / "small.sqlite3", blob_limit=1024)
+        try:
+            result = simulate_admittance(duration=1.0)
+            run_id = store.save("simulate_admittance", result, {"duration": 1.0})
+            loaded = store.load(run_id)
+            self.assertIsInstance(loaded["position"], np.memmap)
+            np.testing.assert_array_equal(loaded["position"], result["position"])
+            sidecars = list(store.sidecar_directory.iterdir())
+            self.assertEqual(len(sidecars), 2)
+            del loaded
+            store.delete(run_id)
+            self.assertEqual(list(store.sidecar_directory.iterdir()), [])
+        finally:
+            store.close()
+
+    def test_retention_keeps_pinned_runs(self) -> None:
+        store = RunStore(self.tmp / "bounded.sqlite3", max_runs=2, max_age=3600.0)
+        try:
+            now = time.time()
+            result = simulate_pid(duration=0.1)
+            preset = store.save("simulate_pid", result, label="preset", pinned=True, created=now - 1e5)
+            stale = store.save("simulate_pid", result, created=now - 7200.0)
+            self.assertNotIn(stale, [record.id for record in store.query()])
+            recent = [store.save("simulate_pid", result) for _ in range(3)]
+            ids = {record.id for record in store.query()}
+            self.assertEqual(ids, {preset, *recent[1:]})
+            store.update(preset, pinned=False)
+            self.assertEqual(store.prune(), [preset])
+        finally:
+            store.close()
+
+    def test_byte_budget(self) -> None:
+        result = simulate_pid(duration=1.0)
+        size = self.store.get(self.store.save("simulate_pid", result)).bytes
+        store = RunStore(self.tmp / "budget.sqlite3", max_bytes=int(2.5 * size))
+        try:
+            for _ in range(4):
+                store.save("simulate_pid", result)
+            self.assertEqual(len(store), 2)
+            with self.assertRaises(ValueError):
+                RunStore(self.tmp / "invalid.sqlite3", max_runs=-1)
+        finally:
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
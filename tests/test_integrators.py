@@ -0,0 +1,132 @@
+import math
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import (
+    simulate_admittance,
+    simulate_admittance_batch,
+    simulate_pid,
+    simulate_pid_batch,
+)
+from interactive_haptics.integrators import recommend_dt
+
+STIFF_WALL = {"stiffness": 5000.0, "damping": 10.0, "force_amplitude": 12.0, "duration": 1.0}
+
+
+def _sampled_error(result, reference, reference_dt):
+    # Sample i holds the state at t_i + dt, so align on that time.
+    dt = result["time"][1] - result["time"][0]
+    step = int(round(dt / reference_dt))
+    aligned = reference["position"][step - 1 :: step]
+    count = min(len(aligned), len(result["position"]))
+    return float(np.max(np.abs(result["position"][:count] - aligned[:count])))
+
+
+class IntegratorAccuracyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.reference_dt = 2e-4
+        cls.reference = simulate_admittance(
+            dt=cls.reference_dt, integrator="rk45", rtol=1e-11, atol=1e-14, **STIFF_WALL
+        )
+
+    def error(self, dt, **options):
+        result = simulate_admittance(dt=dt, **options, **STIFF_WALL)
+        return _sampled_error(result, self.reference, self.reference_dt)
+
+    def test_convergence_orders(self) -> None:
+        for integrator, order in (("rk4", 4), ("implicit_midpoint", 2)):
+            with self.subTest(integrator=integrator):
+                coarse = self.error(2e-3, integrator=integrator)
+                fine = self.error(1e-3, integrator=integrator)
+                self.assertAlmostEqual(math.log2(coarse / fine), order, delta=0.3)
+
+    def test_rk4_matches_euler_accuracy_with_far_fewer_steps(self) -> None:
+        euler = self.error(2e-4, backend="numpy")
+        rk4 = self.error(2e-3, integrator="rk4")
+        self.assertLess(rk4, euler)
+
+    def test_adaptive_mode_meets_tolerance_at_coarse_sampling(self) -> None:
+        self.assertLess(self.error(1e-2, integrator="rk45", rtol=1e-8, atol=1e-11), 1e-8)
+
+    def test_implicit_midpoint_stays_bounded_where_euler_diverges(self) -> None:
+        params = {"stiffness": 1e6, "damping": 0.0, "duration": 0.5, "dt": 0.01}
+        euler = simulate_admittance(backend="numpy", **params)
+        midpoint = simulate_admittance(integrator="implicit_midpoint", **params)
+        self.assertGreater(np.max(np.abs(euler["position"])), 1.0)
+        self.assertLess(np.max(np.abs(midpoint["position"])), 1e-3)
+
+
+class IntegratorOptionTests(unittest.TestCase):
+    def test_pid_integrators_converge_to_the_same_response(self) -> None:
+        reference = simulate_pid(kp=200.0, kd=3.0, duration=0.5, dt=1e-5, backend="numpy")
+        for integrator in ("rk4", "implicit_midpoint", "rk45"):
+            with self.subTest(integrator=integrator):
+                coarse = simulate_pid(
+                    kp=200.0, kd=3.0, duration=0.5, dt=2e-4, integrator=integrator
+                )
+                self.assertLess(_sampled_error(coarse, reference, 1e-5), 1e-3)
+
+    def test_batch_rows_match_single_runs(self) -> None:
+        kp = np.array([20.0, 300.0])
+        batch = simulate_pid_batch(kp=kp, duration=0.5, dt=1e-3, integrator="rk45")
+        stiffness = np.array([100.0, 2000.0])
+        admittance = simulate_admittance_batch(stiffness=stiffness, dt=1e-3, integrator="rk4")
+        for row in range(2):
+            single = simulate_pid(kp=kp[row], duration=0.5, dt=1e-3, integrator="rk45")
+            np.testing.assert_allclose(batch["position"][row], single["position"], rtol=1e-6)
+            single = simulate_admittance(stiffness=stiffness[row], dt=1e-3, integrator="rk4")
+            np.testing.assert_allclose(admittance["position"][row], single["position"])
+
+    def test_rk45_finishes_when_an_unstable_run_overflows(self) -> None:
+        with np.errstate(all="ignore"):
+            batch = simulate_admittance_batch(
+                damping=[-50.0, 5.0], duration=30.0, integrator="rk45"
+            )
+            rk4 = simulate_admittance(damping=-50.0, duration=30.0, integrator="rk4")
+        unstable, stable = batch["position"]
+        self.assertTrue(np.isnan(unstable[-1]))
+        self.assertTrue(np.isnan(rk4["position"][-1]))
+        self.assertTrue(np.isfinite(stable).all())
+        single = simulate_admittance(damping=5.0, duration=30.0, integrator="rk45")
+        np.testing.assert_allclose(stable, single["position"], rtol=1e-6)
+
+    def test_unknown_integrator_and_tolerances(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_pid(integrator="leapfrog")
+        with self.assertRaises(ValueError):
+            simulate_admittance(integrator="rk45", rtol=0.0)
+
+    def test_backend_only_applies_to_symplectic_euler(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_pid(integrator="rk4", backend="numpy")
+        with self.assertRaises(ValueError):
+            simulate_admittance_batch(integrator="implicit_midpoint", backend="numba")
+        euler = simulate_pid(backend="numpy", duration=0.5)
+        self.assertEqual(len(euler["position"]), 51)
+
+
+class RecommendDtTests(unittest.TestCase):
+    def test_higher_order_methods_allow_larger_steps(self) -> None:
+        euler = recommend_dt(5000.0, 10.0, integrator="symplectic_euler")
+        rk4 = recommend_dt(5000.0, 10.0, integrator="rk4")
+        self.assertGreater(rk4 / euler, 5.0)
+        self.assertGreater(recommend_dt(5000.0, 10.0, integrator="implicit_midpoint"), euler)
+
+    def test_recommended_step_is_stable_and_accurate(self) -> None:
+        dt = recommend_dt(5000.0, 10.0, integrator="rk4", tolerance=1e-4)
+        result = simulate_admittance(dt=dt, integrator="rk4", **STIFF_WALL)
+        self.assertTrue(np.all(np.isfinite(result["position"])))
+        self.assertLess(np.max(np.abs(result["position"])), 0.01)
+
+    def test_stiffer_or_lighter_systems_need_smaller_steps(self) -> None:
+        self.assertLess(recommend_dt(4000.0), recommend_dt(1000.0))
+        self.assertLess(recommend_dt(1000.0, mass=0.1), recommend_dt(1000.0, mass=1.0))
+        self.assertEqual(recommend_dt(0.0, 0.0), math.inf)
+        with self.assertRaises(ValueError):
+            recommend_dt(100.0, tolerance=2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import threading
+import unittest
+
+import numpy as np
+
+from interactive_haptics.checkpoint import resume_simulation, simulate_resumable
+from interactive_haptics.jobs import BackgroundJob, JobCancelled
+from interactive_haptics.streaming import concat_chunks, iter_simulate_admittance
+
+
+def _drain(job):
+    chunks = []
+    while True:
+        done = job.done
+        chunks.extend(job.poll())
+        if done:
+            return chunks
+        job.wait(0.01)
+
+
+class BackgroundJobTests(unittest.TestCase):
+    def test_chunks_arrive_in_order_and_result_is_kept(self) -> None:
+        def target(job, count):
+            for idx in range(count):
+                job.emit(idx)
+            return "finished"
+
+        job = BackgroundJob(target, 50)
+        self.assertEqual(_drain(job), list(range(50)))
+        self.assertEqual(job.result, "finished")
+        self.assertFalse(job.cancelled)
+        self.assertIsNone(job.error)
+
+    def test_cancel_stops_at_the_next_chunk(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def target(job):
+            job.emit("first")
+            started.set()
+            release.wait(5.0)
+            job.emit("second")
+            return "unreachable"
+
+        job = BackgroundJob(target)
+        started.wait(5.0)
+        job.cancel()
+        release.set()
+        self.assertEqual(_drain(job), ["first"])
+        self.assertTrue(job.cancelled)
+        self.assertIsNone(job.result)
+        with self.assertRaises(JobCancelled):
+            job.check()
+
+    def test_errors_are_handed_to_the_caller(self) -> None:
+        def target(_job):
+            raise ValueError("dt must be > 0")
+
+        job = BackgroundJob(target)
+        self.assertTrue(job.wait(5.0))
+        self.assertIsInstance(job.error, ValueError)
+        self.assertFalse(job.cancelled)
+
+
+class ProgressiveRunTests(unittest.TestCase):
+    def test_resumable_runs_stream_their_chunks(self) -> None:
+        def target(job):
+            result, checkpoint = simulate_resumable(
+                "simulate_pid", duration=2.0, dt=1e-5, on_chunk=job.emit
+            )
+            job.emit(None)
+            extended, _ = resume_simulation(result, checkpoint, 2.5, on_chunk=job.emit)
+            return result, extended
+
+        job = BackgroundJob(target)
+        chunks = _drain(job)
+        marker = chunks.index(None)
+        first, extension = chunks[:marker], chunks[marker + 1 :]
+        result, extended = job.result
+        self.assertGreater(len(first), 1)
+        for key in result:
+            np.testing.assert_array_equal(concat_chunks(first)[key], result[key])
+            np.testing.assert_array_equal(
+                concat_chunks([result, *extension])[key], extended[key]
+            )
+
+    def test_cached_runs_keep_their_checkpoint(self) -> None:
+        try:
+            from interactive_haptics import gui
+        except ImportError:
+            self.skipTest("tkinter is not available")
+        params = {"duration": 1.0, "dt": 1e-3, "stiffness": 61.0}
+        result, checkpoint, how = gui._resumable_run("simulate_admittance", None, None, **params)
+        self.assertEqual(how, "computed")
+        cached, cached_checkpoint, how = gui._resumable_run(
+            "simulate_admittance", None, None, **params
+        )
+        self.assertEqual(how, "cached")
+        self.assertEqual(cached_checkpoint, checkpoint)
+        self.assertEqual(list(cached), list(result))
+
+        extended, _, how = gui._resumable_run(
+            "simulate_admittance", cached_checkpoint, cached, **{**params, "duration": 2.0}
+        )
+        self.assertEqual(how, "extended")
+        full, _ = simulate_resumable("simulate_admittance", duration=2.0, dt=1e-3, stiffness=61.0)
+        np.testing.assert_allclose(extended["position"], full["position"], rtol=1e-9, atol=1e-12)
+
+    def test_concurrent_cache_hits_do_not_mark_a_run_cached(self) -> None:
+        try:
+            from interactive_haptics import gui
+        except ImportError:
+            self.skipTest("tkinter is not available")
+        warm = {"duration": 0.5, "dt": 1e-3, "stiffness": 62.0}
+        gui._resumable_run("simulate_admittance", None, None, **warm)
+        warm_key = gui.cache_key(
+            "simulate_admittance", {"stiffness": 62.0, "duration": 0.5, "dt": 1e-3}, "resumable"
+        )
+        stop = threading.Event()
+
+        def hit_warm_entry() -> None:
+            # Another tab serving its own hits while this run misses.
+            while not stop.is_set():
+                gui._RESULT_CACHE.get(warm_key)
+
+        worker = threading.Thread(target=hit_warm_entry)
+        worker.start()
+        try:
+            for stiffness in (63.0, 64.0, 65.0):
+                params = {"duration": 0.5, "dt": 1e-3, "stiffness": stiffness}
+                _, _, how = gui._resumable_run("simulate_admittance", None, None, **params)
+                self.assertEqual(how, "computed")
+        finally:
+            stop.set()
+            worker.join()
+
+    def test_run_buffer_collects_chunks_without_reconcatenating(self) -> None:
+        try:
+            from interactive_haptics import gui
+        except ImportError:
+            self.skipTest("tkinter is not available")
+        chunks = list(iter_simulate_admittance(duration=2.0, dt=1e-3, chunk_size=150))
+        expected = concat_chunks(chunks)
+        for capacity in (1, len(expected["time"])):
+            with self.subTest(capacity=capacity):
+                buffer = gui._RunBuffer(capacity)
+                reallocations = 0
+                previous = None
+                for chunk in chunks:
+                    buffer.extend([chunk])
+                    column = buffer.columns()["time"]
+                    reallocations += column.base is not previous
+                    previous = column.base
+                self.assertEqual(buffer.length, len(expected["time"]))
+                self.assertLessEqual(reallocations, 1 + int(np.ceil(np.log2(len(chunks)))))
+                for key, values in expected.items():
+                    np.testing.assert_array_equal(buffer.columns()[key], values)
+        self.assertEqual(reallocations, 1)
+
+    def test_raising_from_on_chunk_aborts_the_run(self) -> None:
+        seen = []
+
+        def stop(chunk):
+            seen.append(chunk)
+            raise JobCancelled
+
+        with self.assertRaises(JobCancelled):
+            simulate_resumable("simulate_admittance", duration=5.0, dt=1e-5, on_chunk=stop)
+        self.assertEqual(len(seen), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
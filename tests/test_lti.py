@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import simulate_admittance, simulate_pid
+from interactive_haptics.lti import (
+    LTIPropagator,
+    simulate_admittance_lti,
+    simulate_pid_lti,
+)
+
+
+class LTISolverTests(unittest.TestCase):
+    def assert_results_close(self, expected, actual) -> None:
+        self.assertEqual(set(expected), set(actual))
+        for key in expected:
+            np.testing.assert_allclose(actual[key], expected[key], rtol=1e-9, atol=1e-10)
+
+    def test_propagator_matches_recursion(self) -> None:
+        rng = np.random.default_rng(3)
+        a = np.array([[0.9, 0.1], [-0.2, 0.95]])
+        b = np.array([[0.0], [0.1]])
+        c = np.array([[1.0, 0.5]])
+        d = np.array([[0.2]])
+        inputs = rng.normal(size=50)
+        states, outputs = LTIPropagator(a, b, c, d, block_size=16).propagate(
+            np.array([1.0, -1.0]), inputs
+        )
+
+        x = np.array([1.0, -1.0])
+        for k, w in enumerate(inputs):
+            self.assertAlmostEqual(float(outputs[k, 0]), float(c[0] @ x + d[0, 0] * w), places=10)
+            x = a @ x + b[:, 0] * w
+            np.testing.assert_allclose(states[k], x, atol=1e-12)
+
+    def test_admittance_matches_stepping(self) -> None:
+        for params in (
+            {},
+            {"stiffness": 4000.0, "damping": 2.0, "dt": 1e-3, "duration": 6.0},
+            {"dt": 1e-4, "duration": 1.0, "block_size": 512},
+        ):
+            self.assert_results_close(
+                simulate_admittance(**{k: v for k, v in params.items() if k != "block_size"}),
+                simulate_admittance_lti(**params),
+            )
+
+    def test_unstable_admittance_matches_the_python_backend(self) -> None:
+        for duration in (0.5, 5.0, 50.0):
+            with self.subTest(duration=duration), np.errstate(all="ignore"):
+                params = {"stiffness": 1e5, "damping": 0.0, "dt": 1e-2, "duration": duration}
+                expected = simulate_admittance(backend="python", **params)["position"]
+                actual = simulate_admittance(backend="numpy", **params)["position"]
+                finite = np.isfinite(expected)
+                self.assertGreater(finite.sum(), 50)
+                np.testing.assert_allclose(actual[finite], expected[finite], rtol=1e-9)
+
+    def test_pid_matches_stepping_without_saturation(self) -> None:
+        self.assert_results_close(simulate_pid(), simulate_pid_lti())
+
+    def test_pid_falls_back_when_limits_are_hit(self) -> None:
+        for params in (
+            {"kp": 400.0, "ki": 100.0, "kd": 5.0, "dt": 1e-3, "duration": 4.0},
+            {"kp": 50.0, "kd": 1.0, "dt": 1e-4, "duration": 2.0},
+            {"kp": 2000.0, "ki": 0.0, "kd": 0.0, "target": 1.0, "duration": 3.0},
+        ):
+            expected = simulate_pid(**params)
+            self.assertTrue(np.any(np.abs(expected["control"]) >= 120.0))
+            self.assert_results_close(expected, simulate_pid_lti(**params))
+
+    def test_invalid_parameters_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_admittance_lti(mass=0.0)
+        with self.assertRaises(ValueError):
+            simulate_pid_lti(plant_mass=-1.0)
+        with self.assertRaises(ValueError):
+            simulate_pid_lti(dt=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import math
+import unittest
+
+import numpy as np
+
+from interactive_haptics import metrics
+from interactive_haptics.control import simulate_pid_batch, simulate_virtual_wall_batch
+
+
+def _trapezoid(values, time):
+    return sum(
+        0.5 * (values[i] + values[i + 1]) * (time[i + 1] - time[i])
+        for i in range(len(values) - 1)
+    )
+
+
+class ScalarReference:
+    # One run at a time, sample by sample, written for clarity rather than speed.
+    @staticmethod
+    def rise_time(time, position, target, low=0.1, high=0.9):
+        step = target - position[0]
+        if step == 0:
+            return math.nan
+        start = stop = None
+        for i, value in enumerate(position):
+            fraction = (value - position[0]) / step
+            if start is None and fraction >= low:
+                start = time[i]
+            if stop is None and fraction >= high:
+                stop = time[i]
+        if start is None or stop is None:
+            return math.nan
+        return stop - start
+
+    @staticmethod
+    def overshoot(position, target):
+        step = target - position[0]
+        scale = abs(step) or 1.0
+        direction = 1.0 if step >= 0 else -1.0
+        peak = max(direction * (value - target) for value in position)
+        return max(0.0, peak) / scale
+
+    @staticmethod
+    def settling_time(time, position, target, band=0.02):
+        scale = abs(target - position[0]) or 1.0
+        settled_at = 0
+        for i, value in enumerate(position):
+            if abs(target - value) > band * scale:
+                settled_at = i + 1
+        if settled_at == len(position):
+            return math.nan
+        return time[settled_at] - time[0]
+
+    @staticmethod
+    def steady_state_error(position, target, window=0.1):
+        tail = max(1, int(round(len(position) * window)))
+        return target - sum(position[-tail:]) / tail
+
+    @staticmethod
+    def iae(time, position, target):
+        return _trapezoid([abs(target - value) for value in position], time)
+
+    @staticmethod
+    def ise(time, position, target):
+        return _trapezoid([(target - value) ** 2 for value in position], time)
+
+    @staticmethod
+    def itae(time, position, target):
+        return _trapezoid(
+            [(t - time[0]) * abs(target - value) for t, value in zip(time, position)], time
+        )
+
+    @staticmethod
+    def peak_force(force):
+        return max(abs(value) for value in force)
+
+    @staticmethod
+    def contact_energy(time, force, velocity):
+        return _trapezoid([-f * v for f, v in zip(force, velocity)], time)
+
+
+class StepMetricTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.target = np.array([0.15, 0.15, -0.3, 0.5, 0.2, 0.0])
+        result = simulate_pid_batch(
+            kp=[12.0, 150.0, 40.0, 5.0, 300.0, 20.0],
+            ki=[1.2, 30.0, 5.0, 0.0, 0.0, 1.0],
+            kd=[0.4, 2.0, 8.0, 0.0, 0.1, 1.0],
+            target=cls.target,
+            duration=3.0,
+            dt=1e-3,
+            backend="numpy",
+        )
+        cls.time = result["time"]
+        cls.position = result["position"]
+
+    def assert_matches_reference(self, batch, reference) -> None:
+        self.assertEqual(batch.shape, (len(self.target),))
+        for row, value in enumerate(reference):
+            if math.isnan(value):
+                self.assertTrue(np.isnan(batch[row]), f"row {row}: {batch[row]} is not NaN")
+            else:
+                self.assertAlmostEqual(batch[row], value, places=10, msg=f"row {row}")
+
+    def reference(self, name, *args):
+        function = getattr(ScalarReference, name)
+        rows = []
+        for row, target in enumerate(self.target):
+            position = self.position[row].tolist()
+            time = self.time.tolist()
+            if name in ("overshoot", "steady_state_error"):
+                rows.append(function(position, float(target), *args))
+            else:
+                rows.append(function(time, position, float(target), *args))
+        return rows
+
+    def test_time_metrics_match_scalar_reference(self) -> None:
+        for name in ("rise_time", "settling_time", "iae", "ise", "itae"):
+            with self.subTest(metric=name):
+                batch = getattr(metrics, name)(self.time, self.position, self.target)
+                self.assert_matches_reference(batch, self.reference(name))
+
+    def test_shape_metrics_match_scalar_reference(self) -> None:
+        for name in ("overshoot", "steady_state_error"):
+            with self.subTest(metric=name):
+                batch = getattr(metrics, name)(self.position, self.target)
+                self.assert_matches_reference(batch, self.reference(name))
+
+    def test_single_run_returns_float(self) -> None:
+        values = metrics.step_metrics(self.time, self.position[0], 0.15)
+        self.assertEqual(
+            set(values),
+            {"rise_time", "overshoot", "settling_time", "steady_state_error", "iae", "ise", "itae"},
+        )
+        for name, value in values.items():
+            with self.subTest(metric=name):
+                self.assertIsInstance(value, float)
+                batch = metrics.step_metrics(self.time, self.position, self.target)[name]
+                np.testing.assert_equal(value, batch[0])
+
+    def test_undefined_metrics_are_nan(self) -> None:
+        time = np.linspace(0.0, 1.0, 5)
+        never_settles = np.array([0.0, 0.2, 0.4, 0.6, 0.8])
+        self.assertTrue(math.isnan(metrics.settling_time(time, never_settles, 1.0)))
+        self.assertTrue(math.isnan(metrics.rise_time(time, never_settles, 1.0)))
+        self.assertAlmostEqual(metrics.rise_time(time, never_settles, 0.8), 0.75)
+
+    def test_invalid_options(self) -> None:
+        with self.assertRaises(ValueError):
+            metrics.rise_time(self.time, self.position, 0.15, low=0.9, high=0.1)
+        with self.assertRaises(ValueError):
+            metrics.settling_time(self.time, self.position, 0.15, band=0.0)
+        with self.assertRaises(ValueError):
+            metrics.steady_state_error(self.position, 0.15, window=0.0)
+
+
+class ContactMetricTests(unittest.TestCase):
+    def test_force_metrics_match_scalar_reference(self) -> None:
+        result = simulate_virtual_wall_batch(
+            stiffness=[100.0, 250.0, 900.0], damping=[0.0, 3.0, 10.0], max_force=None
+        )
+        peak = metrics.peak_force(result["force"])
+        energy = metrics.contact_energy(result["time"], result["force"], result["velocity"])
+        time = result["time"].tolist()
+        for row in range(3):
+            force = result["force"][row].tolist()
+            velocity = result["velocity"][row].tolist()
+            self.assertAlmostEqual(peak[row], ScalarReference.peak_force(force))
+            self.assertAlmostEqual(
+                energy[row], ScalarReference.contact_energy(time, force, velocity), places=9
+            )
+        # A damped wall dissipates energy over a closed motion cycle.
+        self.assertGreater(energy[2], energy[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import simulate_virtual_wall, simulate_virtual_wall_batch
+from interactive_haptics.passivity import (
+    PassivityController,
+    PassivityObserver,
+    passivity_control,
+)
+
+STIFF_WALL = {"stiffness": 5000.0, "damping": 0.0, "friction": 0.0, "max_force": None}
+
+
+class PassivityControllerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # An undamped stiff wall sampled at 100 Hz: holding each force over the
+        # next interval makes the rendered spring return more than it absorbed.
+        self.raw = simulate_virtual_wall(**STIFF_WALL)
+        self.dt = 0.01
+
+    def test_observer_detects_sampled_spring_activity(self) -> None:
+        observer = PassivityObserver()
+        for force, velocity in zip(self.raw["force"], self.raw["velocity"]):
+            energy = observer.update(force, velocity, self.dt)
+        self.assertLess(energy, -1.0)
+
+    def test_controller_restores_passivity(self) -> None:
+        result = simulate_virtual_wall(passivity=True, **STIFF_WALL)
+        np.testing.assert_array_equal(result["raw_force"], self.raw["force"])
+        self.assertGreaterEqual(result["passivity_energy"][-1], 0.0)
+        self.assertGreater(result["passivity_energy"].min(), -2.0)
+        self.assertTrue(np.all(result["passivity_damping"] >= 0.0))
+        untouched = result["passivity_damping"] == 0.0
+        np.testing.assert_array_equal(result["force"][untouched], self.raw["force"][untouched])
+
+    def test_scalar_and_batched_controllers_agree(self) -> None:
+        for max_damping in (None, 50.0):
+            with self.subTest(max_damping=max_damping):
+                controller = PassivityController(max_damping=max_damping)
+                scalar = [
+                    controller(force, velocity, self.dt)
+                    for force, velocity in zip(self.raw["force"], self.raw["velocity"])
+                ]
+                batched = passivity_control(
+                    self.raw["force"], self.raw["velocity"], self.dt, max_damping
+                )
+                np.testing.assert_allclose(batched["force"], scalar, rtol=1e-12, atol=1e-12)
+                self.assertAlmostEqual(batched["energy"][-1], controller.energy)
+
+    def test_damping_cap(self) -> None:
+        capped = simulate_virtual_wall(passivity=True, max_damping=20.0, **STIFF_WALL)
+        free = simulate_virtual_wall(passivity=True, **STIFF_WALL)
+        self.assertLessEqual(capped["passivity_damping"].max(), 20.0)
+        self.assertGreater(free["passivity_damping"].max(), 20.0)
+        self.assertLess(capped["passivity_energy"].min(), free["passivity_energy"].min())
+
+    def test_corrected_force_stays_within_max_force(self) -> None:
+        limited = {**STIFF_WALL, "max_force": 2.0}
+        single = simulate_virtual_wall(passivity=True, **limited)
+        batch = simulate_virtual_wall_batch(
+            stiffness=[1000.0, 5000.0], damping=0.0, passivity=True, max_force=[1.0, 2.0]
+        )
+        self.assertGreater(np.abs(single["raw_force"] - single["force"]).max(), 0.0)
+        self.assertLessEqual(np.abs(single["force"]).max(), 2.0)
+        self.assertLessEqual(np.abs(batch["force"][0]).max(), 1.0)
+        self.assertLessEqual(np.abs(batch["force"][1]).max(), 2.0)
+        np.testing.assert_allclose(batch["force"][1], single["force"], atol=1e-9)
+
+        controller = PassivityController(max_force=2.0)
+        scalar = [
+            controller(force, velocity, self.dt)
+            for force, velocity in zip(single["raw_force"], single["velocity"])
+        ]
+        np.testing.assert_allclose(single["force"], scalar, rtol=1e-12, atol=1e-12)
+
+    def test_batch_rows_match_single_runs(self) -> None:
+        stiffness = np.array([250.0, 5000.0])
+        batch = simulate_virtual_wall_batch(
+            stiffness=stiffness, damping=0.0, passivity=True, max_damping=100.0
+        )
+        for row, value in enumerate(stiffness):
+            single = simulate_virtual_wall(
+                stiffness=value, damping=0.0, passivity=True, max_damping=100.0
+            )
+            for key in ("force", "raw_force", "passivity_energy", "passivity_damping"):
+                np.testing.assert_allclose(batch[key][row], single[key], atol=1e-9)
+
+    def test_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            PassivityController(max_damping=-1.0)
+        with self.assertRaises(ValueError):
+            PassivityController().update(1.0, 1.0, 0.0)
+        with self.assertRaises(ValueError):
+            passivity_control(np.zeros(3), np.zeros(3), 0.01, max_damping=-1.0)
+        with self.assertRaises(ValueError):
+            PassivityController(max_force=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
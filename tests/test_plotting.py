@@ -0,0 +1,100 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from interactive_haptics.plotting import LivePlot
+from interactive_haptics.recording import SignalLog
+
+
+class LivePlotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        figure = Figure()
+        self.canvas = FigureCanvasAgg(figure)
+        self.axes = figure.add_subplot(111)
+        (self.line,) = self.axes.plot([], [])
+        self.plot = LivePlot(self.canvas, [self.line])
+        self.draws = mock.patch.object(self.canvas, "draw_idle", wraps=self.canvas.draw_idle)
+        self.blits = mock.patch.object(self.canvas, "blit", wraps=self.canvas.blit)
+
+    def test_appending_inside_the_limits_only_blits(self) -> None:
+        x = list(np.linspace(0.0, 1.0, 100))
+        y = list(np.sin(x))
+        self.plot.update([(x, y)])
+        with self.draws as draw_idle, self.blits as blit:
+            for _ in range(5):
+                x.append(x[-1] + 1e-3)
+                y.append(0.5)
+                self.plot.update([(x, y)], start=len(x) - 1)
+        self.assertEqual(draw_idle.call_count, 0)
+        self.assertEqual(blit.call_count, 5)
+        np.testing.assert_array_equal(self.line.get_xdata(), x)
+
+    def test_limits_grow_with_headroom(self) -> None:
+        x, y = [0.0, 1.0], [0.0, 2.0]
+        self.plot.update([(x, y)])
+        with self.draws as draw_idle:
+            x.append(1.5)
+            y.append(-1.0)
+            self.plot.update([(x, y)], start=2)
+        self.assertEqual(draw_idle.call_count, 1)
+        x_min, x_max = self.axes.get_xlim()
+        y_min, y_max = self.axes.get_ylim()
+        self.assertLess(x_min, 0.0)
+        self.assertGreater(x_max, 1.5)
+        self.assertLess(y_min, -1.0)
+        self.assertGreaterEqual(y_max, 2.0)
+
+    def test_refit_shrinks_to_new_data_and_ignores_nan(self) -> None:
+        self.plot.update([([0.0, 100.0], [0.0, 100.0])])
+        self.plot.update([([0.0, 1.0, 2.0], [0.0, np.nan, 1.0])])
+        self.assertLess(self.axes.get_xlim()[1], 3.0)
+        self.assertLess(self.axes.get_ylim()[1], 2.0)
+
+    def test_long_lines_show_an_indexed_window(self) -> None:
+        x = np.linspace(0.0, 10.0, 200_001)
+        y = np.sin(x)
+        y[123_456] = 5.0
+        self.plot.update([(x, y)])
+        pixels = int(self.axes.bbox.width)
+        self.assertLessEqual(len(self.line.get_xdata()), 2 * pixels)
+        self.assertEqual(np.max(self.line.get_ydata()), 5.0)
+
+        self.axes.set_xlim(2.0, 2.001)
+        shown = self.line.get_xdata()
+        self.assertLessEqual(shown[0], 2.0)
+        self.assertGreaterEqual(shown[-1], 2.001)
+        np.testing.assert_allclose(np.diff(shown), x[1] - x[0])
+
+    def test_long_lines_append_to_the_index(self) -> None:
+        log = SignalLog(("time", "value"), capacity=50_000)
+        time = np.arange(50_000) * 1e-3
+        log.extend({"time": time, "value": np.sin(time)})
+        self.plot.update([(log["time"], log["value"])])
+        index = self.plot._indexes[self.line]
+        for _ in range(3):
+            more = log["time"][-1] + np.arange(1, 101) * 1e-3
+            log.extend({"time": more, "value": np.full(100, 7.0)})
+            self.plot.update([(log["time"], log["value"])], start=len(log) - 100)
+        self.assertIs(self.plot._indexes[self.line], index)
+        self.assertEqual(len(index.time), 50_300)
+        # Rows the log dropped are not shown.
+        self.axes.set_xlim(-1.0, 100.0)
+        self.assertGreaterEqual(self.line.get_xdata()[0], log["time"][0])
+        self.assertEqual(np.max(self.line.get_ydata()), 7.0)
+
+        self.plot.update([(log["time"], log["value"])])
+        self.assertIsNot(self.plot._indexes[self.line], index)
+
+    def test_empty_data_keeps_limits(self) -> None:
+        limits = self.axes.get_xlim()
+        self.plot.update([([], [])])
+        self.assertEqual(self.axes.get_xlim(), limits)
+        with self.assertRaises(ValueError):
+            LivePlot(self.canvas, [self.line], headroom=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import PIDController
+from interactive_haptics.realtime import HapticLoop
+
+
+class FakeClock:
+    def __init__(self, tick_cost: float = 1e-6) -> None:
+        self.now = 0.0
+        self.tick_cost = tick_cost
+
+    def __call__(self) -> float:
+        self.now += self.tick_cost
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class HapticLoopTests(unittest.TestCase):
+    def test_faster_than_realtime_drives_controller(self) -> None:
+        pid = PIDController(kp=20.0, ki=0.0, kd=0.0, output_limit=5.0)
+        outputs = []
+        times = []
+
+        def tick(t: float, dt: float) -> None:
+            times.append(t)
+            outputs.append(pid.update(1.0, 0.0, dt))
+
+        stats = HapticLoop(tick, rate_hz=2000.0, realtime=False).run(ticks=100)
+        self.assertEqual(stats.ticks, 100)
+        self.assertEqual(outputs, [5.0] * 100)
+        np.testing.assert_allclose(times, np.arange(100) / 2000.0)
+        self.assertTrue(np.all(stats.lateness == 0.0))
+
+    def test_realtime_deadlines_do_not_drift(self) -> None:
+        clock = FakeClock()
+        cost = 3e-4
+
+        def tick(_t: float, _dt: float) -> None:
+            clock.now += cost
+
+        loop = HapticLoop(tick, rate_hz=1000.0, clock=clock, sleep=clock.sleep)
+        stats = loop.run(duration=0.5)
+        self.assertEqual(stats.ticks, 500)
+        self.assertEqual(stats.overruns, 0)
+        self.assertEqual(stats.missed_ticks, 0)
+        self.assertLess(stats.summary()["jitter_max_s"], 1e-5)
+        self.assertAlmostEqual(stats.elapsed, 0.5, delta=2e-3)
+
+    def test_overruns_are_counted_and_missed_slots_skipped(self) -> None:
+        clock = FakeClock()
+        calls = []
+
+        def tick(t: float, _dt: float) -> None:
+            calls.append(t)
+            if len(calls) == 10:
+                clock.now += 3.5e-3
+
+        stats = HapticLoop(tick, rate_hz=1000.0, clock=clock, sleep=clock.sleep).run(ticks=20)
+        self.assertEqual(stats.overruns, 1)
+        self.assertEqual(stats.missed_ticks, 2)
+        self.assertAlmostEqual(calls[10], 0.012, places=9)
+        self.assertEqual(stats.ticks, 18)
+        counts, _edges = stats.overrun_histogram(bins=4)
+        self.assertEqual(int(counts.sum()), 1)
+
+    def test_stop_ends_run_early(self) -> None:
+        loop = HapticLoop(lambda t, dt: None, realtime=False)
+        loop.callback = lambda t, dt: loop.stop() if t >= 0.004 else None
+        stats = loop.run(ticks=1000)
+        self.assertTrue(stats.stopped_early)
+        self.assertEqual(stats.ticks, 5)
+
+    def test_realtime_loop_runs_on_wall_clock(self) -> None:
+        stats = HapticLoop(lambda t, dt: None, rate_hz=1000.0).run(duration=0.05)
+        self.assertEqual(stats.ticks + stats.missed_ticks, 50)
+        self.assertGreaterEqual(stats.elapsed, 0.049)
+        counts, _edges = stats.jitter_histogram(bins=10)
+        self.assertEqual(int(counts.sum()), stats.ticks)
+
+    def test_invalid_arguments_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            HapticLoop(lambda t, dt: None, rate_hz=0.0)
+        with self.assertRaises(ValueError):
+            HapticLoop(lambda t, dt: None).run()
+        with self.assertRaises(ValueError):
+            HapticLoop(lambda t, dt: None).run(duration=1.0, ticks=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
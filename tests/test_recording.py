@@ -0,0 +1,80 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from interactive_haptics.recording import SignalLog
+from interactive_haptics.storage import write_csv_blocks
+
+SIGNALS = ("time", "force")
+
+
+def _rows(start, stop):
+    return [(float(idx), -2.0 * idx) for idx in range(start, stop)]
+
+
+class SignalLogTests(unittest.TestCase):
+    def test_keeps_the_newest_rows_as_contiguous_views(self) -> None:
+        log = SignalLog(SIGNALS, capacity=4)
+        for row in _rows(0, 11):
+            log.append(*row)
+        self.assertEqual(len(log), 4)
+        self.assertEqual(log.dropped, 7)
+        np.testing.assert_array_equal(log["time"], [7.0, 8.0, 9.0, 10.0])
+        np.testing.assert_array_equal(log["force"], [-14.0, -16.0, -18.0, -20.0])
+        self.assertTrue(log["force"].flags.c_contiguous)
+        self.assertIsNotNone(log["force"].base)
+
+    def test_extend_matches_appends(self) -> None:
+        appended = SignalLog(SIGNALS, capacity=5)
+        extended = SignalLog(SIGNALS, capacity=5)
+        rows = np.array(_rows(0, 23))
+        for row in rows:
+            appended.append(*row)
+        extended.extend({"time": rows[:3, 0], "force": rows[:3, 1]})
+        extended.extend({"time": rows[3:, 0], "force": rows[3:, 1]})
+        for name in SIGNALS:
+            np.testing.assert_array_equal(extended[name], appended[name])
+        self.assertEqual(extended.dropped, appended.dropped)
+        with self.assertRaises(ValueError):
+            extended.extend({"time": [1.0, 2.0], "force": [1.0]})
+
+    def test_spilled_rows_keep_the_whole_session(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            log = SignalLog(SIGNALS, capacity=3, spill_path=Path(directory) / "log.f64")
+            for row in _rows(0, 20):
+                log.append(*row)
+            self.assertEqual(log.spilled, log.dropped)
+            session = {
+                name: np.concatenate([block[name] for block in log.iter_blocks()])
+                for name in SIGNALS
+            }
+            np.testing.assert_array_equal(session["time"], np.arange(20.0))
+
+            handle = io.StringIO()
+            for idx, block in enumerate(log.iter_blocks()):
+                write_csv_blocks(handle, block, list(SIGNALS), header=idx == 0)
+            lines = handle.getvalue().splitlines()
+            self.assertEqual(lines[0], "time,force")
+            self.assertEqual(len(lines), 21)
+
+            log.clear()
+            self.assertEqual(len(log), 0)
+            self.assertEqual(list(log.iter_blocks()), [])
+            del session, block
+
+    def test_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            SignalLog(SIGNALS, capacity=0)
+        with self.assertRaises(ValueError):
+            SignalLog(())
+        log = SignalLog(SIGNALS)
+        self.assertIn("force", log)
+        with self.assertRaises(ValueError):
+            log.append(1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import AdmittanceController, PIDController, virtual_wall_force
+from interactive_haptics.servo import FastAdmittanceController, FastPIDController, VirtualWall
+
+
+class ServoKernelTests(unittest.TestCase):
+    def test_fast_pid_matches_reference(self) -> None:
+        for limits in ({}, {"integral_limit": 0.05, "output_limit": 3.0}):
+            reference = PIDController(kp=40.0, ki=8.0, kd=0.5, **limits)
+            fast = FastPIDController(kp=40.0, ki=8.0, kd=0.5, **limits)
+            measurements = np.sin(np.linspace(0.0, 6.0, 400))
+            for measurement in measurements:
+                expected = reference.update(0.3, float(measurement), 1e-3)
+                self.assertEqual(fast.update(0.3, float(measurement), 1e-3), expected)
+                self.assertEqual(fast._integral, reference._integral)
+
+    def test_fast_pid_has_no_instance_dict(self) -> None:
+        fast = FastPIDController(kp=1.0, ki=0.0, kd=0.0)
+        self.assertFalse(hasattr(fast, "__dict__"))
+        with self.assertRaises(AttributeError):
+            fast.unexpected = 1.0
+        self.assertIsNone(fast.output_limit)
+
+    def test_fast_pid_reset_and_dt_check(self) -> None:
+        fast = FastPIDController(kp=1.0, ki=1.0, kd=1.0)
+        fast.update(1.0, 0.0, 0.1)
+        fast.reset()
+        expected = PIDController(kp=1.0, ki=1.0, kd=1.0).update(1.0, 0.0, 0.1)
+        self.assertEqual(fast.update(1.0, 0.0, 0.1), expected)
+        with self.assertRaises(ValueError):
+            fast.update(1.0, 0.0, 0.0)
+
+    def test_fast_admittance_matches_reference(self) -> None:
+        reference = AdmittanceController(stiffness=300.0, damping=6.0, mass=0.5)
+        fast = FastAdmittanceController(stiffness=300.0, damping=6.0, mass=0.5)
+        for force in 5.0 * np.cos(np.linspace(0.0, 20.0, 500)):
+            self.assertEqual(fast.step(float(force), 1e-3), reference.step(float(force), 1e-3))
+        with self.assertRaises(ValueError):
+            FastAdmittanceController(stiffness=1.0, damping=1.0, mass=0.0)
+
+    def test_virtual_wall_matches_reference(self) -> None:
+        wall = VirtualWall(
+            wall_position=0.6, stiffness=900.0, damping=4.0, friction=0.3, max_force=40.0
+        )
+        for position in np.linspace(0.4, 0.9, 41):
+            for velocity in (-2.0, -1e-10, 0.0, 1e-10, 0.5, 3.0):
+                expected = virtual_wall_force(
+                    float(position), velocity, 0.6, 900.0, 4.0, 0.3, 40.0
+                )
+                self.assertEqual(wall(float(position), velocity), expected)
+
+    def test_virtual_wall_validates_once(self) -> None:
+        with self.assertRaises(ValueError):
+            VirtualWall(stiffness=-1.0)
+        with self.assertRaises(ValueError):
+            VirtualWall(max_force=0.0)
+        self.assertIsNone(VirtualWall(max_force=None).max_force)
+
+
+if __name__ == "__main__":
+    unittest.main()
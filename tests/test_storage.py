@@ -0,0 +1,104 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from interactive_haptics.control import (
+    simulate_admittance,
+    simulate_pid,
+    simulate_virtual_wall,
+)
+from interactive_haptics.storage import open_trajectory, write_csv_blocks, write_trajectory
+
+
+class TrajectoryStorageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def assert_results_close(self, expected, actual) -> None:
+        self.assertEqual(set(expected), set(actual))
+        for key in expected:
+            np.testing.assert_allclose(actual[key], expected[key], rtol=1e-9, atol=1e-10)
+
+    def test_simulations_write_to_disk(self) -> None:
+        cases = (
+            (simulate_pid, {"kp": 300.0, "kd": 4.0, "duration": 2.0, "dt": 1e-3}),
+            (simulate_admittance, {"duration": 3.0, "dt": 1e-3}),
+            (simulate_virtual_wall, {"duration": 2.0}),
+        )
+        for function, params in cases:
+            with self.subTest(function=function.__name__):
+                path = self.tmp / f"{function.__name__}.npy"
+                written = function(out=path, **params)
+                self.assertTrue(path.exists())
+                self.assertTrue(path.with_suffix(".json").exists())
+                self.assert_results_close(function(**params), written)
+
+                reopened = open_trajectory(path)
+                self.assertEqual(reopened.header["function"], function.__name__)
+                self.assertEqual(reopened.params["duration"], params["duration"])
+                self.assert_results_close(written, reopened)
+
+    def test_columns_are_lazy_contiguous_views(self) -> None:
+        path = self.tmp / "run"
+        simulate_admittance(out=path, duration=1.0, dt=1e-3)
+        trajectory = open_trajectory(path)
+        self.assertEqual(trajectory.path, self.tmp / "run.npy")
+        self.assertEqual(trajectory.rows, 1001)
+        for column in trajectory.values():
+            self.assertIsInstance(column.base, np.memmap)
+            self.assertTrue(column.flags["C_CONTIGUOUS"])
+            self.assertFalse(column.flags["WRITEABLE"])
+
+    def test_invalid_parameters_leave_no_file(self) -> None:
+        path = self.tmp / "bad.npy"
+        with self.assertRaises(ValueError):
+            simulate_pid(out=path, plant_mass=0.0)
+        self.assertFalse(path.exists())
+
+    def test_failed_write_leaves_no_partial_file(self) -> None:
+        path = self.tmp / "run.npy"
+        simulate_admittance(out=path, duration=1.0)
+        kept = dict(open_trajectory(path))
+
+        def failing_chunks():
+            yield {"time": np.zeros(10), "position": np.ones(10)}
+            raise RuntimeError("simulation failed")
+
+        with self.assertRaises(RuntimeError):
+            write_trajectory(path, failing_chunks(), 20, ["time", "position"])
+        with self.assertRaises(ValueError):
+            write_trajectory(self.tmp / "short", failing_chunks(), 5, ["time", "position"])
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir()), ["run.json", "run.npy"])
+        self.assert_results_close(kept, open_trajectory(path))
+
+    def test_csv_blocks_match_savetxt(self) -> None:
+        result = dict(simulate_pid(duration=0.5))
+        result["control"] = result["control"].copy()
+        result["control"][:6] = [np.nan, np.inf, -np.inf, -0.0, 5e-324, 1.7e308]
+        columns = ["time", "position", "velocity", "control", "target"]
+        for rows in (0, 51):
+            with self.subTest(rows=rows):
+                sliced = {name: result[name][:rows] for name in columns}
+                blocked = io.StringIO()
+                write_csv_blocks(blocked, sliced, columns, block_rows=7)
+
+                reference = io.StringIO()
+                np.savetxt(
+                    reference,
+                    np.column_stack([sliced[name] for name in columns]),
+                    delimiter=",",
+                    header=",".join(columns),
+                    comments="",
+                )
+                self.assertEqual(blocked.getvalue(), reference.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import (
+    simulate_admittance,
+    simulate_pid,
+    simulate_virtual_wall,
+)
+from interactive_haptics.streaming import (
+    concat_chunks,
+    iter_simulate_admittance,
+    iter_simulate_pid,
+    iter_simulate_virtual_wall,
+)
+
+
+class StreamingTests(unittest.TestCase):
+    def assert_results_close(self, expected, actual) -> None:
+        self.assertEqual(set(expected), set(actual))
+        for key in expected:
+            np.testing.assert_allclose(actual[key], expected[key], rtol=1e-9, atol=1e-10)
+
+    def test_pid_chunks_match_full_run(self) -> None:
+        params = {"kp": 400.0, "ki": 100.0, "kd": 5.0, "duration": 2.0, "dt": 1e-3}
+        chunks = list(iter_simulate_pid(chunk_size=37, **params))
+        self.assertTrue(all(len(chunk["time"]) <= 37 for chunk in chunks))
+        self.assert_results_close(
+            simulate_pid(backend="python", **params), concat_chunks(chunks)
+        )
+
+    def test_admittance_chunks_match_full_run(self) -> None:
+        params = {"stiffness": 800.0, "damping": 3.0, "duration": 3.0, "dt": 1e-3}
+        self.assert_results_close(
+            simulate_admittance(backend="python", **params),
+            concat_chunks(iter_simulate_admittance(chunk_size=250, **params)),
+        )
+
+    def test_virtual_wall_chunks_match_full_run(self) -> None:
+        for chunk_size in (1, 64, 10_000):
+            with self.subTest(chunk_size=chunk_size):
+                self.assert_results_close(
+                    simulate_virtual_wall(duration=2.0),
+                    concat_chunks(iter_simulate_virtual_wall(duration=2.0, chunk_size=chunk_size)),
+                )
+
+    def test_unbounded_runs_stream_lazily(self) -> None:
+        chunks = iter_simulate_admittance(duration=None, dt=1e-3, chunk_size=100)
+        head = concat_chunks(itertools.islice(chunks, 20))
+        chunks.close()
+        bounded = simulate_admittance(duration=1.999, dt=1e-3)
+        self.assertEqual(len(head["time"]), 2000)
+        np.testing.assert_allclose(head["position"], bounded["position"], atol=1e-10)
+
+        wall = concat_chunks(itertools.islice(iter_simulate_virtual_wall(duration=None), 3))
+        self.assertEqual(len(wall["time"]), 3 * 4096)
+
+    def test_invalid_arguments_raise_eagerly(self) -> None:
+        with self.assertRaises(ValueError):
+            iter_simulate_pid(plant_mass=0.0)
+        with self.assertRaises(ValueError):
+            iter_simulate_admittance(chunk_size=0)
+        with self.assertRaises(ValueError):
+            iter_simulate_virtual_wall(stiffness=-1.0)
+        with self.assertRaises(ValueError):
+            iter_simulate_pid(duration=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
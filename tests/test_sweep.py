@@ -0,0 +1,141 @@
+import gc
+import threading
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import (
+    simulate_admittance,
+    simulate_admittance_batch,
+    simulate_pid_batch,
+    simulate_virtual_wall,
+    simulate_virtual_wall_batch,
+)
+from interactive_haptics.sweep import SweepExecutor, parameter_grid
+
+
+class BatchSimulationTests(unittest.TestCase):
+    def test_admittance_batch_rows_match_single_runs(self) -> None:
+        stiffness = np.array([10.0, 45.0, 200.0])
+        batch = simulate_admittance_batch(stiffness=stiffness, force_amplitude=5.0, duration=2.0)
+        for row, value in enumerate(stiffness):
+            single = simulate_admittance(stiffness=value, force_amplitude=5.0, duration=2.0)
+            for key in ("position", "velocity", "force"):
+                np.testing.assert_allclose(batch[key][row], single[key], rtol=1e-9, atol=1e-12)
+
+    def test_virtual_wall_batch_rows_match_single_runs(self) -> None:
+        walls = np.array([0.5, 0.7])
+        batch = simulate_virtual_wall_batch(wall_position=walls, damping=[1.0, 6.0])
+        for row, (wall, damping) in enumerate(zip(walls, (1.0, 6.0))):
+            single = simulate_virtual_wall(wall_position=wall, damping=damping)
+            for key in ("position", "velocity", "force", "penetration", "wall"):
+                np.testing.assert_allclose(batch[key][row], single[key], rtol=1e-12)
+
+    def test_batch_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            simulate_admittance_batch(mass=[1.0, 0.0])
+        with self.assertRaises(ValueError):
+            simulate_virtual_wall_batch(wall_position=[0.5, 1.5])
+
+
+class ParameterGridTests(unittest.TestCase):
+    def test_grid_is_cartesian_product(self) -> None:
+        grid = parameter_grid(kp=[1.0, 2.0, 3.0], kd=[0.1, 0.2])
+        self.assertEqual(len(grid["kp"]), 6)
+        self.assertEqual(
+            list(zip(grid["kp"], grid["kd"]))[:3], [(1.0, 0.1), (1.0, 0.2), (2.0, 0.1)]
+        )
+
+    def test_empty_axis_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            parameter_grid(kp=[])
+
+
+class SweepExecutorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = SweepExecutor(max_workers=2, chunk_size=3)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor.close()
+
+    def test_pid_sweep_matches_batch(self) -> None:
+        grid = parameter_grid(kp=[5.0, 20.0, 80.0], kd=[0.1, 1.0, 4.0])
+        progress = []
+        with self.executor.run(
+            "pid",
+            grid,
+            duration=1.0,
+            dt=1e-3,
+            backend="numpy",
+            progress=lambda done, total: progress.append((done, total)),
+        ) as result:
+            expected = simulate_pid_batch(duration=1.0, dt=1e-3, backend="numpy", **grid)
+            self.assertTrue(result.completed.all())
+            self.assertFalse(result.cancelled)
+            for key in ("position", "velocity", "control"):
+                np.testing.assert_allclose(result[key], expected[key], rtol=1e-9, atol=1e-12)
+            np.testing.assert_array_equal(result.time, expected["time"])
+        self.assertEqual(progress[-1], (9, 9))
+        self.assertEqual([total for _done, total in progress], [9] * len(progress))
+
+    def test_pool_is_reused_and_fixed_params_apply(self) -> None:
+        first = self.executor.run("admittance", {"stiffness": [10.0, 40.0]}, mass=2.0)
+        pool = self.executor._pool
+        second = self.executor.run("virtual_wall", {"wall_position": [0.5, 0.6, 0.7, 0.8]})
+        self.assertIs(self.executor._pool, pool)
+        expected = simulate_admittance_batch(stiffness=[10.0, 40.0], mass=2.0)
+        np.testing.assert_allclose(first.to_dict()["position"], expected["position"], rtol=1e-9)
+        self.assertEqual(second["force"].shape, (4, len(second.time)))
+        first.close()
+        second.close()
+        with self.assertRaises(ValueError):
+            first["position"]
+
+    def test_columns_outlive_the_result(self) -> None:
+        expected = simulate_pid_batch(kp=[5.0, 20.0], duration=0.5, dt=1e-2, backend="numpy")
+        result = self.executor.run("pid", {"kp": [5.0, 20.0]}, duration=0.5, dt=1e-2)
+        block = result._block
+        position = result["position"]
+        result.close()
+        np.testing.assert_allclose(position, expected["position"], rtol=1e-9)
+
+        result = self.executor.run("pid", {"kp": [5.0, 20.0]}, duration=0.5, dt=1e-2)
+        control = result["control"]
+        del result
+        gc.collect()
+        np.testing.assert_allclose(control, expected["control"], rtol=1e-9)
+
+        # The mapping is closed once the last column view is gone.
+        self.assertIsNotNone(block.buf)
+        del position
+        gc.collect()
+        self.assertIsNone(block.buf)
+
+    def test_cancel_stops_pending_chunks(self) -> None:
+        executor = SweepExecutor(max_workers=1, chunk_size=1)
+        try:
+            cancelled = threading.Event()
+
+            def on_progress(done: int, total: int) -> None:
+                executor.cancel()
+                cancelled.set()
+
+            result = executor.run(
+                "pid", {"kp": np.linspace(1.0, 50.0, 40)}, duration=1.0, progress=on_progress
+            )
+            self.assertTrue(cancelled.is_set())
+            self.assertTrue(result.cancelled)
+            self.assertLess(result.completed.sum(), 40)
+            result.close()
+        finally:
+            executor.close()
+
+    def test_unknown_kind(self) -> None:
+        with self.assertRaises(ValueError):
+            self.executor.run("impedance", {"kp": [1.0]})
+
+
+if __name__ == "__main__":
+    unittest.main()
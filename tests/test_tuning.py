@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from interactive_haptics.control import simulate_pid
+from interactive_haptics.tuning import autotune, step_response_costs
+
+
+class StepResponseCostTests(unittest.TestCase):
+    def test_costs_of_known_response(self) -> None:
+        time = np.linspace(0.0, 1.0, 11)
+        position = np.array([[0.0, 0.5, 1.2, 1.1, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]])
+        control = np.array([[5.0, -8.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]])
+        costs = step_response_costs(time, position, control, target=1.0, output_limit=10.0)
+        # Trapezoid over |e| = 1, 0.5, 0.2, 0.1, 0, ...
+        self.assertAlmostEqual(costs["iae"][0], 0.1 * (0.75 + 0.35 + 0.15 + 0.05))
+        self.assertAlmostEqual(costs["overshoot"][0], 0.2)
+        self.assertAlmostEqual(costs["settling_time"][0], 0.4)
+        self.assertAlmostEqual(costs["peak_control"][0], 0.8)
+
+    def test_diverged_runs_cost_infinity(self) -> None:
+        time = np.linspace(0.0, 1.0, 3)
+        position = np.array([[0.0, np.nan, 1.0], [0.0, 0.5, 1.0]])
+        costs = step_response_costs(time, position, np.zeros_like(position), 1.0, None)
+        self.assertTrue(np.isinf(costs["iae"][0]))
+        self.assertTrue(np.isfinite(costs["iae"][1]))
+
+
+class AutotuneTests(unittest.TestCase):
+    def test_beats_default_gains_within_bounds_and_limits(self) -> None:
+        bounds = {"kp": (1.0, 150.0), "ki": (0.0, 30.0), "kd": (0.0, 15.0)}
+        result = autotune(
+            duration=2.0, output_limit=60.0, bounds=bounds, generations=20, seed=3
+        )
+        default = simulate_pid(duration=2.0)
+        baseline = step_response_costs(
+            default["time"], default["position"][None], default["control"][None], 0.15, 60.0
+        )
+        baseline_cost = sum(
+            baseline[name][0] for name in ("iae", "overshoot", "settling_time")
+        )
+        self.assertLess(result.cost, baseline_cost)
+        for name, (low, high) in bounds.items():
+            self.assertGreaterEqual(result.gains[name], low)
+            self.assertLessEqual(result.gains[name], high)
+
+        # Effort is normalized by the limit the candidates were simulated with.
+        self.assertLessEqual(result.terms["peak_control"], 1.0 + 1e-12)
+        self.assertEqual(result.evaluations, 24 * (result.generations + 1))
+        self.assertEqual(result.history, sorted(result.history, reverse=True))
+
+    def test_seeded_runs_repeat_and_report_progress(self) -> None:
+        seen = []
+        first = autotune(generations=5, seed=11, callback=lambda gen, best: seen.append(gen))
+        second = autotune(generations=5, seed=11)
+        self.assertEqual(first.gains, second.gains)
+        self.assertEqual(seen, list(range(first.generations + 1)))
+
+    def test_fixed_gain_and_validation(self) -> None:
+        result = autotune(bounds={"ki": (0.0, 0.0)}, generations=3, seed=0)
+        self.assertEqual(result.ki, 0.0)
+        with self.assertRaises(ValueError):
+            autotune(weights={"ise": 1.0})
+        with self.assertRaises(ValueError):
+            autotune(bounds={"kp": (5.0, 1.0)})
+        with self.assertRaises(ValueError):
+            autotune(population=3)
+
+
+if __name__ == "__main__":
+    unittest.main()